@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+from collections.abc import Iterator, Sequence
+
+from core.doc_features import DocFeatureIndex
+from core.models import RetrievedDoc
+from core.verification import TOKEN_PATTERN, _query_tokens
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed document list, with title terms weighted up.
+
+    A document's term frequency is its count over title, snippet and content
+    plus ``title_weight - 1`` times its count in the title. Each posting holds
+    the term's full score contribution, so a query only sums the postings of
+    its own terms and selects the top ``k`` with a heap.
+    """
+
+    def __init__(
+        self,
+        docs: Sequence[RetrievedDoc],
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: float = 2.0,
+        features: DocFeatureIndex | None = None,
+    ):
+        self.docs = list(docs)
+        self.features = features
+        weighted: list[Counter[str]] = []
+        for doc in self.docs:
+            if features is not None:
+                freqs = Counter(features.get(doc).term_freqs)
+            else:
+                text = f"{doc.title} {doc.snippet} {doc.content}"
+                freqs = Counter(tok.lower() for tok in TOKEN_PATTERN.findall(text))
+            if title_weight != 1.0:
+                for token, count in Counter(
+                    tok.lower() for tok in TOKEN_PATTERN.findall(doc.title or "")
+                ).items():
+                    freqs[token] += (title_weight - 1.0) * count
+            weighted.append(freqs)
+
+        total = len(self.docs)
+        lengths = [sum(freqs.values()) for freqs in weighted]
+        avg_length = (sum(lengths) / total) if total else 0.0
+        doc_freq: Counter[str] = Counter()
+        for freqs in weighted:
+            doc_freq.update(freqs.keys())
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for pos, freqs in enumerate(weighted):
+            norm = k1 * (1.0 - b + b * (lengths[pos] / avg_length if avg_length else 0.0))
+            for token, tf in freqs.items():
+                df = doc_freq[token]
+                idf = math.log(1.0 + (total - df + 0.5) / (df + 0.5))
+                self._postings.setdefault(token, []).append(
+                    (pos, idf * tf * (k1 + 1.0) / (tf + norm))
+                )
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def covers(self, docs: Sequence[RetrievedDoc]) -> bool:
+        """True when ``docs`` is the list this index was built over."""
+        return len(docs) == len(self.docs) and all(
+            left is right or left.url == right.url for left, right in zip(docs, self.docs, strict=True)
+        )
+
+    def _query_tokens(self, query: str, facets: list[str]) -> frozenset[str]:
+        if self.features is not None:
+            return self.features.query_tokens(query, facets)
+        return frozenset(_query_tokens(query, facets))
+
+    def scores(self, query: str, facets: list[str]) -> dict[int, float]:
+        totals: dict[int, float] = {}
+        for token in self._query_tokens(query, facets):
+            for pos, weight in self._postings.get(token, ()):
+                totals[pos] = totals.get(pos, 0.0) + weight
+        return totals
+
+    def top_k(self, query: str, facets: list[str], k: int) -> list[tuple[int, float]]:
+        """``(position, score)`` of the best ``k`` matching docs; ties keep provider score order."""
+        totals = self.scores(query, facets)
+        return heapq.nlargest(
+            max(0, k),
+            totals.items(),
+            key=lambda item: (item[1], float(self.docs[item[0]].score or 0.0), -item[0]),
+        )
+
+    def ranked(self, query: str, facets: list[str], *, k: int) -> Iterator[RetrievedDoc]:
+        """Docs best-first: the top ``k`` matches, then (only if consumed) every other doc.
+
+        Matches beyond ``k`` follow by BM25 score and non-matching docs by
+        provider score, so a caller that stops early never pays for a full sort.
+        """
+        hits = self.top_k(query, facets, k)
+        for pos, _ in hits:
+            yield self.docs[pos]
+        seen = {pos for pos, _ in hits}
+        rest = self.top_k(query, facets, len(self.docs))
+        for pos, _ in rest:
+            if pos not in seen:
+                seen.add(pos)
+                yield self.docs[pos]
+        unmatched = [pos for pos in range(len(self.docs)) if pos not in seen]
+        unmatched.sort(key=lambda pos: -float(self.docs[pos].score or 0.0))
+        for pos in unmatched:
+            yield self.docs[pos]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Iterable
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse
 
 from core.models import Citation
@@ -14,6 +15,7 @@ def extract_claim_ids(report: str) -> list[str]:
     return sorted(set(CLAIM_PATTERN.findall(report or "")))
 
 
+@lru_cache(maxsize=16384)
 def normalize_url(url: str) -> str:
     raw = (url or "").strip()
     if not raw:
@@ -31,6 +33,7 @@ def normalize_url(url: str) -> str:
     return value
 
 
+@lru_cache(maxsize=16384)
 def normalized_domain(url: str) -> str:
     normalized = normalize_url(url)
     if not normalized:
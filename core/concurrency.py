@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+
+@dataclass(slots=True)
+class FanOutResult:
+    index: int
+    item: Any
+    value: Any = None
+    latency_ms: float = 0.0
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _timed_call(fn: Callable[[Any], Any], index: int, item: Any) -> FanOutResult:
+    started = perf_counter()
+    try:
+        value = fn(item)
+    except Exception as exc:  # noqa: BLE001
+        return FanOutResult(
+            index=index,
+            item=item,
+            latency_ms=(perf_counter() - started) * 1000.0,
+            error=exc,
+        )
+    return FanOutResult(
+        index=index,
+        item=item,
+        value=value,
+        latency_ms=(perf_counter() - started) * 1000.0,
+    )
+
+
+def bounded_fan_out(
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+    *,
+    max_workers: int,
+) -> list[FanOutResult]:
+    """Run ``fn`` over ``items`` with at most ``max_workers`` in flight.
+
+    Results are always returned in input order so callers can merge them
+    deterministically regardless of completion order.
+    """
+    if not items:
+        return []
+    workers = max(1, min(int(max_workers), len(items)))
+    if workers == 1:
+        return [_timed_call(fn, idx, item) for idx, item in enumerate(items)]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fan-out") as pool:
+        futures = [pool.submit(_timed_call, fn, idx, item) for idx, item in enumerate(items)]
+        return [future.result() for future in futures]
+
+
+def run_with_deadline(
+    calls: dict[str, Callable[[], Any]],
+    *,
+    deadline_seconds: float,
+) -> dict[str, FanOutResult]:
+    """Start every call at once and collect whatever finished before the deadline.
+
+    Calls still running at the deadline are reported with a ``TimeoutError``;
+    their worker threads are abandoned rather than joined so a stuck call
+    cannot hold up the caller.
+    """
+    if not calls:
+        return {}
+    names = list(calls)
+    pool = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="deadline")
+    started = perf_counter()
+    futures = {
+        name: pool.submit(_timed_call, lambda _, fn=calls[name]: fn(), idx, name)
+        for idx, name in enumerate(names)
+    }
+    timeout = deadline_seconds if deadline_seconds > 0 else None
+    done, _ = wait(futures.values(), timeout=timeout)
+    pool.shutdown(wait=False, cancel_futures=True)
+    results: dict[str, FanOutResult] = {}
+    for idx, name in enumerate(names):
+        future = futures[name]
+        if future in done:
+            results[name] = future.result()
+            continue
+        results[name] = FanOutResult(
+            index=idx,
+            item=name,
+            latency_ms=(perf_counter() - started) * 1000.0,
+            error=TimeoutError(f"{name} exceeded {deadline_seconds:.1f}s deadline"),
+        )
+    return results
+
+
+def raise_first_error(results: Sequence[FanOutResult]) -> None:
+    for result in results:
+        if result.error is not None:
+            raise result.error
@@ -89,6 +89,12 @@ def load_config(overrides: dict[str, Any] | None = None) -> RunConfig:
         "subreport_min_claims": _env_int("SUBREPORT_MIN_CLAIMS", 3),
         "subreport_gapfill_enabled": _env_bool("SUBREPORT_GAPFILL_ENABLED", True),
         "subreport_gapfill_max_queries": _env_int("SUBREPORT_GAPFILL_MAX_QUERIES", 2),
+        "federated_provider_k_ratio": _env_float("FEDERATED_PROVIDER_K_RATIO", 0.75),
+        "federated_rrf_constant": _env_int("FEDERATED_RRF_CONSTANT", 60),
+        "subtopic_slice_ranker": os.getenv("SUBTOPIC_SLICE_RANKER", "bm25"),
+        "bm25_title_weight": _env_float("BM25_TITLE_WEIGHT", 2.0),
+        "near_dup_enabled": _env_bool("NEAR_DUP_ENABLED", True),
+        "near_dup_threshold": _env_float("NEAR_DUP_THRESHOLD", 0.8),
         "subreport_failure_policy": os.getenv("SUBREPORT_FAILURE_POLICY", "continue_constrained"),
         "research_mode": os.getenv("RESEARCH_MODE", "peak"),
         "fact_mode": os.getenv("FACT_MODE", "strict"),
@@ -172,8 +178,44 @@ def load_config(overrides: dict[str, Any] | None = None) -> RunConfig:
         "ddg_rpm": _env_int("DDG_RPM", 20),
         "firecrawl_rpm": _env_int("FIRECRAWL_RPM", 3),
         "judge_rpm": _env_int("JUDGE_RPM", 15),
+        "rate_limit_backend": os.getenv("RATE_LIMIT_BACKEND", "memory"),
+        "rate_limit_key_prefix": os.getenv("RATE_LIMIT_KEY_PREFIX", "cloudhive:ratelimit"),
+        "adaptive_concurrency_enabled": _env_bool("ADAPTIVE_CONCURRENCY_ENABLED", True),
+        "adaptive_concurrency_initial": _env_int("ADAPTIVE_CONCURRENCY_INITIAL", 4),
+        "adaptive_concurrency_max": _env_int("ADAPTIVE_CONCURRENCY_MAX", 16),
+        "retry_budget_ratio": _env_float("RETRY_BUDGET_RATIO", 0.2),
+        "retry_budget_min_retries": _env_int("RETRY_BUDGET_MIN_RETRIES", 10),
+        "retry_after_max_seconds": _env_float("RETRY_AFTER_MAX_SECONDS", 30.0),
+        "tavily_cost_per_call": _env_float("TAVILY_COST_PER_CALL", 0.016),
+        "firecrawl_cost_per_call": _env_float("FIRECRAWL_COST_PER_CALL", 0.002),
+        "research_cost_budget": _env_float("RESEARCH_COST_BUDGET", 0.0),
+        "provider_max_error_rate": _env_float("PROVIDER_MAX_ERROR_RATE", 0.5),
+        "domain_lists_dir": os.getenv("DOMAIN_LISTS_DIR", ""),
+        "research_query_concurrency": _env_int("RESEARCH_QUERY_CONCURRENCY", 4),
+        "research_lane_deadline_seconds": _env_float("RESEARCH_LANE_DEADLINE_SECONDS", 90.0),
+        "retrieval_early_stop_enabled": _env_bool("RETRIEVAL_EARLY_STOP_ENABLED", True),
+        "retrieval_early_stop_min_domains": _env_int("RETRIEVAL_EARLY_STOP_MIN_DOMAINS", 3),
+        "query_dedup_threshold": _env_float("QUERY_DEDUP_THRESHOLD", 0.6),
+        "search_cache_bypass": _env_bool("SEARCH_CACHE_BYPASS", False),
+        "search_cache_ttl_seconds_tavily": _env_int("SEARCH_CACHE_TTL_SECONDS_TAVILY", 21600),
+        "search_cache_ttl_seconds_ddg": _env_int("SEARCH_CACHE_TTL_SECONDS_DDG", 3600),
+        "search_cache_max_entries": _env_int("SEARCH_CACHE_MAX_ENTRIES", 5000),
+        "http_pool_max_connections": _env_int("HTTP_POOL_MAX_CONNECTIONS", 20),
+        "http_pool_max_keepalive": _env_int("HTTP_POOL_MAX_KEEPALIVE", 10),
+        "http_keepalive_expiry_seconds": _env_float("HTTP_KEEPALIVE_EXPIRY_SECONDS", 30.0),
+        "http2_enabled": _env_bool("HTTP2_ENABLED", True),
+        "singleflight_enabled": _env_bool("SINGLEFLIGHT_ENABLED", True),
+        "firecrawl_enrich_top_n": _env_int("FIRECRAWL_ENRICH_TOP_N", 3),
+        "firecrawl_per_domain_concurrency": _env_int("FIRECRAWL_PER_DOMAIN_CONCURRENCY", 1),
+        "firecrawl_total_byte_budget": _env_int("FIRECRAWL_TOTAL_BYTE_BUDGET", 400000),
+        "firecrawl_cache_ttl_seconds": _env_int("FIRECRAWL_CACHE_TTL_SECONDS", 86400),
         "per_doc_tokens": _env_int("PER_DOC_TOKENS", 500),
         "total_context_tokens": _env_int("TOTAL_CONTEXT_TOKENS", 1800),
+        "doc_content_max_chars": _env_int("DOC_CONTENT_MAX_CHARS", 8000),
+        "prune_extract_min_chars": _env_int("PRUNE_EXTRACT_MIN_CHARS", 1000),
+        "prune_extract_cache_enabled": _env_bool("PRUNE_EXTRACT_CACHE_ENABLED", True),
+        "prune_extract_cache_max_entries": _env_int("PRUNE_EXTRACT_CACHE_MAX_ENTRIES", 5000),
+        "prune_extract_workers": _env_int("PRUNE_EXTRACT_WORKERS", 0),
         "output_dir": os.getenv("OUTPUT_DIR", "outputs"),
         "logs_dir": os.getenv("LOGS_DIR", "logs"),
         "data_dir": os.getenv("DATA_DIR", "data"),
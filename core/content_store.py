@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from hashlib import blake2b
+
+from core.models import RetrievedDoc
+
+
+def content_key(text: str) -> str:
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class ContentStore:
+    """Full page text for one run, kept out of graph state.
+
+    Docs entering state carry only an evidence window of their content plus
+    ``meta["content_key"]``; stages that need the whole page (main-text
+    extraction) load it from here. Identical pages are stored once.
+    """
+
+    def __init__(self) -> None:
+        self._texts: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def put(self, text: str) -> str:
+        key = content_key(text)
+        with self._lock:
+            self._texts.setdefault(key, text)
+        return key
+
+    def get(self, key: str) -> str | None:
+        return self._texts.get(key)
+
+    def total_chars(self) -> int:
+        return sum(len(text) for text in self._texts.values())
+
+
+def cap_doc_content(
+    docs: Iterable[RetrievedDoc],
+    store: ContentStore,
+    max_chars: int,
+) -> list[RetrievedDoc]:
+    """Truncate each doc's content to ``max_chars``, moving longer text into ``store``.
+
+    ``max_chars <= 0`` leaves docs untouched.
+    """
+    capped: list[RetrievedDoc] = []
+    for doc in docs:
+        content = doc.content or ""
+        if max_chars <= 0 or len(content) <= max_chars:
+            capped.append(doc)
+            continue
+        capped.append(
+            doc.model_copy(
+                update={
+                    "content": content[:max_chars],
+                    "meta": {
+                        **(doc.meta or {}),
+                        "content_key": store.put(content),
+                        "content_chars": len(content),
+                    },
+                }
+            )
+        )
+    return capped
+
+
+def full_content(doc: RetrievedDoc, store: ContentStore | None) -> str:
+    """The doc's untruncated content when it was capped into ``store``."""
+    key = (doc.meta or {}).get("content_key")
+    if key and store is not None:
+        text = store.get(str(key))
+        if text is not None:
+            return text
+    return doc.content or ""
+
+
+def content_length(doc: RetrievedDoc) -> int:
+    """Length of the doc's full content, whether or not it was capped."""
+    try:
+        return int((doc.meta or {}).get("content_chars") or len(doc.content or ""))
+    except (TypeError, ValueError):
+        return len(doc.content or "")
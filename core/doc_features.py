@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from datetime import datetime
+from hashlib import blake2b
+
+from core.domain_index import DomainClassifier
+from core.models import RetrievedDoc
+from core.source_quality import _doc_body_blob, source_tier
+from core.verification import (
+    TOKEN_PATTERN,
+    _doc_text,
+    _query_tokens,
+    _tokenize,
+    detect_open_status,
+    extract_document_date,
+)
+
+_UNSET = object()
+_DATE_META_KEYS = ("published_at", "updated_at", "date")
+
+
+class DocFeatures:
+    """Text features of one document, each derived on first use and then kept."""
+
+    __slots__ = (
+        "doc",
+        "_text",
+        "_tokens",
+        "_term_freqs",
+        "_header_tokens",
+        "_full_text",
+        "_full_tokens",
+        "_blob",
+        "_published",
+        "_open_status",
+    )
+
+    def __init__(self, doc: RetrievedDoc):
+        self.doc = doc
+        self._text: str | None = None
+        self._tokens: frozenset[str] | None = None
+        self._term_freqs: Counter[str] | None = None
+        self._header_tokens: frozenset[str] | None = None
+        self._full_text: str | None = None
+        self._full_tokens: frozenset[str] | None = None
+        self._blob: str | None = None
+        self._published: object = _UNSET
+        self._open_status: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Cleaned, lowercased title + snippet + content used for relevance scoring."""
+        if self._text is None:
+            self._text = _doc_text(self.doc)
+        return self._text
+
+    @property
+    def tokens(self) -> frozenset[str]:
+        if self._tokens is None:
+            self._tokens = frozenset(_tokenize(self.text))
+        return self._tokens
+
+    @property
+    def term_freqs(self) -> Counter[str]:
+        """Token counts over the full title, snippet and content."""
+        if self._term_freqs is None:
+            text = f"{self.doc.title} {self.doc.snippet} {self.doc.content}"
+            self._term_freqs = Counter(tok.lower() for tok in TOKEN_PATTERN.findall(text))
+        return self._term_freqs
+
+    @property
+    def header_tokens(self) -> frozenset[str]:
+        """Title + snippet tokens, as used for corroboration overlap."""
+        if self._header_tokens is None:
+            self._header_tokens = frozenset(_tokenize(f"{self.doc.title} {self.doc.snippet}"))
+        return self._header_tokens
+
+    @property
+    def full_text(self) -> str:
+        if self._full_text is None:
+            doc = self.doc
+            self._full_text = f"{doc.title} {doc.snippet} {doc.content}".lower()
+        return self._full_text
+
+    @property
+    def full_tokens(self) -> frozenset[str]:
+        if self._full_tokens is None:
+            self._full_tokens = frozenset(_tokenize(self.full_text))
+        return self._full_tokens
+
+    @property
+    def blob(self) -> str:
+        """Query-intent match text, without the URL (callers append the doc's own)."""
+        if self._blob is None:
+            self._blob = _doc_body_blob(self.doc)
+        return self._blob
+
+    @property
+    def published(self) -> datetime | None | object:
+        """``extract_document_date`` result, including ``UNKNOWN_DATE``."""
+        if self._published is _UNSET:
+            self._published = extract_document_date(self.doc)
+        return self._published
+
+    @property
+    def open_status(self) -> str:
+        if self._open_status is None:
+            self._open_status = detect_open_status(self.text)
+        return self._open_status
+
+
+def _feature_key(doc: RetrievedDoc) -> bytes:
+    meta = doc.meta or {}
+    fields = (
+        doc.title or "",
+        doc.snippet or "",
+        doc.content or "",
+        *(str(meta.get(key) or "") for key in _DATE_META_KEYS),
+    )
+    return blake2b("\x1f".join(fields).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class DocFeatureIndex:
+    """Run-scoped cache of per-document text features shared by filters and verifiers.
+
+    Entries are keyed by a digest of the fields the features are derived
+    from, so the ``model_copy`` variants that graph stages pass around
+    (canonical URL, extra meta) reuse one entry. Query token sets are cached
+    the same way. The graph keeps one index per run in ``RunArtifacts``.
+    """
+
+    def __init__(self, *, classifier: DomainClassifier | None = None):
+        self.classifier = classifier
+        self._docs: dict[bytes, DocFeatures] = {}
+        self._queries: dict[tuple[str, tuple[str, ...]], frozenset[str]] = {}
+        self._tiers: dict[tuple[str, str, str], str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def get(self, doc: RetrievedDoc) -> DocFeatures:
+        key = _feature_key(doc)
+        features = self._docs.get(key)
+        if features is not None:
+            self.hits += 1
+            return features
+        with self._lock:
+            features = self._docs.setdefault(key, DocFeatures(doc))
+        self.misses += 1
+        return features
+
+    def query_tokens(self, query: str, facets: list[str]) -> frozenset[str]:
+        key = (query, tuple(facets))
+        tokens = self._queries.get(key)
+        if tokens is None:
+            tokens = frozenset(_query_tokens(query, facets))
+            self._queries[key] = tokens
+        return tokens
+
+    def tier(self, doc: RetrievedDoc) -> str:
+        key = (doc.url, doc.provider, doc.title)
+        tier = self._tiers.get(key)
+        if tier is None:
+            tier = source_tier(doc.url, doc.provider, doc.title, classifier=self.classifier)
+            self._tiers[key] = tier
+        return tier
+
+    def stats(self) -> dict[str, int]:
+        return {"docs": len(self._docs), "hits": self.hits, "misses": self.misses}
+
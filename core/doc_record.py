@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from core.citations import normalize_url
+from core.domain_index import DomainClassifier
+from core.models import RetrievedDoc
+from core.source_quality import doc_quality
+from core.verification import TOKEN_PATTERN, UNKNOWN_DATE, extract_document_date
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class DocRecord:
+    """Internal view of a ``RetrievedDoc`` with its derived fields computed once.
+
+    Nodes work on records between boundaries and call ``to_doc()`` only when
+    handing docs back to graph state or MCP callers. ``tokens`` and
+    ``published`` are filled on first access.
+    """
+
+    doc: RetrievedDoc
+    url: str
+    domain: str
+    publisher: str
+    tier: str
+    evidence: str
+    confidence: str
+    low_trust: bool
+    _tokens: frozenset[str] | None = field(default=None, repr=False)
+    _published: object = field(default=_UNSET, repr=False)
+
+    @classmethod
+    def from_doc(
+        cls,
+        doc: RetrievedDoc,
+        *,
+        max_evidence_chars: int = 180,
+        classifier: DomainClassifier | None = None,
+    ) -> DocRecord:
+        tier, evidence, confidence, publisher, low_trust = doc_quality(
+            doc.url,
+            doc.provider,
+            doc.title,
+            doc.snippet or doc.content,
+            max_evidence_chars,
+            classifier,
+        )
+        url = normalize_url(doc.url)
+        return cls(
+            doc=doc,
+            url=url,
+            domain=publisher if url and publisher != "unknown" else "",
+            publisher=publisher,
+            tier=tier,
+            evidence=evidence,
+            confidence=confidence,
+            low_trust=low_trust,
+        )
+
+    @property
+    def text(self) -> str:
+        return f"{self.doc.snippet} {self.doc.content}".strip()
+
+    @property
+    def tokens(self) -> frozenset[str]:
+        """Lowercased title + snippet tokens, as used for corroboration overlap."""
+        if self._tokens is None:
+            self._tokens = frozenset(
+                tok.lower() for tok in TOKEN_PATTERN.findall(f"{self.doc.title} {self.doc.snippet}")
+            )
+        return self._tokens
+
+    @property
+    def published(self) -> datetime | None:
+        if self._published is _UNSET:
+            found = extract_document_date(self.doc)
+            self._published = None if found is UNKNOWN_DATE else found
+        return self._published  # type: ignore[return-value]
+
+    def to_doc(self, *, canonical_url: bool = False) -> RetrievedDoc:
+        """Annotated ``RetrievedDoc``; the original object when nothing changes."""
+        doc = self.doc
+        meta = doc.meta or {}
+        url = self.url if canonical_url and self.url else doc.url
+        if (
+            doc.url == url
+            and doc.snippet == self.evidence
+            and meta.get("source_tier") == self.tier
+            and meta.get("confidence") == self.confidence
+            and meta.get("publisher") == self.publisher
+        ):
+            return doc
+        return doc.model_copy(
+            update={
+                "url": url,
+                "snippet": self.evidence,
+                "meta": {
+                    **meta,
+                    "source_tier": self.tier,
+                    "confidence": self.confidence,
+                    "publisher": self.publisher,
+                },
+            }
+        )
+
+
+def doc_records(
+    docs: Iterable[RetrievedDoc],
+    *,
+    classifier: DomainClassifier | None = None,
+) -> list[DocRecord]:
+    return [DocRecord.from_doc(doc, classifier=classifier) for doc in docs]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from hashlib import blake2b
+
+from core.models import RetrievedDoc
+
+
+def doc_id(doc: RetrievedDoc) -> str:
+    raw = f"{doc.provider}\x1f{doc.url}\x1f{doc.title}\x1f{doc.snippet}\x1f{doc.content}"
+    return blake2b(raw.encode("utf-8", "surrogatepass"), digest_size=12).hexdigest()
+
+
+class DocStore:
+    """Documents of one run, addressed by ``doc_id``.
+
+    Graph state and ``Send`` payloads carry the IDs only; every branch
+    resolves them against the same stored objects, so fan-out costs one list
+    of short strings per branch instead of a copy of the corpus.
+    """
+
+    def __init__(self) -> None:
+        self._docs: dict[str, RetrievedDoc] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def put_many(self, docs: Iterable[RetrievedDoc]) -> list[str]:
+        ids: list[str] = []
+        with self._lock:
+            for doc in docs:
+                key = doc_id(doc)
+                self._docs.setdefault(key, doc)
+                ids.append(key)
+        return ids
+
+    def get_many(self, ids: Iterable[str]) -> list[RetrievedDoc]:
+        """Stored docs in ``ids`` order; unknown IDs are skipped."""
+        return [doc for key in ids if (doc := self._docs.get(key)) is not None]
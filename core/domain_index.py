@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from core.models import RunConfig
+
+DEFAULT_LISTS_DIR = Path(__file__).with_name("domain_lists")
+
+# Lower rank wins when several listed suffixes match one host.
+_RANKS = {"deny": 0, "allow": 1, "tier_a": 2, "tier_b": 3, "low_trust": 4}
+_LIST_TIERS = {"tier_a": "A", "tier_b": "B", "low_trust": "C", "deny": "C"}
+_TERMINAL = ""  # never a hostname label
+_MAX_CACHED_HOSTS = 65536
+_RULE_SET_IDS = itertools.count(1)
+
+
+@dataclass(frozen=True, slots=True)
+class HostClass:
+    tier: str | None
+    low_trust: bool
+    tenant_override: bool = False
+
+
+UNLISTED = HostClass(tier=None, low_trust=False)
+
+
+class DomainSuffixTrie:
+    """Suffix matcher over reversed hostname labels.
+
+    ``news.example.org`` walks ``org -> example -> news``, so a lookup costs
+    one dict hop per label no matter how many domains are listed.
+    """
+
+    __slots__ = ("_root", "size")
+
+    def __init__(self) -> None:
+        self._root: dict[str, dict] = {}
+        self.size = 0
+
+    def add(self, domain: str, value: tuple[int, str, str]) -> None:
+        labels = [label for label in domain.strip().strip(".").lower().split(".") if label]
+        if not labels:
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        values = node.setdefault(_TERMINAL, [])  # type: ignore[arg-type]
+        if value not in values:
+            values.append(value)  # type: ignore[attr-defined]
+            self.size += 1
+
+    def matches(self, host: str) -> list[tuple[int, str, str]]:
+        """Every listed suffix of ``host``, shortest first."""
+        found: list[tuple[int, str, str]] = []
+        node = self._root
+        for label in reversed(host.split(".")):
+            child = node.get(label)
+            if child is None:
+                break
+            node = child
+            found.extend(node.get(_TERMINAL, ()))  # type: ignore[arg-type]
+        return found
+
+
+def load_domain_list(path: str | Path) -> list[tuple[str, str]]:
+    """Parse ``domain [tier]`` lines; blank lines and ``#`` comments are skipped."""
+    entries: list[tuple[str, str]] = []
+    target = Path(path)
+    if not target.is_file():
+        return entries
+    for raw in target.read_text(encoding="utf-8").splitlines():
+        line = raw.split("#", 1)[0].strip().lower()
+        if not line:
+            continue
+        parts = line.split()
+        tier = parts[1].upper() if len(parts) > 1 and parts[1].upper() in {"A", "B", "C"} else ""
+        entries.append((parts[0].removeprefix("www."), tier))
+    return entries
+
+
+class DomainClassifier:
+    """Compiled tier/trust lookup for hostnames, with memoized results.
+
+    Base lists come from ``tier_a.txt``, ``tier_b.txt`` and ``low_trust.txt``.
+    An optional tenant ``allow.txt`` (``domain [A|B]``, default B) and
+    ``deny.txt`` take precedence over them and over the .gov/.edu rules.
+    """
+
+    def __init__(self) -> None:
+        self.trie = DomainSuffixTrie()
+        self._cache: dict[str, HostClass] = {}
+        # Names the current rule set (base plus tenant lists) in shared caches.
+        self.rules_key = next(_RULE_SET_IDS)
+
+    def add(self, domain: str, category: str, tier: str = "") -> None:
+        if category not in _RANKS:
+            raise ValueError(f"Unknown domain list category: {category}")
+        resolved = tier or ("B" if category == "allow" else _LIST_TIERS[category])
+        self.trie.add(domain, (_RANKS[category], category, resolved))
+        self._cache.clear()
+        self.rules_key = next(_RULE_SET_IDS)
+
+    @classmethod
+    def from_files(
+        cls,
+        lists_dir: str | Path = DEFAULT_LISTS_DIR,
+        *,
+        tenant_dir: str | Path | None = None,
+    ) -> DomainClassifier:
+        classifier = cls()
+        base = Path(lists_dir)
+        for category in ("tier_a", "tier_b", "low_trust"):
+            for domain, _ in load_domain_list(base / f"{category}.txt"):
+                classifier.add(domain, category)
+        if tenant_dir is not None:
+            for category in ("allow", "deny"):
+                for domain, tier in load_domain_list(Path(tenant_dir) / f"{category}.txt"):
+                    classifier.add(domain, category, tier if category == "allow" else "")
+        return classifier
+
+    def classify(self, host: str) -> HostClass:
+        cached = self._cache.get(host)
+        if cached is not None:
+            return cached
+        matches = self.trie.matches(host)
+        if not matches:
+            result = UNLISTED
+        else:
+            categories = {category for _, category, _ in matches}
+            best = min(matches)
+            result = HostClass(
+                tier=best[2],
+                low_trust="deny" in categories
+                or ("low_trust" in categories and "allow" not in categories),
+                tenant_override=best[1] in {"allow", "deny"},
+            )
+        if len(self._cache) >= _MAX_CACHED_HOSTS:
+            self._cache.clear()
+        self._cache[host] = result
+        return result
+
+
+@lru_cache(maxsize=1)
+def default_domain_classifier() -> DomainClassifier:
+    return DomainClassifier.from_files()
+
+
+@lru_cache(maxsize=64)
+def _cached_classifier(
+    lists_dir: str,
+    tenant_dir: str | None,
+    stamp: tuple[float, ...],
+) -> DomainClassifier:
+    del stamp  # part of the cache key so edited list files are picked up
+    return DomainClassifier.from_files(lists_dir, tenant_dir=tenant_dir)
+
+
+def _mtimes(paths: Iterable[Path]) -> tuple[float, ...]:
+    return tuple(path.stat().st_mtime if path.is_file() else 0.0 for path in paths)
+
+
+def domain_classifier_for(config: RunConfig) -> DomainClassifier:
+    """Classifier for ``config``: base lists plus the tenant's allow/deny lists, if any.
+
+    Tenant lists live in ``<data_dir>/domain_lists/<tenant_id>/``.
+    """
+    lists_dir = Path(config.domain_lists_dir) if config.domain_lists_dir else DEFAULT_LISTS_DIR
+    tenant_dir = Path(config.data_dir) / "domain_lists" / config.tenant_id
+    tenant_files = [tenant_dir / "allow.txt", tenant_dir / "deny.txt"]
+    has_tenant_lists = any(path.is_file() for path in tenant_files)
+    if lists_dir == DEFAULT_LISTS_DIR and not has_tenant_lists:
+        return default_domain_classifier()
+    base_files = [lists_dir / f"{name}.txt" for name in ("tier_a", "tier_b", "low_trust")]
+    return _cached_classifier(
+        str(lists_dir),
+        str(tenant_dir) if has_tenant_lists else None,
+        _mtimes([*base_files, *tenant_files]),
+    )
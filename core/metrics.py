@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import threading
 
-from prometheus_client import Counter, Histogram, start_http_server
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
 
 _METRICS_LOCK = threading.Lock()
 _METRICS_SERVER_STARTED = False
@@ -22,6 +22,51 @@ TRANSPORT_FALLBACK_TOTAL = Counter(
     "Total number of transport fallbacks by reason.",
     ["reason"],
 )
+SEARCH_CACHE_TOTAL = Counter(
+    "search_cache_total",
+    "Search result cache lookups by provider and result.",
+    ["provider", "result"],
+)
+SINGLEFLIGHT_COALESCED_TOTAL = Counter(
+    "singleflight_coalesced_total",
+    "Calls served by joining an identical in-flight request.",
+    ["scope", "tool"],
+)
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "rate_limit_wait_seconds",
+    "Time spent waiting on a provider rate limiter before a call.",
+    ["limiter", "mode"],
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+RETRY_TOTAL = Counter(
+    "retry_total",
+    "Retry decisions after a retryable provider error.",
+    ["name", "outcome"],
+)
+ADAPTIVE_CONCURRENCY_LIMIT = Gauge(
+    "adaptive_concurrency_limit",
+    "Current AIMD in-flight limit per provider.",
+    ["name"],
+)
+CIRCUIT_BREAKER_TRANSITIONS_TOTAL = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes by breaker.",
+    ["breaker", "from_state", "to_state"],
+)
+NEAR_DUPLICATES_COLLAPSED_TOTAL = Counter(
+    "near_duplicates_collapsed_total",
+    "Near-duplicate documents collapsed while building the shared corpus.",
+)
+CONTEXT_PRUNE_SECONDS = Histogram(
+    "context_prune_seconds",
+    "Time spent extracting and budgeting synthesizer context docs.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EXTRACTION_CACHE_TOTAL = Counter(
+    "extraction_cache_total",
+    "Main-text extraction cache lookups while pruning context, by result.",
+    ["result"],
+)
 GRAPH_RUN_TOTAL = Counter(
     "graph_run_total",
     "Total graph runs by status.",
@@ -67,6 +112,49 @@ def record_transport_fallback(reason: str) -> None:
     TRANSPORT_FALLBACK_TOTAL.labels(reason=reason or "unknown").inc()
 
 
+def record_search_cache(provider: str, result: str) -> None:
+    SEARCH_CACHE_TOTAL.labels(provider=provider or "unknown", result=result).inc()
+
+
+def record_context_prune(seconds: float, cache_hits: int, extracted: int) -> None:
+    CONTEXT_PRUNE_SECONDS.observe(max(0.0, seconds))
+    if cache_hits:
+        EXTRACTION_CACHE_TOTAL.labels(result="hit").inc(cache_hits)
+    if extracted:
+        EXTRACTION_CACHE_TOTAL.labels(result="miss").inc(extracted)
+
+
+def record_singleflight_coalesced(scope: str, tool: str) -> None:
+    SINGLEFLIGHT_COALESCED_TOTAL.labels(scope=scope, tool=tool or "unknown").inc()
+
+
+def record_rate_limit_wait(limiter: str, mode: str, seconds: float) -> None:
+    RATE_LIMIT_WAIT_SECONDS.labels(limiter=limiter or "default", mode=mode).observe(
+        max(0.0, seconds)
+    )
+
+
+def record_retry(name: str, outcome: str) -> None:
+    RETRY_TOTAL.labels(name=name or "default", outcome=outcome).inc()
+
+
+def record_concurrency_limit(name: str, limit: float) -> None:
+    ADAPTIVE_CONCURRENCY_LIMIT.labels(name=name or "default").set(limit)
+
+
+def record_circuit_transition(breaker: str, from_state: str, to_state: str) -> None:
+    CIRCUIT_BREAKER_TRANSITIONS_TOTAL.labels(
+        breaker=breaker or "default",
+        from_state=from_state,
+        to_state=to_state,
+    ).inc()
+
+
+def record_near_duplicates(count: int) -> None:
+    if count > 0:
+        NEAR_DUPLICATES_COLLAPSED_TOTAL.inc(count)
+
+
 def record_graph_run(status: str, duration_seconds: float) -> None:
     GRAPH_RUN_TOTAL.labels(status=status).inc()
     GRAPH_RUN_DURATION_SECONDS.observe(max(0.0, duration_seconds))
@@ -121,6 +121,12 @@ class RunConfig(BaseModel):
     subreport_min_claims: int = 3
     subreport_gapfill_enabled: bool = True
     subreport_gapfill_max_queries: int = 2
+    federated_provider_k_ratio: float = 0.75
+    federated_rrf_constant: int = 60
+    subtopic_slice_ranker: Literal["bm25", "overlap"] = "bm25"
+    bm25_title_weight: float = 2.0
+    near_dup_enabled: bool = True
+    near_dup_threshold: float = 0.8
     subreport_failure_policy: Literal["continue_constrained", "retry_once", "fail_closed"] = "continue_constrained"
     research_mode: Literal["fast", "balanced", "peak"] = "peak"
     fact_mode: Literal["strict", "balanced", "open_web"] = "strict"
@@ -201,8 +207,44 @@ class RunConfig(BaseModel):
     ddg_rpm: int = 20
     firecrawl_rpm: int = 3
     judge_rpm: int = 15
+    rate_limit_backend: Literal["memory", "sqlite", "redis"] = "memory"
+    rate_limit_key_prefix: str = "cloudhive:ratelimit"
+    adaptive_concurrency_enabled: bool = True
+    adaptive_concurrency_initial: int = 4
+    adaptive_concurrency_max: int = 16
+    retry_budget_ratio: float = 0.2
+    retry_budget_min_retries: int = 10
+    retry_after_max_seconds: float = 30.0
+    tavily_cost_per_call: float = 0.016
+    firecrawl_cost_per_call: float = 0.002
+    research_cost_budget: float = 0.0
+    provider_max_error_rate: float = 0.5
+    domain_lists_dir: str = ""
+    research_query_concurrency: int = 4
+    research_lane_deadline_seconds: float = 90.0
+    retrieval_early_stop_enabled: bool = True
+    retrieval_early_stop_min_domains: int = 3
+    query_dedup_threshold: float = 0.6
+    search_cache_bypass: bool = False
+    search_cache_ttl_seconds_tavily: int = 21600
+    search_cache_ttl_seconds_ddg: int = 3600
+    search_cache_max_entries: int = 5000
+    http_pool_max_connections: int = 20
+    http_pool_max_keepalive: int = 10
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True
+    singleflight_enabled: bool = True
+    firecrawl_enrich_top_n: int = 3
+    firecrawl_per_domain_concurrency: int = 1
+    firecrawl_total_byte_budget: int = 400000
+    firecrawl_cache_ttl_seconds: int = 86400
     per_doc_tokens: int = 500
     total_context_tokens: int = 1800
+    doc_content_max_chars: int = 8000
+    prune_extract_min_chars: int = 1000
+    prune_extract_cache_enabled: bool = True
+    prune_extract_cache_max_entries: int = 5000
+    prune_extract_workers: int = 0
     output_dir: str = "outputs"
     logs_dir: str = "logs"
     data_dir: str = "data"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import re
+import zlib
+from collections.abc import Sequence
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+_BINS = 64  # signature length; a power of two so the bin is the low hash bits
+_EMPTY = 1 << 32
+
+
+def minhash_signature(
+    text: str,
+    *,
+    shingle_size: int = 3,
+    max_chars: int = 6000,
+) -> tuple[int, ...] | None:
+    """One-permutation MinHash over word shingles of ``text``.
+
+    Every shingle is hashed once; the low bits pick one of 64 bins and the
+    bin keeps its smallest remaining bits. Empty bins borrow the next filled
+    bin (rotation densification), so short texts still compare fairly.
+    Returns None when ``text`` has fewer words than one shingle.
+    """
+    words = _WORD_PATTERN.findall((text or "")[:max_chars].lower())
+    if len(words) < shingle_size:
+        return None
+    mins = [_EMPTY] * _BINS
+    for start in range(len(words) - shingle_size + 1):
+        value = zlib.crc32(" ".join(words[start : start + shingle_size]).encode("utf-8"))
+        slot = value & (_BINS - 1)
+        rest = value >> 6
+        if rest < mins[slot]:
+            mins[slot] = rest
+    for slot in range(_BINS):
+        if mins[slot] == _EMPTY:
+            for step in range(1, _BINS):
+                donor = mins[(slot + step) % _BINS]
+                if donor != _EMPTY:
+                    mins[slot] = donor + step * _EMPTY  # offset keeps borrowed values distinct
+                    break
+    return tuple(mins)
+
+
+def signature_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the two shingle sets."""
+    if not left or len(left) != len(right):
+        return 0.0
+    return sum(1 for a, b in zip(left, right, strict=True) if a == b) / len(left)
+
+
+def near_duplicate_groups(
+    texts: Sequence[str],
+    *,
+    threshold: float = 0.8,
+    bands: int = 16,
+) -> list[int]:
+    """Group position of each text: the first position of its near-duplicate cluster.
+
+    Signatures are split into ``bands`` LSH bands; only texts that share a
+    band bucket are compared, and pairs at or above ``threshold`` estimated
+    Jaccard similarity are merged transitively.
+    """
+    parent = list(range(len(texts)))
+
+    def find(pos: int) -> int:
+        while parent[pos] != pos:
+            parent[pos] = parent[parent[pos]]
+            pos = parent[pos]
+        return pos
+
+    rows = max(1, _BINS // max(1, bands))
+    signatures = [minhash_signature(text) for text in texts]
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    for pos, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        for band in range(0, _BINS, rows):
+            bucket = buckets.setdefault((band, signature[band : band + rows]), [])
+            for other in bucket:
+                left, right = find(other), find(pos)
+                if left == right:
+                    continue
+                if signature_similarity(signatures[other], signature) >= threshold:  # type: ignore[arg-type]
+                    parent[max(left, right)] = min(left, right)
+            bucket.append(pos)
+    return [find(pos) for pos in range(len(texts))]
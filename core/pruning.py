@@ -1,15 +1,38 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
 import re
-from collections.abc import Iterable
-from hashlib import sha1
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from hashlib import blake2b, sha1
+from pathlib import Path
+from typing import Any
 
 try:
     import trafilatura  # type: ignore[import-untyped]
 except Exception:  # noqa: BLE001
     trafilatura = None
 
-from core.models import RetrievedDoc
+from core.content_store import ContentStore, full_content
+from core.metrics import record_context_prune
+from core.models import RetrievedDoc, RunConfig
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    cache_key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_cache_accessed ON extraction_cache (accessed_at);
+"""
 
 
 def optional_dependency_status() -> dict[str, bool]:
@@ -34,6 +57,10 @@ def normalize_whitespace(text: str) -> str:
     return re.sub(r"\s+", " ", (text or "")).strip()
 
 
+def _fallback_text(raw: str) -> str:
+    return normalize_whitespace(re.sub(r"<[^>]+>", " ", raw or ""))
+
+
 def clean_html_or_text(raw: str) -> str:
     raw = raw or ""
     if trafilatura is not None:
@@ -41,8 +68,7 @@ def clean_html_or_text(raw: str) -> str:
         if extracted:
             return normalize_whitespace(extracted)
     # Fallback when extraction fails.
-    text_only = re.sub(r"<[^>]+>", " ", raw)
-    return normalize_whitespace(text_only)
+    return _fallback_text(raw)
 
 
 def _doc_signature(doc: RetrievedDoc) -> str:
@@ -62,36 +88,309 @@ def dedupe_docs(docs: Iterable[RetrievedDoc]) -> list[RetrievedDoc]:
     return result
 
 
+def _extractor_tag() -> str:
+    # Part of every cache key, so installing or upgrading trafilatura never
+    # serves text produced by a different extractor.
+    if trafilatura is None:
+        return "regex"
+    return f"trafilatura-{getattr(trafilatura, '__version__', '0')}"
+
+
+def extraction_key(raw: str) -> str:
+    digest = blake2b(digest_size=16)
+    digest.update(_extractor_tag().encode())
+    digest.update(b"\x1f")
+    digest.update(raw.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Extracted main text keyed by a hash of the raw page.
+
+    A small in-memory LRU sits in front of an optional SQLite table under
+    ``DATA_DIR``, so a page extracted by one run is reused by later runs and
+    correction loops.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        max_entries: int = 5000,
+        memory_entries: int = 512,
+    ):
+        self.path = Path(path) if path else None
+        self.max_entries = max(1, int(max_entries))
+        self.memory_entries = max(1, int(memory_entries))
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        # Callers hold self._lock.
+        if self.path is None:
+            return None
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: str, text: str) -> None:
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> tuple[str | None, str]:
+        """Cached text and where it came from: ``memory``, ``disk`` or ``miss``."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key], "memory"
+            conn = self._connection()
+            if conn is None:
+                return None, "miss"
+            row = conn.execute(
+                "SELECT text FROM extraction_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None, "miss"
+            conn.execute(
+                "UPDATE extraction_cache SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            conn.commit()
+            self._remember(key, row[0])
+            return row[0], "disk"
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._remember(key, text)
+            conn = self._connection()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache (cache_key, text, accessed_at) "
+                "VALUES (?, ?, ?)",
+                (key, text, time.time()),
+            )
+            overflow = conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM extraction_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM extraction_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+@dataclass(slots=True)
+class PruneStats:
+    elapsed_ms: float = 0.0
+    docs: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    extracted: int = 0
+    skipped_small: int = 0
+    pooled: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "docs": self.docs,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "extracted": self.extracted,
+            "skipped_small": self.skipped_small,
+            "pooled": self.pooled,
+        }
+
+
+class ContextPruner:
+    """Cleans and budgets synthesizer context docs, reusing earlier extractions.
+
+    Pages shorter than ``min_chars`` skip trafilatura (it rarely finds a main
+    text in a snippet) and use the tag-stripping fallback directly. Longer
+    pages are looked up in the cache; misses are extracted inline, or across
+    ``workers`` processes when configured, since extraction holds the GIL.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: ExtractionCache | None = None,
+        min_chars: int = 1000,
+        workers: int = 0,
+    ):
+        self.cache = cache or ExtractionCache()
+        self.min_chars = max(0, int(min_chars))
+        self.workers = max(0, int(workers))
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: RunConfig) -> ContextPruner:
+        path = (
+            Path(config.data_dir) / "extraction_cache.sqlite3"
+            if config.prune_extract_cache_enabled
+            else None
+        )
+        return cls(
+            cache=ExtractionCache(path, max_entries=config.prune_extract_cache_max_entries),
+            min_chars=config.prune_extract_min_chars,
+            workers=config.prune_extract_workers,
+        )
+
+    def _pool(self) -> Executor | None:
+        if self.workers <= 0 or trafilatura is None:
+            return None
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: graph runs are threaded, and forking a threaded process is unsafe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def extract_many(self, raws: list[str], stats: PruneStats) -> Iterator[str]:
+        """Clean each raw page, in order.
+
+        Cache misses go to the process pool up front; without a pool they are
+        extracted lazily, so pages past the token budget are never extracted.
+        """
+        keys: list[str | None] = []
+        found: dict[int, str] = {}
+        for pos, raw in enumerate(raws):
+            if len(raw) < self.min_chars:
+                keys.append(None)
+                continue
+            key = extraction_key(raw)
+            keys.append(key)
+            text, source = self.cache.get(key)
+            if text is not None:
+                found[pos] = text
+                if source == "memory":
+                    stats.memory_hits += 1
+                else:
+                    stats.disk_hits += 1
+        pending: dict[int, Future[str]] = {}
+        pool = self._pool()
+        if pool is not None:
+            try:
+                for pos, key in enumerate(keys):
+                    if key is not None and pos not in found:
+                        pending[pos] = pool.submit(clean_html_or_text, raws[pos])
+                stats.pooled = bool(pending)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Extraction pool unavailable, extracting inline: %s", exc)
+                pending.clear()
+        for pos, raw in enumerate(raws):
+            key = keys[pos]
+            if key is None:
+                stats.skipped_small += 1
+                yield _fallback_text(raw)
+                continue
+            if pos in found:
+                yield found[pos]
+                continue
+            text = None
+            if pos in pending:
+                try:
+                    text = pending[pos].result()
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("Pooled extraction failed, extracting inline: %s", exc)
+            if text is None:
+                text = clean_html_or_text(raw)
+            stats.extracted += 1
+            self.cache.put(key, text)
+            yield text
+
+    def prune(
+        self,
+        docs: list[RetrievedDoc],
+        *,
+        per_doc_tokens: int = 500,
+        total_tokens: int = 1800,
+        content_store: ContentStore | None = None,
+    ) -> tuple[list[RetrievedDoc], PruneStats]:
+        """Extract and budget ``docs``, reading capped pages in full from ``content_store``."""
+        started = time.perf_counter()
+        stats = PruneStats()
+        unique = dedupe_docs(docs)
+        stats.docs = len(unique)
+        contents = self.extract_many(
+            [full_content(doc, content_store) or doc.snippet or "" for doc in unique], stats
+        )
+        cleaned: list[RetrievedDoc] = []
+        remaining = max(1, total_tokens)
+        for doc, content in zip(unique, contents, strict=False):
+            if not content:
+                continue
+            max_chars = max(40, per_doc_tokens * 4)
+            content = content[:max_chars]
+            token_count = approximate_tokens(content)
+            if token_count > remaining:
+                max_chars = max(40, remaining * 4)
+                content = content[:max_chars]
+                token_count = approximate_tokens(content)
+            if token_count <= 0:
+                continue
+            remaining -= token_count
+            cleaned.append(
+                doc.model_copy(
+                    update={
+                        "snippet": normalize_whitespace(doc.snippet)[:320],
+                        "content": content,
+                    }
+                )
+            )
+            if remaining <= 0:
+                break
+        contents.close()
+        stats.elapsed_ms = (time.perf_counter() - started) * 1000.0
+        record_context_prune(stats.elapsed_ms / 1000.0, stats.memory_hits + stats.disk_hits, stats.extracted)
+        return cleaned, stats
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+        self.cache.close()
+
+
+_default_pruner: ContextPruner | None = None
+_default_pruner_lock = threading.Lock()
+
+
+def default_context_pruner() -> ContextPruner:
+    """Process-wide pruner with a memory-only cache, for callers without a runtime."""
+    global _default_pruner
+    if _default_pruner is None:
+        with _default_pruner_lock:
+            if _default_pruner is None:
+                _default_pruner = ContextPruner()
+    return _default_pruner
+
+
 def prune_context_docs(
     docs: list[RetrievedDoc],
     *,
     per_doc_tokens: int = 500,
     total_tokens: int = 1800,
+    pruner: ContextPruner | None = None,
 ) -> list[RetrievedDoc]:
-    cleaned: list[RetrievedDoc] = []
-    remaining = max(1, total_tokens)
-    for doc in dedupe_docs(docs):
-        content = clean_html_or_text(doc.content or doc.snippet)
-        if not content:
-            continue
-        max_chars = max(40, per_doc_tokens * 4)
-        content = content[:max_chars]
-        token_count = approximate_tokens(content)
-        if token_count > remaining:
-            max_chars = max(40, remaining * 4)
-            content = content[:max_chars]
-            token_count = approximate_tokens(content)
-        if token_count <= 0:
-            continue
-        remaining -= token_count
-        cleaned.append(
-            doc.model_copy(
-                update={
-                    "snippet": normalize_whitespace(doc.snippet)[:320],
-                    "content": content,
-                }
-            )
-        )
-        if remaining <= 0:
-            break
-    return cleaned
+    pruned, _ = (pruner or default_context_pruner()).prune(
+        docs, per_doc_tokens=per_doc_tokens, total_tokens=total_tokens
+    )
+    return pruned
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from core.query_profile import STOPWORDS, TOKEN_PATTERN
+
+
+def query_tokens(query: str) -> frozenset[str]:
+    return frozenset(
+        token
+        for token in (match.lower() for match in TOKEN_PATTERN.findall(query or ""))
+        if token not in STOPWORDS
+    )
+
+
+def token_set_similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def collapse_near_duplicate_queries(
+    candidates: Sequence[str],
+    *,
+    issued: Sequence[str] = (),
+    threshold: float = 0.6,
+) -> tuple[list[str], list[dict[str, object]]]:
+    """Drop candidates whose token set nearly matches an earlier kept or issued query.
+
+    Tokens shared by every query in play (usually the base research question)
+    are ignored, so similarity is judged on what each expansion adds. A
+    threshold of 0 or less disables collapsing. Returns the kept queries in
+    their original order plus one decision record per dropped query.
+    """
+    if threshold <= 0:
+        return list(dict.fromkeys(candidates)), []
+    pool = [*issued, *candidates]
+    token_sets = {query: query_tokens(query) for query in pool}
+    shared = frozenset.intersection(*token_sets.values()) if len(token_sets) > 1 else frozenset()
+    kept_tokens: list[tuple[str, frozenset[str]]] = [
+        (query, token_sets[query] - shared) for query in dict.fromkeys(issued)
+    ]
+    kept: list[str] = []
+    decisions: list[dict[str, object]] = []
+    for query in dict.fromkeys(candidates):
+        if query in issued:
+            continue
+        residual = token_sets[query] - shared
+        best_query, best_score = "", 0.0
+        for other, other_tokens in kept_tokens:
+            score = token_set_similarity(residual, other_tokens)
+            if score > best_score:
+                best_query, best_score = other, score
+        if best_query and best_score >= threshold:
+            decisions.append(
+                {"dropped": query, "kept": best_query, "similarity": round(best_score, 3)}
+            )
+            continue
+        kept.append(query)
+        kept_tokens.append((query, residual))
+    return kept, decisions
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from core.citations import normalize_url
+from core.models import RetrievedDoc
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[Sequence[RetrievedDoc]],
+    *,
+    limit: int,
+    rank_constant: int = 60,
+) -> list[RetrievedDoc]:
+    """Fuse per-provider rankings by summing ``1 / (rank_constant + rank)`` per URL.
+
+    The first copy of each URL is kept, with ``rrf_score`` and ``rrf_providers``
+    added to its meta. Ties keep first-seen order. Docs without a URL
+    (provider fallbacks) are only returned when nothing else fused.
+    """
+    scores: dict[str, float] = {}
+    providers: dict[str, list[str]] = {}
+    first_seen: dict[str, RetrievedDoc] = {}
+    unranked: list[RetrievedDoc] = []
+    for docs in ranked_lists:
+        rank = 0
+        for doc in docs:
+            url = normalize_url(doc.url) if doc.provider != "fallback" else ""
+            if not url:
+                unranked.append(doc)
+                continue
+            rank += 1
+            if url in scores and doc.provider in providers[url]:
+                continue
+            scores[url] = scores.get(url, 0.0) + 1.0 / (rank_constant + rank)
+            providers.setdefault(url, []).append(doc.provider)
+            first_seen.setdefault(url, doc)
+    if not scores:
+        return unranked[: max(0, limit)]
+    ordered = sorted(scores, key=lambda url: -scores[url])
+    return [
+        first_seen[url].model_copy(
+            update={
+                "url": url,
+                "meta": {
+                    **(first_seen[url].meta or {}),
+                    "rrf_score": round(scores[url], 6),
+                    "rrf_providers": providers[url],
+                },
+            }
+        )
+        for url in ordered[: max(0, limit)]
+    ]
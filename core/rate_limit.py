@@ -1,17 +1,85 @@
 from __future__ import annotations
 
+import abc
+import asyncio
 import random
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal
 
+from core.metrics import (
+    record_circuit_transition,
+    record_concurrency_limit,
+    record_rate_limit_wait,
+    record_retry,
+)
 
-class TokenBucketLimiter:
+
+def token_bucket_take(
+    tokens: float,
+    elapsed_seconds: float,
+    *,
+    capacity: float,
+    refill_per_second: float,
+) -> tuple[float, float]:
+    """Refill a bucket and try to take one token.
+
+    Returns ``(tokens_left, wait_seconds)``; ``wait_seconds`` is 0.0 when a
+    token was taken. Every limiter backend shares this arithmetic.
+    """
+    tokens = min(capacity, tokens + max(0.0, elapsed_seconds) * refill_per_second)
+    if tokens >= 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, max(0.01, (1.0 - tokens) / refill_per_second)
+
+
+class RateLimiter(abc.ABC):
+    """Blocking ``acquire()`` on top of a backend-specific ``try_acquire()``."""
+
+    name: str = "default"
+    acquire_count: int = 0
+    wait_seconds_total: float = 0.0
+
+    @abc.abstractmethod
+    def try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return seconds until one is."""
+
+    def available_tokens(self) -> float | None:
+        """Tokens that could be taken right now, or None when the backend cannot tell cheaply."""
+        return None
+
+    def acquire(self) -> None:
+        started = time.perf_counter()
+        while True:
+            wait_seconds = self.try_acquire()
+            if wait_seconds <= 0.0:
+                break
+            time.sleep(wait_seconds)
+        self.record_wait(time.perf_counter() - started, mode="sync")
+
+    def record_wait(self, seconds: float, *, mode: str) -> None:
+        # Plain attribute updates; exact totals under contention are not required.
+        self.acquire_count += 1
+        self.wait_seconds_total += seconds
+        record_rate_limit_wait(self.name, mode, seconds)
+
+    def wait_stats(self) -> dict[str, float]:
+        return {
+            "acquire_count": self.acquire_count,
+            "wait_seconds_total": round(self.wait_seconds_total, 3),
+        }
+
+
+class TokenBucketLimiter(RateLimiter):
     """Simple thread-safe token bucket tuned for RPM limits."""
 
-    def __init__(self, rpm: int, burst: int | None = None):
+    def __init__(self, rpm: int, burst: int | None = None, *, name: str = "default"):
+        self.name = name
         self.rpm = max(1, rpm)
         self.capacity = burst if burst is not None else max(1, rpm)
         self.tokens = float(self.capacity)
@@ -19,21 +87,227 @@ class TokenBucketLimiter:
         self.last_refill = time.monotonic()
         self._lock = threading.Lock()
 
+    def try_acquire(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens, wait_seconds = token_bucket_take(
+                self.tokens,
+                now - self.last_refill,
+                capacity=self.capacity,
+                refill_per_second=self.refill_per_second,
+            )
+            self.last_refill = now
+            return wait_seconds
+
+    def available_tokens(self) -> float | None:
+        with self._lock:
+            elapsed = max(0.0, time.monotonic() - self.last_refill)
+            return min(float(self.capacity), self.tokens + elapsed * self.refill_per_second)
+
+
+class AsyncTokenBucketLimiter:
+    """Event-loop limiter over a RateLimiter's bucket with FIFO fairness.
+
+    Waiters queue in arrival order and only the head polls the bucket, so a
+    late caller can never take a token ahead of an earlier one. Sleeping is
+    done with ``asyncio.sleep``; cancelling a waiter removes it from the queue
+    and hands the turn to the next one. Buckets other than the in-memory one
+    (SQLite, Redis) do blocking I/O in ``try_acquire``, so they are polled from
+    a worker thread instead of the event loop.
+    """
+
+    def __init__(self, bucket: RateLimiter):
+        self.bucket = bucket
+        self._offload = not isinstance(bucket, TokenBucketLimiter)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def name(self) -> str:
+        return self.bucket.name
+
+    async def acquire(self) -> None:
+        started = time.perf_counter()
+        turn: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(turn)
+        try:
+            if self._waiters[0] is not turn:
+                await turn
+            while True:
+                if self._offload:
+                    wait_seconds = await asyncio.to_thread(self.bucket.try_acquire)
+                else:
+                    wait_seconds = self.bucket.try_acquire()
+                if wait_seconds <= 0.0:
+                    break
+                await asyncio.sleep(wait_seconds)
+        finally:
+            self._waiters.remove(turn)
+            if self._waiters and not self._waiters[0].done():
+                self._waiters[0].set_result(None)
+        self.bucket.record_wait(time.perf_counter() - started, mode="async")
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    """Seconds a provider asked us to wait, from ``exc.retry_after`` or a Retry-After header."""
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if headers is not None:
+            value = headers.get("retry-after")
+    if value is None:
+        return None
+    if isinstance(value, int | float):
+        return max(0.0, float(value))
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _status_code(exc: Exception) -> int | None:
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(exc, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_overload_error(exc: Exception) -> bool:
+    """True for 429/5xx responses, the signals that should shrink concurrency."""
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    text = str(exc).lower()
+    markers = ("429", "too many requests", "rate limit", "500", "502", "503", "504")
+    return any(marker in text for marker in markers)
+
+
+class RetryBudget:
+    """Sliding-window cap on retries as a fraction of requests.
+
+    A retry is allowed while retries in the window stay under
+    ``min_retries + ratio * requests``. The floor keeps low-traffic callers
+    retrying; the ratio stops a provider brownout from multiplying load.
+    """
+
+    def __init__(self, ratio: float = 0.2, *, min_retries: int = 10, window_seconds: float = 10.0):
+        self.ratio = max(0.0, float(ratio))
+        self.min_retries = max(0, int(min_retries))
+        self.window_seconds = max(0.1, float(window_seconds))
+        self.exhausted = 0
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                self.exhausted += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "exhausted": self.exhausted,
+                "ratio": self.ratio,
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD cap on in-flight calls to one provider.
+
+    Each success grows the limit by ``1 / limit`` (about one slot per round of
+    calls); a 429/5xx multiplies it by ``backoff``. Sync callers block on a
+    condition, async callers poll ``try_acquire`` with ``asyncio.sleep``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff: float = 0.5,
+    ):
+        self.name = name
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.limit = float(min(self.max_limit, max(self.min_limit, int(initial))))
+        self.backoff = min(0.95, max(0.1, float(backoff)))
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._cond = threading.Condition()
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if not self._has_slot():
+                return False
+            self.in_flight += 1
+            return True
+
     def acquire(self) -> None:
-        while True:
-            with self._lock:
-                now = time.monotonic()
-                elapsed = now - self.last_refill
-                self.tokens = min(
-                    self.capacity, self.tokens + elapsed * self.refill_per_second
-                )
-                self.last_refill = now
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
-                    return
-                missing = 1.0 - self.tokens
-                wait_seconds = max(0.01, missing / self.refill_per_second)
-            time.sleep(wait_seconds)
+        with self._cond:
+            self._cond.wait_for(self._has_slot)
+            self.in_flight += 1
+
+    async def aacquire(self) -> None:
+        delay = 0.005
+        while not self.try_acquire():
+            await asyncio.sleep(delay)
+            delay = min(0.1, delay * 2)
+
+    def release(self, outcome: Literal["success", "overload", "error"] = "success") -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if outcome == "success" and self.limit < self.max_limit:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+                self.increases += 1
+            elif outcome == "overload":
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self.decreases += 1
+            limit = self.limit
+            self._cond.notify_all()
+        record_concurrency_limit(self.name, limit)
+
+    def stats(self) -> dict[str, float]:
+        with self._cond:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "increases": self.increases,
+                "decreases": self.decreases,
+            }
 
 
 @dataclass(slots=True)
@@ -42,6 +316,8 @@ class RetryPolicy:
     base_delay: float = 0.35
     max_delay: float = 8.0
     jitter: float = 0.2
+    max_retry_after: float = 30.0
+    budget: RetryBudget | None = None
 
     def next_delay(self, attempt_index: int) -> float:
         raw = min(self.max_delay, self.base_delay * (2**attempt_index))
@@ -49,59 +325,158 @@ class RetryPolicy:
 
 
 class CircuitBreaker:
-    def __init__(self, threshold: int = 3, recovery_seconds: int = 60):
+    """Closed -> open after ``threshold`` failures -> half-open after ``recovery_seconds``.
+
+    Half-open admits a single probe: its success closes the breaker, its
+    failure re-opens it for another recovery period. A probe that never
+    reports back is replaced after ``recovery_seconds``.
+    """
+
+    def __init__(self, threshold: int = 3, recovery_seconds: float = 60, *, name: str = "default"):
+        self.name = name
         self.threshold = max(1, threshold)
-        self.recovery_seconds = max(1, recovery_seconds)
+        self.recovery_seconds = max(0.01, float(recovery_seconds))
+        self.state: Literal["closed", "open", "half_open"] = "closed"
         self.failures = 0
         self.open_until = 0.0
+        self.probe_started = 0.0
         self._lock = threading.Lock()
 
+    def _transition(self, state: Literal["closed", "open", "half_open"]) -> None:
+        # Callers hold self._lock.
+        if state != self.state:
+            record_circuit_transition(self.name, self.state, state)
+            self.state = state
+
     def allow(self) -> bool:
         with self._lock:
             now = time.monotonic()
-            if now >= self.open_until:
+            if self.state == "closed":
                 return True
-            return False
+            if self.state == "open":
+                if now < self.open_until:
+                    return False
+                self._transition("half_open")
+            elif now - self.probe_started < self.recovery_seconds:
+                return False
+            self.probe_started = now
+            return True
 
     def success(self) -> None:
         with self._lock:
             self.failures = 0
             self.open_until = 0.0
+            self._transition("closed")
 
     def failure(self) -> None:
         with self._lock:
             self.failures += 1
-            if self.failures >= self.threshold:
+            if self.state == "half_open" or self.failures >= self.threshold:
                 self.open_until = time.monotonic() + self.recovery_seconds
+                self._transition("open")
 
 
 def default_retryable(exc: Exception) -> bool:
+    status = _status_code(exc)
+    if status is not None:
+        return status in {408, 429} or status >= 500
     text = str(exc).lower()
     retry_markers = ("timeout", "timed out", "429", "rate", "503", "502", "500")
     return any(marker in text for marker in retry_markers)
 
 
+def _retry_delay(exc: Exception, attempt: int, policy: RetryPolicy, name: str) -> float | None:
+    """Seconds to sleep before the next attempt, or None when the retry is refused."""
+    retry_after = retry_after_seconds(exc)
+    if retry_after is not None and retry_after > policy.max_retry_after:
+        record_retry(name, "retry_after_exceeded")
+        return None
+    if policy.budget is not None and not policy.budget.try_spend():
+        record_retry(name, "budget_exhausted")
+        return None
+    record_retry(name, "retried")
+    return retry_after if retry_after is not None else policy.next_delay(attempt)
+
+
 def call_with_retries(
     fn: Callable[..., Any],
     *args: Any,
     policy: RetryPolicy | None = None,
     is_retryable: Callable[[Exception], bool] | None = None,
+    concurrency: AdaptiveConcurrencyLimiter | None = None,
     **kwargs: Any,
 ) -> Any:
     policy = policy or RetryPolicy()
     predicate = is_retryable or default_retryable
+    name = concurrency.name if concurrency is not None else "default"
     last_error: Exception | None = None
+    if policy.budget is not None:
+        policy.budget.record_request()
 
     for attempt in range(policy.max_retries + 1):
+        if concurrency is not None:
+            concurrency.acquire()
+        # Cancellation and other BaseExceptions release as a neutral "error".
+        outcome: Literal["success", "overload", "error"] = "error"
         try:
-            return fn(*args, **kwargs)
+            result = fn(*args, **kwargs)
+            outcome = "success"
+            return result
         except Exception as exc:  # noqa: BLE001
             last_error = exc
-            if attempt >= policy.max_retries or not predicate(exc):
-                raise
-            time.sleep(policy.next_delay(attempt))
+            outcome = "overload" if is_overload_error(exc) else "error"
+        finally:
+            if concurrency is not None:
+                concurrency.release(outcome)
+        if attempt >= policy.max_retries or not predicate(last_error):
+            raise last_error
+        delay = _retry_delay(last_error, attempt, policy, name)
+        if delay is None:
+            raise last_error
+        time.sleep(delay)
 
     if last_error is None:
         raise RuntimeError("Retry handler exited without returning a value.")
     raise last_error
 
+
+async def acall_with_retries(
+    fn: Callable[..., Awaitable[Any]],
+    *args: Any,
+    policy: RetryPolicy | None = None,
+    is_retryable: Callable[[Exception], bool] | None = None,
+    concurrency: AdaptiveConcurrencyLimiter | None = None,
+    **kwargs: Any,
+) -> Any:
+    policy = policy or RetryPolicy()
+    predicate = is_retryable or default_retryable
+    name = concurrency.name if concurrency is not None else "default"
+    last_error: Exception | None = None
+    if policy.budget is not None:
+        policy.budget.record_request()
+
+    for attempt in range(policy.max_retries + 1):
+        if concurrency is not None:
+            await concurrency.aacquire()
+        # Cancellation and other BaseExceptions release as a neutral "error".
+        outcome: Literal["success", "overload", "error"] = "error"
+        try:
+            result = await fn(*args, **kwargs)
+            outcome = "success"
+            return result
+        except Exception as exc:  # noqa: BLE001
+            last_error = exc
+            outcome = "overload" if is_overload_error(exc) else "error"
+        finally:
+            if concurrency is not None:
+                concurrency.release(outcome)
+        if attempt >= policy.max_retries or not predicate(last_error):
+            raise last_error
+        delay = _retry_delay(last_error, attempt, policy, name)
+        if delay is None:
+            raise last_error
+        await asyncio.sleep(delay)
+
+    if last_error is None:
+        raise RuntimeError("Retry handler exited without returning a value.")
+    raise last_error
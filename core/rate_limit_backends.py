@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from core.models import RunConfig
+from core.rate_limit import RateLimiter, TokenBucketLimiter, token_bucket_take
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Same arithmetic as token_bucket_take, evaluated atomically inside Redis.
+# Server TIME keeps every client on one clock; the wait is returned as a
+# string because Lua numbers are truncated to integers on the way out.
+_REDIS_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local ttl_ms = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1])
+local updated_at = tonumber(state[2])
+if tokens == nil or updated_at == nil then
+    tokens = capacity
+    updated_at = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.max(0.01, (1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+return tostring(wait)
+"""
+
+
+class SQLiteTokenBucketLimiter(RateLimiter):
+    """Token bucket shared by every process on one host through a SQLite file.
+
+    ``BEGIN IMMEDIATE`` takes the database write lock, so the read-refill-take
+    cycle is atomic across processes. Wall-clock time is used because
+    monotonic clocks are not comparable between processes.
+    """
+
+    def __init__(self, path: str | Path, name: str, rpm: int, burst: int | None = None):
+        self.path = Path(path)
+        self.name = name
+        self.rpm = max(1, rpm)
+        self.capacity = float(burst if burst is not None else self.rpm)
+        self.refill_per_second = self.rpm / 60.0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path),
+                timeout=10.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._conn.executescript(_SQLITE_SCHEMA)
+        return self._conn
+
+    def try_acquire(self) -> float:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                tokens, updated_at = (self.capacity, now) if row is None else row
+                tokens, wait_seconds = token_bucket_take(
+                    float(tokens),
+                    now - float(updated_at),
+                    capacity=self.capacity,
+                    refill_per_second=self.refill_per_second,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets (name, tokens, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    (self.name, tokens, now),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return wait_seconds
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisTokenBucketLimiter(RateLimiter):
+    """Cluster-wide token bucket evaluated by a Lua script in Redis.
+
+    If Redis is unreachable the limiter degrades to a process-local bucket
+    with the same rate rather than failing provider calls, and keeps using it
+    for ``failure_cooldown_seconds`` before trying Redis again, so an outage
+    costs one socket timeout per cool-down rather than one per acquire.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        rpm: int,
+        burst: int | None = None,
+        *,
+        key_prefix: str = "ratelimit",
+        failure_cooldown_seconds: float = 30.0,
+    ):
+        self.client = client
+        self.name = name
+        self.key = f"{key_prefix}:{name}"
+        self.rpm = max(1, rpm)
+        self.capacity = float(burst if burst is not None else self.rpm)
+        self.refill_per_second = self.rpm / 60.0
+        # Idle buckets are full again after capacity / rate seconds; expire them then.
+        self.ttl_ms = int(max(1.0, self.capacity / self.refill_per_second) * 1000) + 1000
+        self._script = client.register_script(_REDIS_TOKEN_BUCKET_LUA)
+        self._local = TokenBucketLimiter(self.rpm, burst, name=name)
+        self.failure_cooldown_seconds = max(0.0, failure_cooldown_seconds)
+        self._degraded = False
+        self._retry_at = 0.0
+        self._state_lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        if self._degraded and time.monotonic() < self._retry_at:
+            return self._local.try_acquire()
+        try:
+            result = self._script(
+                keys=[self.key],
+                args=[self.capacity, self.refill_per_second, self.ttl_ms],
+            )
+        except Exception as exc:  # noqa: BLE001
+            with self._state_lock:
+                if not self._degraded:
+                    logger.warning(
+                        "Redis rate limiter unavailable for %s; using a local bucket: %s",
+                        self.name,
+                        exc,
+                    )
+                self._degraded = True
+                self._retry_at = time.monotonic() + self.failure_cooldown_seconds
+            return self._local.try_acquire()
+        if self._degraded:
+            with self._state_lock:
+                if self._degraded:
+                    self._degraded = False
+                    logger.info("Redis rate limiter for %s recovered", self.name)
+        if isinstance(result, bytes):
+            result = result.decode("utf-8")
+        return float(result)
+
+
+def build_rate_limiter(config: RunConfig, name: str, rpm: int) -> RateLimiter:
+    """Return the limiter for ``name`` on the backend selected by ``rate_limit_backend``."""
+    backend = config.rate_limit_backend
+    if backend == "sqlite":
+        return SQLiteTokenBucketLimiter(Path(config.data_dir) / "rate_limits.sqlite3", name, rpm)
+    if backend == "redis":
+        import redis
+
+        client = redis.Redis.from_url(config.redis_url, socket_timeout=2.0)
+        return RedisTokenBucketLimiter(
+            client, name, rpm, key_prefix=config.rate_limit_key_prefix
+        )
+    return TokenBucketLimiter(rpm, name=name)
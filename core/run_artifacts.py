@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+# Artifact names.
+CORPUS_BM25 = "corpus_bm25"
+CONTENT_STORE = "content_store"
+DOC_STORE = "doc_store"
+DOC_FEATURES = "doc_features"
+
+
+class RunArtifacts:
+    """Per-run objects shared between graph nodes outside of graph state.
+
+    Indexes and stores are built once by the producing node and looked up by
+    ``run_id`` in the branches that consume them, so they never travel in
+    ``Send`` payloads or state reducers. ``discard`` drops a finished run.
+    """
+
+    def __init__(self) -> None:
+        self._runs: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def put(self, run_id: str, name: str, value: Any) -> Any:
+        with self._lock:
+            self._runs.setdefault(run_id, {})[name] = value
+        return value
+
+    def setdefault(self, run_id: str, name: str, factory: Callable[[], Any]) -> Any:
+        """The run's ``name`` artifact, created with ``factory`` on first use."""
+        with self._lock:
+            artifacts = self._runs.setdefault(run_id, {})
+            if name not in artifacts:
+                artifacts[name] = factory()
+            return artifacts[name]
+
+    def get(self, run_id: str, name: str, default: Any = None) -> Any:
+        return self._runs.get(run_id, {}).get(name, default)
+
+    def discard(self, run_id: str) -> None:
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from core.metrics import record_singleflight_coalesced
+
+
+class _InFlight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse identical concurrent calls onto one execution.
+
+    The first caller for a key runs ``fn``; callers arriving while it is still
+    running block and receive the same value (or exception). Nothing is
+    remembered once the call completes, so this never serves stale results.
+    """
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _InFlight] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], *, label: str = "") -> tuple[Any, bool]:
+        """Return ``(value, shared)``; ``shared`` is True for coalesced callers."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _InFlight()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+        if not leader:
+            record_singleflight_coalesced(self.scope, label)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.value, False
+
+
+class AsyncSingleFlight:
+    """Event-loop variant of SingleFlight for coroutine entry points.
+
+    The shared call runs as its own task, so a cancelled caller does not
+    cancel the request other waiters depend on.
+    """
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self.coalesced = 0
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        label: str = "",
+    ) -> tuple[Any, bool]:
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+
+            def _forget(done: asyncio.Future[Any], key: Hashable = key) -> None:
+                if self._calls.get(key) is done:
+                    del self._calls[key]
+
+            task.add_done_callback(_forget)
+        else:
+            self.coalesced += 1
+            record_singleflight_coalesced(self.scope, label)
+        return await asyncio.shield(task), shared
@@ -1,50 +1,17 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
+from functools import lru_cache
+from hashlib import blake2b
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from core.domain_index import DomainClassifier, default_domain_classifier
 from core.models import QueryProfile, RetrievedDoc
 
-TIER_A_DOMAINS = {
-    "arxiv.org",
-    "nature.com",
-    "science.org",
-    "aclanthology.org",
-    "openreview.net",
-    "semanticscholar.org",
-    "ieee.org",
-    "acm.org",
-    "nasa.gov",
-    "nist.gov",
-    "who.int",
-    "oecd.org",
-    "europa.eu",
-    "aaai.org",
-}
-
-TIER_B_DOMAINS = {
-    "reuters.com",
-    "bloomberg.com",
-    "mckinsey.com",
-    "gartner.com",
-    "forrester.com",
-    "mit.edu",
-    "stanford.edu",
-    "openai.com",
-    "anthropic.com",
-    "brookings.edu",
-    "chicagobooth.edu",
-}
-
-LOW_TRUST_DOMAINS = {
-    "instagram.com",
-    "tiktok.com",
-    "linkedin.com",
-    "substack.com",
-    "medium.com",
-    "quora.com",
-    "reddit.com",
-}
+if TYPE_CHECKING:
+    from core.doc_features import DocFeatureIndex
 
 BOILERPLATE_PATTERNS = (
     "copyright",
@@ -90,6 +57,7 @@ OPEN_STATUS_HINTS = (
 )
 
 
+@lru_cache(maxsize=16384)
 def _hostname(url: str) -> str:
     host = (urlparse(url).netloc or "").lower().strip()
     if host.startswith("www."):
@@ -97,10 +65,6 @@ def _hostname(url: str) -> str:
     return host
 
 
-def _is_known_domain(host: str, candidates: set[str]) -> bool:
-    return host in candidates or any(host.endswith(f".{domain}") for domain in candidates)
-
-
 def _is_primary_edu_page(url: str, title: str) -> bool:
     parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
@@ -110,22 +74,27 @@ def _is_primary_edu_page(url: str, title: str) -> bool:
     return any(hint in blob for hint in PRIMARY_PAGE_HINTS)
 
 
-def source_tier(url: str, provider: str = "", title: str = "") -> str:
+def source_tier(
+    url: str,
+    provider: str = "",
+    title: str = "",
+    *,
+    classifier: DomainClassifier | None = None,
+) -> str:
     host = _hostname(url)
     if not host:
         return "unknown"
+    listed = (classifier or default_domain_classifier()).classify(host)
+    if listed.tenant_override and listed.tier:
+        return listed.tier
     if host.endswith(".gov"):
         return "A"
     if _is_primary_edu_page(url, title):
         return "A"
     if host.endswith(".edu"):
         return "B"
-    if _is_known_domain(host, TIER_A_DOMAINS):
-        return "A"
-    if _is_known_domain(host, TIER_B_DOMAINS):
-        return "B"
-    if _is_known_domain(host, LOW_TRUST_DOMAINS):
-        return "C"
+    if listed.tier:
+        return listed.tier
     if provider in {"tavily", "ddg", "firecrawl"} and title:
         return "C"
     return "unknown"
@@ -149,43 +118,211 @@ def is_boilerplate_line(line: str) -> bool:
     return any(marker in value for marker in BOILERPLATE_PATTERNS)
 
 
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_NAV_PATTERN = re.compile(
+    r"(^|\s)(menu|home|about|contact|privacy|terms)\s*(\||/|$)", flags=re.IGNORECASE
+)
+_NAV_CANDIDATE_PATTERN = re.compile(r"\s(?:menu|home|about|contact|privacy|terms)", flags=re.IGNORECASE)
+_NAV_WORD_CHARS = 8  # longest candidate: whitespace + "privacy"
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"  # str.splitlines boundaries
+_LINE_BREAK_PATTERN = re.compile(f"[{_LINE_BREAKS}]")
+_BLOCK_CHARS = 4096
+_CLEAN_CACHE_SIZE = 8192
+_clean_cache: dict[tuple[bytes, int], str] = {}
+_QUALITY_CACHE_SIZE = 4096
+_quality_cache: dict[tuple[str, str, str, bytes, int, int], tuple[str, str, str, str, bool]] = {}
+
+
+def _text_digest(text: str) -> bytes:
+    return blake2b((text or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _next_nav_match(source: str, start: int, end: int) -> re.Match[str] | None:
+    """Leftmost ``_NAV_PATTERN`` match beginning in ``[start, end)``.
+
+    A full ``finditer`` scans to the end of the page looking for the next
+    crumb; candidates are found in the window first and then matched against
+    the whole string, so the result is the same.
+    """
+    if start == 0 and (match := _NAV_PATTERN.match(source)):
+        return match
+    for candidate in _NAV_CANDIDATE_PATTERN.finditer(source, start, end + _NAV_WORD_CHARS):
+        if candidate.start() >= end:
+            break
+        if match := _NAV_PATTERN.match(source, candidate.start()):
+            return match
+    return None
+
+
+def _nav_stripped_blocks(source: str) -> Iterator[str]:
+    """``_NAV_PATTERN.sub(" ", source)``, produced lazily in bounded blocks."""
+    pos = 0
+    while pos < len(source):
+        end = min(len(source), pos + _BLOCK_CHARS)
+        match = _next_nav_match(source, pos, end)
+        if match is None:
+            yield source[pos:end]
+            pos = end
+            continue
+        if match.start() > pos:
+            yield source[pos : match.start()]
+        yield " "
+        pos = match.end()
+
+
+def _clean_evidence(text: str, limit: int) -> str:
+    # Same result as cleaning every line of the text, but lines are only read
+    # until `limit` output characters exist, so long pages stop early.
+    source = _TAG_PATTERN.sub(" ", (text or "").replace("\\n", "\n"))
+    kept: list[str] = []
+    kept_chars = -1  # length of " ".join(kept)
+    skipped: list[str] = []  # the whole text, needed only if no line is kept
+    partial: list[str] = []  # start of a line that continues into the next block
+    blocks = _nav_stripped_blocks(source)
+    while kept_chars < limit:
+        block = next(blocks, None)
+        if block is None:
+            lines = ["".join(partial)]
+        else:
+            if not kept:
+                skipped.append(block)
+            if not _LINE_BREAK_PATTERN.search(block):
+                partial.append(block)
+                continue
+            lines = "".join([*partial, block]).splitlines(keepends=True)
+            partial = [lines.pop()] if lines[-1][-1] not in _LINE_BREAKS else []
+        for line in lines:
+            line = line.strip()
+            if not line or is_boilerplate_line(line):
+                continue
+            line = _WHITESPACE_PATTERN.sub(" ", line)
+            kept.append(line)
+            kept_chars += len(line) + 1
+            if kept_chars >= limit:
+                break
+        if block is None:
+            break
+    if not kept:
+        return _WHITESPACE_PATTERN.sub(" ", "".join(skipped)).strip()[:limit].strip()
+    return " ".join(kept)[:limit].strip()
+
+
 def clean_evidence_text(text: str, *, max_chars: int = 180) -> str:
-    source = (text or "").replace("\\n", "\n")
-    source = re.sub(r"<[^>]+>", " ", source)
-    source = re.sub(r"(^|\s)(menu|home|about|contact|privacy|terms)\s*(\||/|$)", " ", source, flags=re.IGNORECASE)
-    lines = [ln.strip() for ln in source.splitlines()]
-    cleaned = [ln for ln in lines if ln and not is_boilerplate_line(ln)]
-    if not cleaned:
-        cleaned = [re.sub(r"\s+", " ", source).strip()]
-    normalized = re.sub(r"\s+", " ", " ".join(cleaned)).strip()
-    return normalized[: max(40, max_chars)].strip()
-
-
-def is_low_trust_source(url: str, title: str = "") -> bool:
-    host = _hostname(url)
-    if _is_known_domain(host, LOW_TRUST_DOMAINS):
+    """Strip tags, navigation crumbs and boilerplate lines; collapse whitespace; truncate.
+
+    Results are memoized by a digest of the input, so repeated cleaning of
+    the same page (by several scorers in one run) costs one hash.
+    """
+    limit = max(40, max_chars)
+    key = (_text_digest(text), limit)
+    cached = _clean_cache.get(key)
+    if cached is None:
+        cached = _clean_evidence(text, limit)
+        if len(_clean_cache) >= _CLEAN_CACHE_SIZE:
+            _clean_cache.clear()
+        _clean_cache[key] = cached
+    return cached
+
+
+def is_low_trust_source(
+    url: str,
+    title: str = "",
+    *,
+    classifier: DomainClassifier | None = None,
+) -> bool:
+    if (classifier or default_domain_classifier()).classify(_hostname(url)).low_trust:
         return True
     lowered_title = (title or "").lower()
     low_signal_words = ("sponsored", "affiliate", "promoted", "viral", "reel", "shorts")
     return any(word in lowered_title for word in low_signal_words)
 
 
-def annotate_doc(doc: RetrievedDoc, *, max_evidence_chars: int = 180) -> RetrievedDoc:
-    tier = source_tier(doc.url, doc.provider, doc.title)
-    evidence = clean_evidence_text(doc.snippet or doc.content, max_chars=max_evidence_chars)
-    confidence = evidence_confidence(tier, evidence)
-    meta = dict(doc.meta or {})
-    meta["source_tier"] = tier
-    meta["confidence"] = confidence
-    meta["publisher"] = _hostname(doc.url) or "unknown"
+def doc_quality(
+    url: str,
+    provider: str,
+    title: str,
+    text: str,
+    max_evidence_chars: int = 180,
+    classifier: DomainClassifier | None = None,
+) -> tuple[str, str, str, str, bool]:
+    """Memoized ``(tier, evidence, confidence, publisher, low_trust)`` for one doc.
+
+    Docs pass through ``annotate_doc``/``prioritize_docs`` at every graph
+    stage with the same fields, so each distinct doc is only derived once.
+    The memo is keyed on a digest of ``text`` and the classifier's
+    ``rules_key``, so it holds neither page text nor tenant classifiers.
+    """
+    resolved = classifier or default_domain_classifier()
+    key = (url, provider, title, _text_digest(text), max_evidence_chars, resolved.rules_key)
+    cached = _quality_cache.get(key)
+    if cached is not None:
+        return cached
+    tier = source_tier(url, provider, title, classifier=resolved)
+    evidence = clean_evidence_text(text, max_chars=max_evidence_chars)
+    cached = (
+        tier,
+        evidence,
+        evidence_confidence(tier, evidence),
+        _hostname(url) or "unknown",
+        is_low_trust_source(url, title, classifier=resolved),
+    )
+    if len(_quality_cache) >= _QUALITY_CACHE_SIZE:
+        _quality_cache.clear()
+    _quality_cache[key] = cached
+    return cached
+
+
+def clear_doc_quality_cache() -> None:
+    _quality_cache.clear()
+
+
+def _quality(
+    doc: RetrievedDoc,
+    max_evidence_chars: int = 180,
+    classifier: DomainClassifier | None = None,
+) -> tuple[str, str, str, str, bool]:
+    return doc_quality(
+        doc.url,
+        doc.provider,
+        doc.title,
+        doc.snippet or doc.content,
+        max_evidence_chars,
+        classifier,
+    )
+
+
+def _annotated(
+    doc: RetrievedDoc,
+    quality: tuple[str, str, str, str, bool],
+) -> RetrievedDoc:
+    tier, evidence, confidence, publisher, _ = quality
+    meta = doc.meta or {}
+    if (
+        doc.snippet == evidence
+        and meta.get("source_tier") == tier
+        and meta.get("confidence") == confidence
+        and meta.get("publisher") == publisher
+    ):
+        # Already annotated by an earlier stage; skip the copy.
+        return doc
     return doc.model_copy(
         update={
             "snippet": evidence,
-            "meta": meta,
+            "meta": {**meta, "source_tier": tier, "confidence": confidence, "publisher": publisher},
         }
     )
 
 
+def annotate_doc(
+    doc: RetrievedDoc,
+    *,
+    max_evidence_chars: int = 180,
+    classifier: DomainClassifier | None = None,
+) -> RetrievedDoc:
+    return _annotated(doc, _quality(doc, max_evidence_chars, classifier))
+
+
 def tier_rank(tier: str) -> int:
     if tier == "A":
         return 3
@@ -201,37 +338,35 @@ def prioritize_docs(
     *,
     source_quality_bar: str,
     min_tier_ab_sources: int,
+    classifier: DomainClassifier | None = None,
 ) -> list[RetrievedDoc]:
-    annotated = [annotate_doc(doc) for doc in docs]
+    # Annotation never changes url, provider or title, so the tier and trust
+    # derived for the incoming doc also rank its annotated copy.
+    annotated: list[tuple[RetrievedDoc, tuple[str, str, str, str, bool]]] = []
+    for doc in docs:
+        quality = _quality(doc, classifier=classifier)
+        annotated.append((_annotated(doc, quality), quality))
     ranked = sorted(
         annotated,
-        key=lambda d: (
-            1 if is_low_trust_source(d.url, d.title) else 0,
-            -tier_rank(str((d.meta or {}).get("source_tier", "unknown"))),
-            -float(d.score or 0.0),
-            d.title.lower(),
+        key=lambda item: (
+            1 if item[1][4] else 0,
+            -tier_rank(item[1][0]),
+            -float(item[0].score or 0.0),
+            item[0].title.lower(),
         ),
     )
     if source_quality_bar == "broad":
-        return ranked
-    ab_docs = [
-        doc
-        for doc in ranked
-        if str((doc.meta or {}).get("source_tier", "unknown")) in {"A", "B"}
-    ]
-    c_docs = [
-        doc
-        for doc in ranked
-        if str((doc.meta or {}).get("source_tier", "unknown")) == "C"
-    ]
+        return [doc for doc, _ in ranked]
+    ab_docs = [doc for doc, quality in ranked if quality[0] in {"A", "B"}]
+    c_docs = [(doc, quality) for doc, quality in ranked if quality[0] == "C"]
     if source_quality_bar == "high_confidence":
         if len(ab_docs) >= min_tier_ab_sources:
-            prioritized_c = [doc for doc in c_docs if not is_low_trust_source(doc.url, doc.title)]
-            deprioritized_c = [doc for doc in c_docs if is_low_trust_source(doc.url, doc.title)]
+            prioritized_c = [doc for doc, quality in c_docs if not quality[4]]
+            deprioritized_c = [doc for doc, quality in c_docs if quality[4]]
             return ab_docs + prioritized_c + deprioritized_c
-        return ranked
+        return [doc for doc, _ in ranked]
     # mixed
-    return ab_docs + c_docs if ab_docs else ranked
+    return ab_docs + [doc for doc, _ in c_docs] if ab_docs else [doc for doc, _ in ranked]
 
 
 def quality_stats(citations: list[dict | object]) -> dict[str, int]:
@@ -269,27 +404,33 @@ def _core_query_terms(profile: QueryProfile) -> list[str]:
     return deduped
 
 
-def _doc_blob(doc: RetrievedDoc) -> str:
+def _doc_body_blob(doc: RetrievedDoc) -> str:
     return " ".join(
         (
             (doc.title or "").lower(),
             (doc.snippet or "").lower(),
             (doc.content or "")[:1800].lower(),
-            (doc.url or "").lower(),
         )
     )
 
 
+def _doc_blob(doc: RetrievedDoc, features: DocFeatureIndex | None = None) -> str:
+    body = features.get(doc).blob if features is not None else _doc_body_blob(doc)
+    return f"{body} {(doc.url or '').lower()}"
+
+
 def doc_matches_query_intent(
     doc: RetrievedDoc,
     profile: QueryProfile,
     *,
     min_term_hits: int = 2,
+    features: DocFeatureIndex | None = None,
+    terms: list[str] | None = None,
 ) -> bool:
-    blob = _doc_blob(doc)
-    terms = _core_query_terms(profile)
+    terms = _core_query_terms(profile) if terms is None else terms
     if not terms:
         return True
+    blob = _doc_blob(doc, features)
     hit_count = sum(1 for term in terms if term in blob)
     if hit_count < min_term_hits:
         return False
@@ -321,11 +462,15 @@ def filter_docs_for_query(
     profile: QueryProfile,
     *,
     min_term_hits: int = 2,
+    features: DocFeatureIndex | None = None,
 ) -> tuple[list[RetrievedDoc], dict[str, int]]:
     kept: list[RetrievedDoc] = []
     off_topic_count = 0
+    terms = _core_query_terms(profile)
     for doc in docs:
-        if doc_matches_query_intent(doc, profile, min_term_hits=min_term_hits):
+        if doc_matches_query_intent(
+            doc, profile, min_term_hits=min_term_hits, features=features, terms=terms
+        ):
             kept.append(doc)
         else:
             off_topic_count += 1
@@ -38,6 +38,8 @@ def merge_retrieval_stats(state: Any, *, kept_count: int) -> dict[str, int]:
     candidate_count = sum(int(lane.get("candidate_count", 0)) for lane in lanes)
     filtered_count = sum(int(lane.get("filtered_count", 0)) for lane in lanes)
     stale_count = sum(int(lane.get("stale_count", 0)) for lane in lanes)
+    skipped_query_count = sum(int(lane.get("skipped_query_count", 0)) for lane in lanes)
+    deduped_query_count = sum(int(lane.get("deduped_query_count", 0)) for lane in lanes)
 
     if candidate_count <= 0:
         candidate_count = kept_count
@@ -49,6 +51,8 @@ def merge_retrieval_stats(state: Any, *, kept_count: int) -> dict[str, int]:
         "filtered_count": filtered_count,
         "kept_count": kept_count,
         "stale_count": stale_count,
+        "skipped_query_count": skipped_query_count,
+        "deduped_query_count": deduped_query_count,
     }
 
 
@@ -76,6 +80,13 @@ def intent_note(query_profile: QueryProfile) -> str:
     return "This report prioritizes conceptual clarity, evidence reconciliation, and practical interpretation."
 
 
+def query_dedup_summary(state: Any) -> dict[str, Any]:
+    """Summarize near-duplicate query merges recorded by lanes and branches."""
+    get_fn = state.get if hasattr(state, "get") else lambda k, d: state.get(k, d)
+    decisions = list(get_fn("query_dedup", []) or [])
+    return {"deduped_query_count": len(decisions), "decisions": decisions[:50]}
+
+
 def build_success_metrics(
     *,
     state: Any,
@@ -105,6 +116,7 @@ def build_success_metrics(
         },
         "source_mix": source_mix(citations),
         "retrieval_stats": merge_retrieval_stats(state, kept_count=kept_count),
+        "query_dedup": query_dedup_summary(state),
         "verification_stats": {
             "verified_count": ab_count,
             "constrained_count": c_count,
@@ -139,5 +151,6 @@ def build_fallback_metrics(
         "constrained_reason_codes": [reason],
         "source_mix": mix,
         "retrieval_stats": merge_retrieval_stats(state, kept_count=kept_count),
+        "query_dedup": query_dedup_summary(state),
         "provider_alerts": provider_alerts or [],
     }
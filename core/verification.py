@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from itertools import chain
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 from core.citations import normalize_url, normalized_domain
@@ -10,6 +14,9 @@ from core.models import QueryProfile, RetrievedDoc
 from core.query_profile import is_opportunity_query
 from core.source_quality import clean_evidence_text, source_tier
 
+if TYPE_CHECKING:
+    from core.doc_features import DocFeatureIndex
+
 TOKEN_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9'-]{2,}")
 ISO_DATE_PATTERN = re.compile(r"\b(20\d{2})[-/](\d{1,2})[-/](\d{1,2})\b")
 MONTH_DATE_PATTERN = re.compile(
@@ -60,6 +67,8 @@ class RetrievalFilterStats:
     stale_count: int = 0
     off_topic_count: int = 0
     low_signal_count: int = 0
+    skipped_query_count: int = 0
+    deduped_query_count: int = 0
 
     def as_dict(self) -> dict[str, int]:
         return {
@@ -69,6 +78,8 @@ class RetrievalFilterStats:
             "stale_count": self.stale_count,
             "off_topic_count": self.off_topic_count,
             "low_signal_count": self.low_signal_count,
+            "skipped_query_count": self.skipped_query_count,
+            "deduped_query_count": self.deduped_query_count,
         }
 
 
@@ -100,11 +111,20 @@ def _query_tokens(query: str, facets: list[str]) -> set[str]:
     return {tok for tok in _tokenize(text) if len(tok) >= 4}
 
 
-def relevance_score(doc: RetrievedDoc, *, query: str, facets: list[str]) -> float:
-    q_tokens = _query_tokens(query, facets)
+def relevance_score(
+    doc: RetrievedDoc,
+    *,
+    query: str,
+    facets: list[str],
+    features: DocFeatureIndex | None = None,
+) -> float:
+    if features is None:
+        q_tokens = _query_tokens(query, facets)
+    else:
+        q_tokens = features.query_tokens(query, facets)
     if not q_tokens:
         return 0.5
-    d_tokens = _tokenize(_doc_text(doc))
+    d_tokens = _tokenize(_doc_text(doc)) if features is None else features.get(doc).tokens
     overlap = len(q_tokens & d_tokens)
     return min(1.0, overlap / max(3, min(12, len(q_tokens))))
 
@@ -170,8 +190,13 @@ def extract_document_date(doc: RetrievedDoc) -> datetime | None | object:
     return UNKNOWN_DATE
 
 
-def freshness_ok(doc: RetrievedDoc, *, max_months: int) -> tuple[bool | None, datetime | None]:
-    doc_date = extract_document_date(doc)
+def freshness_ok(
+    doc: RetrievedDoc,
+    *,
+    max_months: int,
+    features: DocFeatureIndex | None = None,
+) -> tuple[bool | None, datetime | None]:
+    doc_date = extract_document_date(doc) if features is None else features.get(doc).published
     if doc_date is UNKNOWN_DATE:
         return None, None
     if doc_date is None:
@@ -180,12 +205,15 @@ def freshness_ok(doc: RetrievedDoc, *, max_months: int) -> tuple[bool | None, da
     return doc_date >= cutoff, doc_date
 
 
-def is_primary_or_official(doc: RetrievedDoc) -> bool:
+def is_primary_or_official(doc: RetrievedDoc, features: DocFeatureIndex | None = None) -> bool:
     url = normalize_url(doc.url)
     parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
     path = (parsed.path or "").lower()
-    tier = source_tier(doc.url, doc.provider, doc.title).upper()
+    if features is None:
+        tier = source_tier(doc.url, doc.provider, doc.title).upper()
+    else:
+        tier = features.tier(doc).upper()
     page_blob = f"{path} {(doc.title or '').lower()} {(doc.snippet or '').lower()}"
     has_primary_page_hints = any(hint in page_blob for hint in PRIMARY_PAGE_HINTS)
     return (
@@ -210,11 +238,16 @@ def has_deadline_or_cycle_date(doc: RetrievedDoc) -> bool:
     return False
 
 
-def _constraint_match(text: str, constraint: str) -> bool:
+def _constraint_match(
+    text: str,
+    constraint: str,
+    text_tokens: frozenset[str] | set[str] | None = None,
+) -> bool:
     tokens = [tok for tok in _tokenize(constraint) if len(tok) >= 4]
     if not tokens:
         return True
-    text_tokens = _tokenize(text)
+    if text_tokens is None:
+        text_tokens = _tokenize(text)
     overlap = len(set(tokens) & set(text_tokens))
     return overlap >= max(1, min(2, len(tokens)))
 
@@ -248,6 +281,7 @@ def wide_then_hard_filter(
     profile: QueryProfile,
     freshness_max_months: int,
     min_relevance: float = 0.16,
+    features: DocFeatureIndex | None = None,
 ) -> tuple[list[RetrievedDoc], RetrievalFilterStats]:
     stats = RetrievalFilterStats(candidate_count=len(docs))
     seen: set[str] = set()
@@ -262,7 +296,7 @@ def wide_then_hard_filter(
             continue
         seen.add(url)
 
-        text = _doc_text(doc)
+        text = _doc_text(doc) if features is None else features.get(doc).text
         if len(text.split()) < 12:
             stats.filtered_count += 1
             stats.low_signal_count += 1
@@ -272,19 +306,22 @@ def wide_then_hard_filter(
             doc,
             query=query,
             facets=profile.domain_facets,
+            features=features,
         )
         if rel < min_relevance:
             stats.filtered_count += 1
             stats.off_topic_count += 1
             continue
 
-        fresh_flag, doc_date = freshness_ok(doc, max_months=freshness_max_months)
+        fresh_flag, doc_date = freshness_ok(
+            doc, max_months=freshness_max_months, features=features
+        )
         if fresh_flag is False:
             stats.filtered_count += 1
             stats.stale_count += 1
             continue
 
-        open_status = detect_open_status(text)
+        open_status = detect_open_status(text) if features is None else features.get(doc).open_status
         meta = dict(doc.meta or {})
         meta.update(
             {
@@ -302,9 +339,19 @@ def wide_then_hard_filter(
     return kept, stats
 
 
-def corroboration_count(doc: RetrievedDoc, peers: list[RetrievedDoc]) -> int:
+def _header_tokens(doc: RetrievedDoc, features: DocFeatureIndex | None) -> frozenset[str] | set[str]:
+    if features is None:
+        return _tokenize(f"{doc.title} {doc.snippet}")
+    return features.get(doc).header_tokens
+
+
+def corroboration_count(
+    doc: RetrievedDoc,
+    peers: list[RetrievedDoc],
+    features: DocFeatureIndex | None = None,
+) -> int:
     doc_domain = normalized_domain(doc.url)
-    doc_tokens = _tokenize(f"{doc.title} {doc.snippet}")
+    doc_tokens = _header_tokens(doc, features)
     count = 1
     for peer in peers:
         if peer is doc:
@@ -312,12 +359,54 @@ def corroboration_count(doc: RetrievedDoc, peers: list[RetrievedDoc]) -> int:
         peer_domain = normalized_domain(peer.url)
         if not peer_domain or peer_domain == doc_domain:
             continue
-        overlap = len(doc_tokens & _tokenize(f"{peer.title} {peer.snippet}"))
+        overlap = len(doc_tokens & _header_tokens(peer, features))
         if overlap >= 2:
             count += 1
     return count
 
 
+class CorroborationIndex:
+    """Token -> peer postings for counting title/snippet overlap against a fixed peer set.
+
+    ``count(doc)`` equals ``corroboration_count(doc, peers)`` but touches only
+    peers that share a token with ``doc``, and tokenizes each peer once.
+    """
+
+    def __init__(self, peers: Sequence[RetrievedDoc], features: DocFeatureIndex | None = None):
+        self.peers = list(peers)
+        self.features = features
+        self._domains = [normalized_domain(peer.url) for peer in self.peers]
+        self._postings: dict[str, list[int]] = {}
+        for pos, peer in enumerate(self.peers):
+            if not self._domains[pos]:
+                continue  # peers without a domain never corroborate
+            for token in _header_tokens(peer, features):
+                self._postings.setdefault(token, []).append(pos)
+
+    def count(self, doc: RetrievedDoc) -> int:
+        doc_domain = normalized_domain(doc.url)
+        postings = self._postings
+        overlaps = Counter(
+            chain.from_iterable(
+                postings[token] for token in _header_tokens(doc, self.features) if token in postings
+            )
+        )
+        count = 1
+        for pos, overlap in overlaps.items():
+            if overlap >= 2 and self._domains[pos] != doc_domain and self.peers[pos] is not doc:
+                count += 1
+        return count
+
+
+def corroboration_counts(
+    docs: Sequence[RetrievedDoc],
+    peers: Sequence[RetrievedDoc],
+    features: DocFeatureIndex | None = None,
+) -> list[int]:
+    index = CorroborationIndex(peers, features)
+    return [index.count(doc) for doc in docs]
+
+
 def verify_claim(
     *,
     claim_id: str,
@@ -331,26 +420,32 @@ def verify_claim(
     freshness_max_months: int,
     verification_min_sources_per_claim: int,
     require_primary_or_official_proof: bool,
+    features: DocFeatureIndex | None = None,
+    corroboration_index: CorroborationIndex | None = None,
 ) -> ClaimVerificationResult:
     reason_codes: list[str] = []
-    rel_score = relevance_score(doc, query=query, facets=query_profile.domain_facets)
+    rel_score = relevance_score(
+        doc, query=query, facets=query_profile.domain_facets, features=features
+    )
     if rel_score < 0.16:
         return ClaimVerificationResult(
             claim_id=claim_id,
             status="withheld",
             reason_codes=["off_topic"],
             corroboration_count=0,
-            primary_or_official=is_primary_or_official(doc),
+            primary_or_official=is_primary_or_official(doc, features),
             freshness_ok=None,
             open_status="unknown",
             relevance_score=rel_score,
         )
 
-    fresh_flag, _ = freshness_ok(doc, max_months=freshness_max_months)
+    fresh_flag, _ = freshness_ok(doc, max_months=freshness_max_months, features=features)
     if fresh_flag is False:
         reason_codes.append("stale_source")
 
-    open_status = detect_open_status(_doc_text(doc))
+    open_status = (
+        detect_open_status(_doc_text(doc)) if features is None else features.get(doc).open_status
+    )
     needs_open = query_requires_open_availability(
         query_profile,
         availability_policy=availability_policy,
@@ -367,16 +462,26 @@ def verify_claim(
             reason_codes.append("missing_deadline_or_cycle_date")
 
     constraints = dict(query_profile.typed_constraints or {})
-    full_text = f"{doc.title} {doc.snippet} {doc.content}".lower()
+    if features is None:
+        full_text = f"{doc.title} {doc.snippet} {doc.content}".lower()
+        full_tokens = None
+    else:
+        full_text = features.get(doc).full_text
+        full_tokens = features.get(doc).full_tokens
     location_constraint = str(constraints.get("location_constraint", "")).strip()
-    if location_constraint and not _constraint_match(full_text, location_constraint):
+    if location_constraint and not _constraint_match(full_text, location_constraint, full_tokens):
         reason_codes.append("missing_location_match")
     eligibility_constraint = str(constraints.get("eligibility_constraint", "")).strip()
-    if eligibility_constraint and not _constraint_match(full_text, eligibility_constraint):
+    if eligibility_constraint and not _constraint_match(
+        full_text, eligibility_constraint, full_tokens
+    ):
         reason_codes.append("missing_eligibility_match")
 
-    corroboration = corroboration_count(doc, peers)
-    has_primary = is_primary_or_official(doc)
+    if corroboration_index is not None:
+        corroboration = corroboration_index.count(doc)
+    else:
+        corroboration = corroboration_count(doc, peers, features)
+    has_primary = is_primary_or_official(doc, features)
     if require_primary_or_official_proof and not has_primary:
         reason_codes.append("missing_primary_or_official_proof")
     if corroboration < max(1, verification_min_sources_per_claim):
@@ -399,3 +504,28 @@ def verify_claim(
         open_status=open_status,
         relevance_score=rel_score,
     )
+
+
+def verify_claims(
+    claims: Sequence[tuple[str, RetrievedDoc]],
+    *,
+    peers: list[RetrievedDoc],
+    features: DocFeatureIndex | None = None,
+    **options: Any,
+) -> list[ClaimVerificationResult]:
+    """Verify ``(claim_id, doc)`` pairs against one peer set, indexing the peers once.
+
+    ``options`` are the remaining keyword arguments of ``verify_claim``.
+    """
+    index = CorroborationIndex(peers, features)
+    return [
+        verify_claim(
+            claim_id=claim_id,
+            doc=doc,
+            peers=peers,
+            features=features,
+            corroboration_index=index,
+            **options,
+        )
+        for claim_id, doc in claims
+    ]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from core.citations import normalized_domain
+from core.concurrency import bounded_fan_out
+from core.content_store import content_length
+from core.domain_index import DomainClassifier
+from core.models import RetrievedDoc
+from core.source_quality import is_low_trust_source
+from graph.runtime import GraphRuntime
+
+
+def select_enrichment_targets(
+    docs: list[RetrievedDoc],
+    top_n: int,
+    *,
+    classifier: DomainClassifier | None = None,
+) -> list[RetrievedDoc]:
+    """Pick the first ``top_n`` distinct Tier A/B web hits that still lack full text."""
+    targets: list[RetrievedDoc] = []
+    seen: set[str] = set()
+    for doc in docs:
+        if len(targets) >= top_n:
+            break
+        meta = doc.meta or {}
+        if doc.provider not in {"tavily", "ddg"} or meta.get("full_text"):
+            continue
+        if str(meta.get("source_tier", "unknown")) not in {"A", "B"}:
+            continue
+        if not doc.url or doc.url in seen or is_low_trust_source(
+            doc.url, doc.title, classifier=classifier
+        ):
+            continue
+        seen.add(doc.url)
+        targets.append(doc)
+    return targets
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    return text.encode("utf-8")[: max(0, max_bytes)].decode("utf-8", errors="ignore")
+
+
+def enrich_with_firecrawl(
+    runtime: GraphRuntime,
+    docs: list[RetrievedDoc],
+) -> tuple[list[RetrievedDoc], dict[str, int]]:
+    """Replace snippet-only content of the best sources with Firecrawl full text.
+
+    Extraction fans out across URLs, holds at most
+    ``firecrawl_per_domain_concurrency`` requests per host, and stops accepting
+    text once ``firecrawl_total_byte_budget`` bytes have been taken. Each call
+    reserves an even share of the budget before it is issued, so no request
+    is paid for only to have its text dropped; a URL that finds nothing left
+    to reserve is skipped without a call.
+    """
+    config = runtime.config
+    stats = {
+        "target_count": 0,
+        "enriched_count": 0,
+        "failed_count": 0,
+        "budget_skipped_count": 0,
+        "cache_hit_count": 0,
+        "bytes": 0,
+    }
+    if config.firecrawl_enrich_top_n <= 0 or not config.firecrawl_api_key:
+        return docs, stats
+    targets = select_enrichment_targets(
+        docs, config.firecrawl_enrich_top_n, classifier=runtime.domain_classifier
+    )
+    stats["target_count"] = len(targets)
+    if not targets:
+        return docs, stats
+
+    per_domain = max(1, config.firecrawl_per_domain_concurrency)
+    domain_gates = {
+        domain: threading.BoundedSemaphore(per_domain)
+        for domain in {normalized_domain(doc.url) for doc in targets}
+    }
+    budget = max(0, config.firecrawl_total_byte_budget)
+    share = max(1, budget // len(targets))
+    budget_lock = threading.Lock()
+    spent = {"bytes": 0, "reserved": 0}
+
+    def extract(doc: RetrievedDoc) -> tuple[str, dict[str, Any]] | None:
+        with budget_lock:
+            reservation = min(share, budget - spent["bytes"] - spent["reserved"])
+            if reservation <= 0:
+                return None
+            spent["reserved"] += reservation
+        try:
+            with domain_gates[normalized_domain(doc.url)]:
+                extracted = runtime.mcp_client.call_web_tool("firecrawl_extract", doc.url, "extract")
+        except Exception:
+            with budget_lock:
+                spent["reserved"] -= reservation
+            raise
+        full = next(
+            (item for item in extracted if item.provider == "firecrawl" and item.content.strip()),
+            None,
+        )
+        with budget_lock:
+            spent["reserved"] -= reservation
+            if full is not None:
+                # Its own reservation plus whatever no in-flight call has claimed.
+                text = _truncate_utf8(full.content, budget - spent["bytes"] - spent["reserved"])
+                spent["bytes"] += len(text.encode("utf-8"))
+        if full is None:
+            raise RuntimeError(f"no firecrawl content for {doc.url}")
+        return text, dict(full.meta or {})
+
+    results = bounded_fan_out(extract, targets, max_workers=config.research_query_concurrency)
+    enriched: dict[str, RetrievedDoc] = {}
+    for result in results:
+        doc = result.item
+        if not result.ok:
+            stats["failed_count"] += 1
+            continue
+        if result.value is None:
+            stats["budget_skipped_count"] += 1
+            continue
+        text, extract_meta = result.value
+        if len(text) <= content_length(doc):
+            continue
+        if extract_meta.get("extract_cache") in {"hit", "revalidated"}:
+            stats["cache_hit_count"] += 1
+        enriched[doc.url] = doc.model_copy(
+            update={
+                "content": text,
+                "meta": {**(doc.meta or {}), "full_text": True, "enriched_by": "firecrawl"},
+            }
+        )
+    stats["enriched_count"] = len(enriched)
+    stats["bytes"] = spent["bytes"]
+    return [enriched.get(doc.url, doc) for doc in docs], stats
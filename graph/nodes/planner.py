@@ -5,6 +5,7 @@ import re
 from agents.planner import generate_plan, generate_subtopics
 from core.models import QueryProfile, SubTopic, TaskSpec
 from core.query_profile import profile_query, safe_analysis_policy
+from graph.nodes.retrieval import provider_plan
 from graph.runtime import GraphRuntime
 from graph.state import ResearchState
 
@@ -332,6 +333,10 @@ def create_planner_node(runtime: GraphRuntime):
             "query_profile": query_profile,
             "memory_docs": memory_docs,
             "firecrawl_requested": firecrawl_requested,
+            # Planned once here so lane dispatch and every lane read the same allowances.
+            "provider_plan": provider_plan(
+                runtime, {**state, "firecrawl_requested": firecrawl_requested}
+            ),
             "metrics": {
                 "query_normalization": {
                     "original_query": query,
@@ -4,9 +4,17 @@ from urllib.parse import urlparse
 
 from core.citations import normalize_url
 from core.models import TaskSpec
+from core.query_planning import collapse_near_duplicate_queries
 from core.query_profile import safe_analysis_policy
 from core.source_quality import prioritize_docs
 from core.verification import RetrievalFilterStats, wide_then_hard_filter
+from graph.nodes.retrieval import (
+    cap_state_docs,
+    evidence_floor_check,
+    fetch_web_queries,
+    lane_query_demand,
+    provider_plan,
+)
 from graph.runtime import GraphRuntime
 from graph.state import ResearchState
 
@@ -116,14 +124,32 @@ def create_research_ddg_node(runtime: GraphRuntime):
             facets=facets,
             policy=policy,
         )
-        top_n_queries = 4 if peak_mode else 3 if deep else 2
+        task_queries, query_dedup = collapse_near_duplicate_queries(
+            task_queries, threshold=runtime.config.query_dedup_threshold
+        )
+        top_n_queries = min(
+            lane_query_demand(runtime.config, state)["ddg"],
+            provider_plan(runtime, state).get("ddg", 0),
+        )
         k = 10 if peak_mode else 8 if deep else 5
 
-        docs = []
-        aggregate_stats = RetrievalFilterStats()
-        for query in task_queries[:top_n_queries]:
-            docs.extend(runtime.mcp_client.call_web_tool("ddg_search", query, k))
+        aggregate_stats = RetrievalFilterStats(deduped_query_count=len(query_dedup))
+        planned_queries = task_queries[:top_n_queries]
+        docs, query_latencies = fetch_web_queries(
+            runtime,
+            "ddg_search",
+            planned_queries,
+            k,
+            stop_when=evidence_floor_check(
+                runtime,
+                min_tier_ab=max(
+                    runtime.config.min_tier_ab_sources,
+                    runtime.config.min_ab_sources if peak_mode else 0,
+                ),
+            ),
+        )
         aggregate_stats.candidate_count = len(docs)
+        aggregate_stats.skipped_query_count = len(planned_queries) - len(query_latencies)
         provider_alerts: list[str] = []
         if any(
             getattr(doc, "provider", "") == "fallback"
@@ -140,6 +166,7 @@ def create_research_ddg_node(runtime: GraphRuntime):
                 query=effective_query,
                 profile=query_profile,
                 freshness_max_months=runtime.config.freshness_max_months,
+                features=runtime.doc_features(state.get("run_id", "")),
             )
             if not docs and normalized_docs:
                 docs = normalized_docs[: min(len(normalized_docs), 6 if deep else 3)]
@@ -152,6 +179,7 @@ def create_research_ddg_node(runtime: GraphRuntime):
             docs,
             source_quality_bar=runtime.config.source_quality_bar,
             min_tier_ab_sources=runtime.config.min_tier_ab_sources,
+            classifier=runtime.domain_classifier,
         )
         if (
             runtime.config.source_quality_bar == "high_confidence"
@@ -162,6 +190,7 @@ def create_research_ddg_node(runtime: GraphRuntime):
                 normalized_docs,
                 source_quality_bar="broad",
                 min_tier_ab_sources=0,
+                classifier=runtime.domain_classifier,
             )
             existing_urls = {
                 normalize_url(getattr(doc, "url", ""))
@@ -178,9 +207,26 @@ def create_research_ddg_node(runtime: GraphRuntime):
                 if _tier_ab_count(docs) >= runtime.config.min_tier_ab_sources:
                     break
         if peak_mode and _tier_ab_count(docs) < runtime.config.min_ab_sources:
-            retry_docs: list = []
-            for query in _peak_refocus_queries(effective_query, facets)[:2]:
-                retry_docs.extend(runtime.mcp_client.call_web_tool("ddg_search", query, max(8, k)))
+            refocus_queries, refocus_dedup = collapse_near_duplicate_queries(
+                _peak_refocus_queries(effective_query, facets),
+                issued=[str(entry["query"]) for entry in query_latencies],
+                threshold=runtime.config.query_dedup_threshold,
+            )
+            refocus_queries = refocus_queries[:2]
+            query_dedup.extend(refocus_dedup)
+            aggregate_stats.deduped_query_count += len(refocus_dedup)
+            retry_docs, retry_latencies = fetch_web_queries(
+                runtime,
+                "ddg_search",
+                refocus_queries,
+                max(8, k),
+                stop_when=evidence_floor_check(
+                    runtime,
+                    min_tier_ab=max(0, runtime.config.min_ab_sources - _tier_ab_count(docs)),
+                ),
+            )
+            query_latencies.extend(retry_latencies)
+            aggregate_stats.skipped_query_count += len(refocus_queries) - len(retry_latencies)
             aggregate_stats.candidate_count += len(retry_docs)
             retry_normalized = _normalize_docs(retry_docs, deep=True)
             retry_docs = retry_normalized
@@ -190,6 +236,7 @@ def create_research_ddg_node(runtime: GraphRuntime):
                     query=effective_query,
                     profile=query_profile,
                     freshness_max_months=runtime.config.freshness_max_months,
+                    features=runtime.doc_features(state.get("run_id", "")),
                 )
                 if not retry_docs and retry_normalized:
                     retry_docs = retry_normalized[: min(len(retry_normalized), 6)]
@@ -203,6 +250,7 @@ def create_research_ddg_node(runtime: GraphRuntime):
                 docs,
                 source_quality_bar="high_confidence",
                 min_tier_ab_sources=max(runtime.config.min_tier_ab_sources, runtime.config.min_ab_sources),
+                classifier=runtime.domain_classifier,
             )
         aggregate_stats.kept_count = len(docs)
         aggregate_stats.filtered_count = max(
@@ -215,15 +263,18 @@ def create_research_ddg_node(runtime: GraphRuntime):
             "Collected ddg docs",
             payload={
                 "doc_count": len(docs),
-                "query_count": min(len(task_queries), top_n_queries),
+                "query_count": len(query_latencies),
                 "k": k,
                 "retrieval_stats": aggregate_stats.as_dict(),
+                "query_latencies": query_latencies,
+                "query_dedup": query_dedup,
             },
         )
         return {
-            "ddg_docs": docs,
+            "ddg_docs": cap_state_docs(runtime, state, docs),
             "ddg_retrieval_stats": aggregate_stats.as_dict(),
             "provider_alerts": provider_alerts,
+            "query_dedup": [{"lane": "ddg", **decision} for decision in query_dedup],
             "logs": [f"DDG researcher collected {len(docs)} docs."],
         }
 
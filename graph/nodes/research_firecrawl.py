@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import re
+from time import perf_counter
 
 from core.source_quality import prioritize_docs
 from core.verification import RetrievalFilterStats, wide_then_hard_filter
+from graph.nodes.retrieval import cap_state_docs, record_provider_call
 from graph.runtime import GraphRuntime
 from graph.state import ResearchState
 
@@ -22,7 +24,11 @@ def create_research_firecrawl_node(runtime: GraphRuntime):
             }
 
         target = _extract_url(state["query"]) or state["query"]
+        started = perf_counter()
         docs = runtime.mcp_client.call_web_tool("firecrawl_extract", target, "extract")
+        record_provider_call(
+            runtime, "firecrawl_extract", (perf_counter() - started) * 1000.0, docs
+        )
         query_profile = state.get("query_profile")
         aggregate_stats = RetrievalFilterStats(candidate_count=len(docs))
         if query_profile and runtime.config.crawl_strategy in {"wide_then_filter", "aggressive"}:
@@ -31,6 +37,7 @@ def create_research_firecrawl_node(runtime: GraphRuntime):
                 query=query_profile.normalized_query or state["query"],
                 profile=query_profile,
                 freshness_max_months=runtime.config.freshness_max_months,
+                features=runtime.doc_features(state.get("run_id", "")),
                 min_relevance=0.1,
             )
             aggregate_stats.filtered_count += filter_stats.filtered_count
@@ -50,6 +57,7 @@ def create_research_firecrawl_node(runtime: GraphRuntime):
             min_tier_ab_sources=max(runtime.config.min_tier_ab_sources, runtime.config.min_ab_sources)
             if runtime.config.primary_source_policy == "strict"
             else runtime.config.min_tier_ab_sources,
+            classifier=runtime.domain_classifier,
         )
         aggregate_stats.kept_count = len(docs)
         aggregate_stats.filtered_count = max(
@@ -63,7 +71,7 @@ def create_research_firecrawl_node(runtime: GraphRuntime):
             payload={"doc_count": len(docs), "retrieval_stats": aggregate_stats.as_dict()},
         )
         return {
-            "firecrawl_docs": docs,
+            "firecrawl_docs": cap_state_docs(runtime, state, docs),
             "firecrawl_retrieval_stats": aggregate_stats.as_dict(),
             "logs": [f"Firecrawl researcher collected {len(docs)} docs."],
         }
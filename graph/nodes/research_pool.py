@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from core.citations import normalize_url
+import time
+
+from core.bm25 import BM25Index
+from core.concurrency import FanOutResult, run_with_deadline
+from core.doc_record import DocRecord, doc_records
+from core.domain_index import DomainClassifier
+from core.metrics import record_near_duplicates
 from core.models import RetrievedDoc
-from core.source_quality import filter_docs_for_query, prioritize_docs
+from core.near_dup import near_duplicate_groups
+from core.run_artifacts import CORPUS_BM25
+from core.source_quality import filter_docs_for_query, prioritize_docs, tier_rank
+from graph.nodes.firecrawl_enrich import enrich_with_firecrawl
 from graph.nodes.research_ddg import create_research_ddg_node
 from graph.nodes.research_firecrawl import create_research_firecrawl_node
 from graph.nodes.research_tavily import create_research_tavily_node
+from graph.nodes.retrieval import cap_state_docs, provider_plan
 from graph.runtime import GraphRuntime
 from graph.state import ResearchState
 
@@ -25,6 +35,8 @@ def _merge_stats(*stats: dict[str, int] | None) -> dict[str, int]:
         "stale_count": 0,
         "off_topic_count": 0,
         "low_signal_count": 0,
+        "skipped_query_count": 0,
+        "deduped_query_count": 0,
     }
     for item in stats:
         if not item:
@@ -34,16 +46,54 @@ def _merge_stats(*stats: dict[str, int] | None) -> dict[str, int]:
     return merged
 
 
-def _dedupe_docs(docs: list[RetrievedDoc]) -> list[RetrievedDoc]:
+def _lane_updates(result: FanOutResult | None) -> dict:
+    # Lanes the scheduler skipped have no result at all.
+    if result is None:
+        return {}
+    return dict(result.value or {})
+
+
+def _keep_rank(record: DocRecord) -> tuple[int, int, float]:
+    return (tier_rank(record.tier), 0 if record.low_trust else 1, float(record.doc.score or 0.0))
+
+
+def _dedupe_docs(
+    docs: list[RetrievedDoc],
+    classifier: DomainClassifier | None = None,
+    *,
+    near_dup_threshold: float = 0.0,
+) -> tuple[list[RetrievedDoc], int]:
+    """Drop repeated canonical URLs, then collapse near-duplicate content.
+
+    Each near-duplicate cluster keeps its best-tier copy at the position of
+    its first member. Returns the docs and the number of collapsed copies.
+    """
     seen_urls: set[str] = set()
-    out: list[RetrievedDoc] = []
-    for doc in docs:
-        url = normalize_url(getattr(doc, "url", ""))
-        if not url or url in seen_urls:
+    records: list[DocRecord] = []
+    for record in doc_records(docs, classifier=classifier):
+        if not record.url or record.url in seen_urls:
             continue
-        seen_urls.add(url)
-        out.append(doc.model_copy(update={"url": url}))
-    return out
+        seen_urls.add(record.url)
+        records.append(record)
+    if near_dup_threshold > 0 and len(records) > 1:
+        groups = near_duplicate_groups(
+            [record.doc.content or record.doc.snippet for record in records],
+            threshold=near_dup_threshold,
+        )
+        keep: dict[int, int] = {}
+        for pos, group in enumerate(groups):
+            current = keep.get(group)
+            if current is None or _keep_rank(records[pos]) > _keep_rank(records[current]):
+                keep[group] = pos
+        collapsed = len(records) - len(keep)
+        records = [records[keep[group]] for group in sorted(keep)]
+    else:
+        collapsed = 0
+    out: list[RetrievedDoc] = []
+    for record in records:
+        doc = record.doc
+        out.append(doc if doc.url == record.url else doc.model_copy(update={"url": record.url}))
+    return out, collapsed
 
 
 def create_research_pool_node(runtime: GraphRuntime):
@@ -51,10 +101,41 @@ def create_research_pool_node(runtime: GraphRuntime):
     ddg_node = create_research_ddg_node(runtime)
     firecrawl_node = create_research_firecrawl_node(runtime)
 
+    lane_nodes = {"tavily": tavily_node, "ddg": ddg_node, "firecrawl": firecrawl_node}
+
     def research_pool_node(state: ResearchState) -> dict:
-        tavily_updates = tavily_node(state)
-        ddg_updates = ddg_node(state)
-        firecrawl_updates = firecrawl_node(state)
+        # One plan per dispatch so every lane sees the same allowances.
+        plan = provider_plan(runtime, state)
+        lane_state = {**state, "provider_plan": plan}
+        lane_results = run_with_deadline(
+            {
+                lane: (lambda node=node: node(lane_state))
+                for lane, node in lane_nodes.items()
+                if plan.get(lane, 0) > 0
+            },
+            deadline_seconds=runtime.config.research_lane_deadline_seconds,
+        )
+        if lane_results and all(not result.ok for result in lane_results.values()):
+            # Nothing to merge; surface the first lane failure as the serial path did.
+            for result in lane_results.values():
+                if not isinstance(result.error, TimeoutError):
+                    raise result.error  # type: ignore[misc]
+            first = next(iter(lane_results.values()))
+            raise TimeoutError(
+                f"research_pool_all_lanes_timed_out: {', '.join(lane_results)}"
+            ) from first.error
+        lane_alerts: list[str] = []
+        for lane, result in lane_results.items():
+            if isinstance(result.error, TimeoutError):
+                lane_alerts.append(f"lane_deadline_exceeded:{lane}")
+            elif result.error is not None:
+                lane_alerts.append(f"lane_failed:{lane}")
+        tavily_updates = _lane_updates(lane_results.get("tavily"))
+        ddg_updates = _lane_updates(lane_results.get("ddg"))
+        firecrawl_updates = _lane_updates(lane_results.get("firecrawl"))
+        lane_latency_ms = {
+            lane: round(result.latency_ms, 1) for lane, result in lane_results.items()
+        }
 
         tavily_docs = list(tavily_updates.get("tavily_docs", []))
         ddg_docs = list(ddg_updates.get("ddg_docs", []))
@@ -66,11 +147,19 @@ def create_research_pool_node(runtime: GraphRuntime):
                     *list(tavily_updates.get("provider_alerts", [])),
                     *list(ddg_updates.get("provider_alerts", [])),
                     *list(firecrawl_updates.get("provider_alerts", [])),
+                    *lane_alerts,
                 ]
             )
         )
 
-        shared_pool = _dedupe_docs([*tavily_docs, *ddg_docs, *firecrawl_docs])
+        shared_pool, near_duplicates = _dedupe_docs(
+            [*tavily_docs, *ddg_docs, *firecrawl_docs],
+            runtime.domain_classifier,
+            near_dup_threshold=(
+                runtime.config.near_dup_threshold if runtime.config.near_dup_enabled else 0.0
+            ),
+        )
+        record_near_duplicates(near_duplicates)
         source_quality_bar = (
             "high_confidence"
             if runtime.config.primary_source_policy == "strict"
@@ -84,7 +173,11 @@ def create_research_pool_node(runtime: GraphRuntime):
             min_tier_ab_sources=max(runtime.config.min_tier_ab_sources, runtime.config.min_ab_sources)
             if runtime.config.primary_source_policy == "strict"
             else runtime.config.min_tier_ab_sources,
+            classifier=runtime.domain_classifier,
         )
+        shared_pool, enrichment_stats = enrich_with_firecrawl(runtime, shared_pool)
+        # Enrichment brings in full pages; cap them before anything is indexed or sent.
+        shared_pool = cap_state_docs(runtime, state, shared_pool)
         off_topic_stats = {"off_topic_count": 0}
         query_profile = state.get("query_profile")
         if query_profile is not None:
@@ -92,10 +185,25 @@ def create_research_pool_node(runtime: GraphRuntime):
                 shared_pool,
                 query_profile,
                 min_term_hits=2 if runtime.config.fact_mode == "strict" else 1,
+                features=runtime.doc_features(state.get("run_id", "")),
             )
             # Keep strict filtering when we retained relevant documents.
             if filtered_pool:
                 shared_pool = filtered_pool
+        corpus_index_ms = 0.0
+        if runtime.config.subtopic_slice_ranker == "bm25" and shared_pool:
+            # Built once here; every sub_research branch queries it instead of re-scoring the pool.
+            started = time.perf_counter()
+            runtime.artifacts.put(
+                state["run_id"],
+                CORPUS_BM25,
+                BM25Index(
+                    shared_pool,
+                    title_weight=runtime.config.bm25_title_weight,
+                    features=runtime.doc_features(state.get("run_id", "")),
+                ),
+            )
+            corpus_index_ms = round((time.perf_counter() - started) * 1000.0, 1)
         retrieval_stats = _merge_stats(
             tavily_updates.get("tavily_retrieval_stats"),
             ddg_updates.get("ddg_retrieval_stats"),
@@ -121,6 +229,12 @@ def create_research_pool_node(runtime: GraphRuntime):
                 "ddg_docs": len(ddg_docs),
                 "firecrawl_docs": len(firecrawl_docs),
                 "retrieval_stats": retrieval_stats,
+                "lane_latency_ms": lane_latency_ms,
+                "lane_alerts": lane_alerts,
+                "firecrawl_enrichment": enrichment_stats,
+                "provider_plan": plan,
+                "corpus_index_ms": corpus_index_ms,
+                "near_duplicates_collapsed": near_duplicates,
             },
         )
         metrics = dict(state.get("metrics", {}))
@@ -134,6 +248,10 @@ def create_research_pool_node(runtime: GraphRuntime):
                 "retrieval_stats": retrieval_stats,
                 "provider_alerts": provider_alerts,
                 "provider_recovery_actions": list(dict.fromkeys(provider_recovery_actions)),
+                "research_lane_latency_ms": lane_latency_ms,
+                "firecrawl_enrichment": enrichment_stats,
+                "provider_plan": plan,
+                "near_duplicates_collapsed": near_duplicates,
             }
         )
         return {
@@ -141,7 +259,13 @@ def create_research_pool_node(runtime: GraphRuntime):
             **ddg_updates,
             **firecrawl_updates,
             "provider_alerts": provider_alerts,
-            "shared_corpus_docs": shared_pool,
+            "provider_plan": plan,
+            "query_dedup": [
+                *tavily_updates.get("query_dedup", []),
+                *ddg_updates.get("query_dedup", []),
+            ],
+            # By reference: branches resolve IDs against the run's doc store.
+            "shared_corpus_ids": runtime.doc_store(state["run_id"]).put_many(shared_pool),
             "subtopic_metrics": {
                 "retrieval_stats": retrieval_stats,
                 "provider_alerts": provider_alerts,
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+
+from core.citations import normalize_url, normalized_domain
+from core.concurrency import bounded_fan_out, raise_first_error
+from core.content_store import cap_doc_content
+from core.models import RetrievedDoc, RunConfig
+from core.rank_fusion import reciprocal_rank_fusion
+from graph.runtime import GraphRuntime
+from graph.state import ResearchState
+
+
+def evidence_floor_met(
+    docs: list[RetrievedDoc],
+    *,
+    min_tier_ab: int,
+    min_domains: int,
+) -> bool:
+    """True once ``docs`` hold enough distinct Tier A/B URLs across enough domains."""
+    ab_urls: set[str] = set()
+    domains: set[str] = set()
+    for doc in docs:
+        if doc.provider == "fallback":
+            continue
+        url = normalize_url(doc.url)
+        if not url:
+            continue
+        domains.add(normalized_domain(url))
+        if str((doc.meta or {}).get("source_tier", "unknown")) in {"A", "B"}:
+            ab_urls.add(url)
+    return len(ab_urls) >= min_tier_ab and len(domains) >= min_domains
+
+
+def evidence_floor_check(
+    runtime: GraphRuntime,
+    *,
+    min_tier_ab: int,
+) -> Callable[[list[RetrievedDoc]], bool] | None:
+    if not runtime.config.retrieval_early_stop_enabled:
+        return None
+    min_domains = runtime.config.retrieval_early_stop_min_domains
+    return lambda docs: evidence_floor_met(
+        docs, min_tier_ab=min_tier_ab, min_domains=min_domains
+    )
+
+
+def lane_query_demand(config: RunConfig, state: ResearchState) -> dict[str, int]:
+    """Queries each research lane would issue with no scheduler limits."""
+    peak_mode = config.research_mode == "peak"
+    deep = config.research_depth == "deep" or peak_mode
+    top_n = 4 if peak_mode else 3 if deep else 2
+    return {
+        "tavily": top_n,
+        "ddg": top_n,
+        "firecrawl": 1 if state.get("firecrawl_requested", False) else 0,
+    }
+
+
+def provider_plan(runtime: GraphRuntime, state: ResearchState) -> dict[str, int]:
+    """Per-provider query allowance, reusing a plan already placed in ``state``."""
+    plan = state.get("provider_plan")
+    if plan:
+        return dict(plan)
+    demand = lane_query_demand(runtime.config, state)
+    if runtime.scheduler is None:
+        return demand
+    return runtime.scheduler.plan(
+        demand,
+        latency_budget_seconds=runtime.config.research_lane_deadline_seconds,
+    )
+
+
+def cap_state_docs(
+    runtime: GraphRuntime,
+    state: ResearchState,
+    docs: list[RetrievedDoc],
+) -> list[RetrievedDoc]:
+    """Docs as they enter graph state: content cut to the evidence window.
+
+    Longer page text moves to the run's content store, so state, ``Send``
+    payloads and checkpoints stay bounded by ``doc_content_max_chars``.
+    """
+    return cap_doc_content(
+        docs,
+        runtime.content_store(state.get("run_id", "")),
+        runtime.config.doc_content_max_chars,
+    )
+
+
+def shared_corpus(runtime: GraphRuntime, state: ResearchState) -> list[RetrievedDoc]:
+    """The shared corpus docs behind ``state["shared_corpus_ids"]``."""
+    ids = state.get("shared_corpus_ids") or []
+    if not ids:
+        return []
+    return runtime.doc_store(state.get("run_id", "")).get_many(ids)
+
+
+def record_provider_call(
+    runtime: GraphRuntime,
+    tool_name: str,
+    latency_ms: float,
+    docs: list[RetrievedDoc] | None,
+) -> None:
+    # Calls that only produced fallback docs count as provider errors.
+    if runtime.scheduler is None:
+        return
+    ok = any(doc.provider != "fallback" for doc in docs or [])
+    runtime.scheduler.record(tool_name, latency_ms, ok)
+
+
+def fetch_web_queries(
+    runtime: GraphRuntime,
+    tool_name: str,
+    queries: list[str],
+    k: int,
+    *,
+    stop_when: Callable[[list[RetrievedDoc]], bool] | None = None,
+) -> tuple[list[RetrievedDoc], list[dict[str, object]]]:
+    """Issue one web tool call per query concurrently and merge in query order.
+
+    Provider limiters inside the web server still gate every call, so the
+    fan-out width only bounds how many calls may wait on them at once.
+
+    With ``stop_when``, the first query runs alone and the rest follow in
+    fan-out-width batches; no further batch is issued once ``stop_when``
+    accepts the docs gathered so far. Only issued queries get a latency
+    entry, so ``len(queries) - len(latencies)`` is the number skipped.
+    """
+    width = max(1, runtime.config.research_query_concurrency)
+    if stop_when is None:
+        batches = [queries]
+    else:
+        rest = queries[1:]
+        batches = [queries[:1], *(rest[idx : idx + width] for idx in range(0, len(rest), width))]
+    docs: list[RetrievedDoc] = []
+    latencies: list[dict[str, object]] = []
+    for batch in batches:
+        if latencies and stop_when is not None and stop_when(docs):
+            break
+        results = bounded_fan_out(
+            lambda query: runtime.mcp_client.call_web_tool(tool_name, query, k),
+            batch,
+            max_workers=width,
+        )
+        raise_first_error(results)
+        for result in results:
+            batch_docs = list(result.value or [])
+            record_provider_call(runtime, tool_name, result.latency_ms, batch_docs)
+            docs.extend(batch_docs)
+            latencies.append(
+                {
+                    "query": result.item,
+                    "latency_ms": round(result.latency_ms, 1),
+                    "doc_count": len(batch_docs),
+                }
+            )
+    return docs, latencies
+
+
+def federated_search(
+    runtime: GraphRuntime,
+    query: str,
+    k: int,
+    *,
+    tools: tuple[str, ...] = ("tavily_search", "ddg_search"),
+) -> list[RetrievedDoc]:
+    """Send ``query`` to every tool at once and fuse the rankings into the top ``k``.
+
+    Each provider is asked for ``ceil(k * federated_provider_k_ratio)`` results;
+    overlap between providers makes up the rest of the recall.
+    """
+    ratio = max(0.1, runtime.config.federated_provider_k_ratio)
+    provider_k = max(1, math.ceil(k * ratio))
+    results = bounded_fan_out(
+        lambda tool_name: runtime.mcp_client.call_web_tool(tool_name, query, provider_k),
+        list(tools),
+        max_workers=len(tools),
+    )
+    raise_first_error(results)
+    ranked: list[list[RetrievedDoc]] = []
+    for result in results:
+        docs = list(result.value or [])
+        record_provider_call(runtime, result.item, result.latency_ms, docs)
+        ranked.append(docs)
+    return reciprocal_rank_fusion(
+        ranked,
+        limit=k,
+        rank_constant=runtime.config.federated_rrf_constant,
+    )
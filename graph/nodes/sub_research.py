@@ -4,12 +4,17 @@ import re
 from typing import Any
 
 from agents.prompts import SUB_RESEARCH_PROMPT
+from core.bm25 import BM25Index
 from core.citations import normalize_url
 from core.claim_extractor import extract_claims
+from core.doc_features import DocFeatureIndex
 from core.models import Citation, ClaimRecord, RetrievedDoc, SubReport, SubTopic
+from core.query_planning import collapse_near_duplicate_queries
 from core.query_profile import profile_query
+from core.run_artifacts import CORPUS_BM25
 from core.source_quality import clean_evidence_text, prioritize_docs, source_tier
-from core.verification import relevance_score, verify_claim
+from core.verification import relevance_score, verify_claims
+from graph.nodes.retrieval import federated_search, shared_corpus
 from graph.runtime import GraphRuntime
 from graph.state import ResearchState
 
@@ -53,19 +58,26 @@ def _slice_docs(
     subtopic: SubTopic,
     query_profile,
     max_docs: int,
+    features: DocFeatureIndex | None = None,
+    bm25: BM25Index | None = None,
 ) -> list[RetrievedDoc]:
     facets = list(dict.fromkeys([*query_profile.domain_facets, *_facet_tokens(subtopic)]))
-    ranked = sorted(
-        docs,
-        key=lambda doc: (
-            -relevance_score(
-                doc,
-                query=subtopic.sub_query,
-                facets=facets,
+    if bm25 is not None:
+        # Extra head room for the per-domain cap below; the iterator extends lazily past it.
+        ranked = bm25.ranked(subtopic.sub_query, facets, k=max_docs * 3)
+    else:
+        ranked = sorted(
+            docs,
+            key=lambda doc: (
+                -relevance_score(
+                    doc,
+                    query=subtopic.sub_query,
+                    facets=facets,
+                    features=features,
+                ),
+                -float(doc.score or 0.0),
             ),
-            -float(doc.score or 0.0),
-        ),
-    )
+        )
     out: list[RetrievedDoc] = []
     seen_domains: set[str] = set()
     for doc in ranked:
@@ -89,17 +101,21 @@ def _gapfill_docs(
     query_profile,
     max_queries: int,
     k: int,
-) -> list[RetrievedDoc]:
+) -> tuple[list[RetrievedDoc], list[dict[str, object]]]:
     docs: list[RetrievedDoc] = []
     facet_hint = " ".join((query_profile.domain_facets or [])[:3]).strip()
-    gap_queries = [
-        f"{subtopic.sub_query} primary source official evidence {facet_hint}".strip(),
-        f"{subtopic.sub_query} contradiction limitation counterevidence".strip(),
-    ]
+    # The trailing facet query only runs when an earlier one collapses as a near-duplicate.
+    gap_queries, query_dedup = collapse_near_duplicate_queries(
+        [
+            f"{subtopic.sub_query} primary source official evidence {facet_hint}".strip(),
+            f"{subtopic.sub_query} contradiction limitation counterevidence".strip(),
+            f"{subtopic.sub_query} {subtopic.facet} independent analysis".strip(),
+        ],
+        threshold=runtime.config.query_dedup_threshold,
+    )
     for query in gap_queries[: max(0, max_queries)]:
-        docs.extend(runtime.mcp_client.call_web_tool("ddg_search", query, k))
-        docs.extend(runtime.mcp_client.call_web_tool("tavily_search", query, k))
-    return docs
+        docs.extend(federated_search(runtime, query, k, tools=("ddg_search", "tavily_search")))
+    return docs, query_dedup
 
 
 def _build_subreport_fallback(subtopic: SubTopic, reason: str) -> SubReport:
@@ -244,35 +260,46 @@ def create_sub_research_node(runtime: GraphRuntime):
                 "logs": ["Sub-research branch skipped: no subtopic payload."],
             }
         query_profile = state.get("query_profile") or profile_query(state["query"])
-        shared_docs = list(state.get("shared_corpus_docs", []))
+        shared_docs = shared_corpus(runtime, state)
+        corpus_bm25 = None
+        if shared_docs and runtime.config.subtopic_slice_ranker == "bm25":
+            corpus_bm25 = runtime.artifacts.get(state.get("run_id", ""), CORPUS_BM25)
+            if corpus_bm25 is not None and not corpus_bm25.covers(shared_docs):
+                corpus_bm25 = None
         slice_docs = _slice_docs(
             shared_docs,
             subtopic=subtopic,
             query_profile=query_profile,
             max_docs=10,
+            features=runtime.doc_features(state.get("run_id", "")),
+            bm25=corpus_bm25,
         )
+        query_dedup: list[dict[str, object]] = []
         if (
             runtime.config.subreport_gapfill_enabled
             and len(slice_docs) < max(4, runtime.config.subreport_min_claims)
         ):
-            gapfill = _gapfill_docs(
+            gapfill, gap_dedup = _gapfill_docs(
                 runtime,
                 subtopic=subtopic,
                 query_profile=query_profile,
                 max_queries=runtime.config.subreport_gapfill_max_queries,
                 k=5,
             )
+            query_dedup = [{"lane": f"gapfill:{subtopic.id}", **item} for item in gap_dedup]
             merged = [*slice_docs, *gapfill]
             merged = prioritize_docs(
                 merged,
                 source_quality_bar=runtime.config.source_quality_bar,
                 min_tier_ab_sources=runtime.config.min_tier_ab_sources,
+                classifier=runtime.domain_classifier,
             )
             slice_docs = _slice_docs(
                 merged,
                 subtopic=subtopic,
                 query_profile=query_profile,
                 max_docs=12,
+                features=runtime.doc_features(state.get("run_id", "")),
             )
         if not slice_docs:
             if runtime.config.subreport_failure_policy == "fail_closed":
@@ -366,27 +393,31 @@ def create_sub_research_node(runtime: GraphRuntime):
         missing_fields: set[str] = set()
         constrained_count = 0
         verified_count = 0
+        sources_by_url: dict[str, RetrievedDoc] = {}
+        for doc in slice_docs:
+            sources_by_url.setdefault(normalize_url(doc.url), doc)
+        claim_sources: list[tuple[str, RetrievedDoc]] = []
         for idx, claim in enumerate(extracted_claims, start=1):
-            claim_id = f"C{sub_index * 100 + idx}"
-            source_doc = next(
-                (doc for doc in slice_docs if normalize_url(doc.url) == normalize_url(claim.source_url)),
-                None,
-            )
+            source_doc = sources_by_url.get(normalize_url(claim.source_url))
             if source_doc is None:
                 source_doc = slice_docs[min(idx - 1, len(slice_docs) - 1)]
-            verified = verify_claim(
-                claim_id=claim_id,
-                doc=source_doc,
-                peers=slice_docs,
-                query_profile=query_profile,
-                query=subtopic.sub_query,
-                availability_policy=runtime.config.availability_policy,
-                availability_enforcement_scope=runtime.config.availability_enforcement_scope,
-                opportunity_query_detection=runtime.config.opportunity_query_detection,
-                freshness_max_months=runtime.config.freshness_max_months,
-                verification_min_sources_per_claim=runtime.config.verification_min_sources_per_claim,
-                require_primary_or_official_proof=runtime.config.require_primary_or_official_proof,
-            )
+            claim_sources.append((f"C{sub_index * 100 + idx}", source_doc))
+        verified_claims = verify_claims(
+            claim_sources,
+            peers=slice_docs,
+            query_profile=query_profile,
+            query=subtopic.sub_query,
+            availability_policy=runtime.config.availability_policy,
+            availability_enforcement_scope=runtime.config.availability_enforcement_scope,
+            opportunity_query_detection=runtime.config.opportunity_query_detection,
+            freshness_max_months=runtime.config.freshness_max_months,
+            verification_min_sources_per_claim=runtime.config.verification_min_sources_per_claim,
+            require_primary_or_official_proof=runtime.config.require_primary_or_official_proof,
+            features=runtime.doc_features(state.get("run_id", "")),
+        )
+        for claim, (claim_id, source_doc), verified in zip(
+            extracted_claims, claim_sources, verified_claims, strict=True
+        ):
             claim_records.append(
                 ClaimRecord(
                     claim_id=claim_id,
@@ -403,7 +434,12 @@ def create_sub_research_node(runtime: GraphRuntime):
                     title=source_doc.title,
                     provider=source_doc.provider,
                     evidence=clean_evidence_text(claim.evidence or source_doc.snippet or source_doc.content, max_chars=runtime.config.max_evidence_quote_chars),
-                    source_tier=source_tier(source_doc.url, source_doc.provider, source_doc.title),  # type: ignore[arg-type]
+                    source_tier=source_tier(
+                        source_doc.url,
+                        source_doc.provider,
+                        source_doc.title,
+                        classifier=runtime.domain_classifier,
+                    ),  # type: ignore[arg-type]
                     confidence="high" if verified.status == "verified" else "medium" if verified.status == "constrained" else "low",
                 )
             )
@@ -457,10 +493,12 @@ def create_sub_research_node(runtime: GraphRuntime):
                 "verified_count": verified_count,
                 "constrained_count": constrained_count,
                 "confidence": confidence,
+                "query_dedup": query_dedup,
             },
         )
         return {
             "sub_reports": [sub_report],
+            "query_dedup": query_dedup,
             "logs": [f"Subtopic {subtopic.id} completed with {len(claim_records)} claims."],
         }
 
@@ -17,11 +17,11 @@ from core.citations import (
 )
 from core.claim_extractor import extract_claims
 from core.models import Citation, SubReport
-from core.pruning import prune_context_docs
 from core.query_profile import profile_query, safe_analysis_policy
 from core.report_formatter import build_fail_closed_report, format_report_with_sources
 from core.report_quality import assess_report_quality
 from core.source_quality import clean_evidence_text, prioritize_docs
+from graph.nodes.retrieval import shared_corpus
 from graph.runtime import GraphRuntime
 from graph.state import ResearchState
 
@@ -301,11 +301,12 @@ def create_synthesizer_node(runtime: GraphRuntime):
     def synthesizer_node(state: ResearchState) -> dict:
         # Subtopic map-reduce path: merge branch sub-reports as primary synthesis input.
         sub_reports = [SubReport.model_validate(item) for item in list(state.get("sub_reports", []))]
+        corpus_ids = state.get("shared_corpus_ids", [])
         map_reduce_active = runtime.config.subtopic_mode == "map_reduce" and bool(
-            state.get("subtopics") or state.get("sub_reports") or state.get("shared_corpus_docs")
+            state.get("subtopics") or state.get("sub_reports") or corpus_ids
         )
 
-        if map_reduce_active and state.get("subtopics") and not state.get("shared_corpus_docs"):
+        if map_reduce_active and state.get("subtopics") and not corpus_ids:
             report = build_fail_closed_report(
                 state["query"],
                 reason="No citable external sources were retrieved.",
@@ -334,7 +335,7 @@ def create_synthesizer_node(runtime: GraphRuntime):
                     state=state,
                     citations=[],
                     reason="all_subtopics_failed",
-                    kept_count=len(state.get("shared_corpus_docs", [])),
+                    kept_count=len(corpus_ids),
                 ),
                 "status": "synthesized",
                 "logs": ["All subtopic branches failed; generated fail-closed draft."],
@@ -385,12 +386,12 @@ def create_synthesizer_node(runtime: GraphRuntime):
                 else:
                     report, citations, _ = build_analytical_fallback(
                         state["query"],
-                        list(state.get("shared_corpus_docs", [])),
+                        shared_corpus(runtime, state),
                     )
             if not citations:
                 _, citations, _ = build_analytical_fallback(
                     state["query"],
-                    list(state.get("shared_corpus_docs", [])),
+                    shared_corpus(runtime, state),
                 )
             conflict_rows = _conflict_pairs(sub_reports)
             report = _ensure_conflict_reconciliation_section(
@@ -448,7 +449,7 @@ def create_synthesizer_node(runtime: GraphRuntime):
                 state=state,
                 citations=citations,
                 min_claims_target=runtime.config.min_claims_deep,
-                kept_count=len(state.get("shared_corpus_docs", [])),
+                kept_count=len(corpus_ids),
             )
             metrics.update(
                 {
@@ -509,14 +510,22 @@ def create_synthesizer_node(runtime: GraphRuntime):
             external_pool,
             source_quality_bar=effective_source_quality_bar(runtime),
             min_tier_ab_sources=effective_min_ab_sources(runtime),
+            classifier=runtime.domain_classifier,
         )[: 20 if deep_mode else 8]
         if not citable_docs and external_pool:
             citable_docs = external_pool[: 20 if deep_mode else 8]
 
-        pruned_docs = prune_context_docs(
+        pruned_docs, prune_stats = runtime.context_pruner.prune(
             citable_docs,
             per_doc_tokens=max(runtime.config.per_doc_tokens, 320),
             total_tokens=max(runtime.config.total_context_tokens, 2600),
+            content_store=runtime.content_store(state.get("run_id", "")),
+        )
+        runtime.tracer.event(
+            state.get("run_id", ""),
+            "synthesizer",
+            "Context docs pruned",
+            payload={"context_prune": prune_stats.as_dict()},
         )
         if not pruned_docs:
             pruned_docs = list(citable_docs)
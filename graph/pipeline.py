@@ -27,6 +27,7 @@ from graph.nodes.research_ddg import create_research_ddg_node
 from graph.nodes.research_firecrawl import create_research_firecrawl_node
 from graph.nodes.research_pool import create_research_pool_node
 from graph.nodes.research_tavily import create_research_tavily_node
+from graph.nodes.retrieval import provider_plan
 from graph.nodes.self_correction import create_self_correction_node
 from graph.nodes.sub_research import create_sub_research_node
 from graph.nodes.synthesizer import create_synthesizer_node
@@ -67,7 +68,7 @@ def build_initial_state(query: str, runtime: GraphRuntime) -> ResearchState:
         "logs": [f"Run started at {now}"],
         "tasks": [],
         "subtopics": [],
-        "shared_corpus_docs": [],
+        "shared_corpus_ids": [],
         "sub_reports": [],
         "subtopic_failures": [],
         "subtopic_metrics": {},
@@ -82,6 +83,7 @@ def build_initial_state(query: str, runtime: GraphRuntime) -> ResearchState:
         "tavily_retrieval_stats": {},
         "ddg_retrieval_stats": {},
         "firecrawl_retrieval_stats": {},
+        "query_dedup": [],
         "context_docs": [],
         "memory_docs": [],
         "provider_alerts": [],
@@ -94,6 +96,7 @@ def build_initial_state(query: str, runtime: GraphRuntime) -> ResearchState:
         "needs_correction": False,
         "low_confidence": False,
         "firecrawl_requested": False,
+        "provider_plan": {},
         "hitl_decision": "accept",
         "hitl_retry_used": False,
         "metrics": {},
@@ -126,7 +129,7 @@ def _minimal_distributed_state(
         "logs": logs or [],
         "tasks": [],
         "subtopics": [],
-        "shared_corpus_docs": [],
+        "shared_corpus_ids": [],
         "sub_reports": [],
         "subtopic_failures": [],
         "subtopic_metrics": {},
@@ -136,6 +139,7 @@ def _minimal_distributed_state(
         "tavily_retrieval_stats": {},
         "ddg_retrieval_stats": {},
         "firecrawl_retrieval_stats": {},
+        "query_dedup": [],
         "context_docs": [],
         "memory_docs": [],
         "provider_alerts": [],
@@ -148,6 +152,7 @@ def _minimal_distributed_state(
         "needs_correction": False,
         "low_confidence": False,
         "firecrawl_requested": False,
+        "provider_plan": {},
         "hitl_decision": "accept",
         "hitl_retry_used": False,
         "metrics": {},
@@ -171,6 +176,15 @@ def _route_after_hitl(state: ResearchState) -> str:
     return "finalize"
 
 
+def _dispatch_lanes(runtime: GraphRuntime):
+    def route(state: ResearchState) -> list[str]:
+        plan = provider_plan(runtime, state)
+        lanes = [f"research_{lane}" for lane in ("tavily", "ddg", "firecrawl") if plan.get(lane, 0) > 0]
+        return lanes or ["research_tavily"]
+
+    return route
+
+
 def _dispatch_subresearch(state: ResearchState):
     subtopics = list(state.get("subtopics", []))
     if not subtopics:
@@ -190,7 +204,7 @@ def _dispatch_subresearch(state: ResearchState):
                     "run_id": state.get("run_id", ""),
                     "query": state.get("query", ""),
                     "query_profile": state.get("query_profile"),
-                    "shared_corpus_docs": state.get("shared_corpus_docs", []),
+                    "shared_corpus_ids": state.get("shared_corpus_ids", []),
                     "subtopics": state.get("subtopics", []),
                     "tenant_context": state.get("tenant_context"),
                     "subtopic_id": subtopic_id,
@@ -353,7 +367,7 @@ def create_finalize_node(runtime: GraphRuntime):
                 "tavily": len(state.get("tavily_docs", [])) > 0,
                 "ddg": len(state.get("ddg_docs", [])) > 0,
                 "firecrawl": len(state.get("firecrawl_docs", [])) > 0,
-                "research_pool": len(state.get("shared_corpus_docs", [])) > 0,
+                "research_pool": len(state.get("shared_corpus_ids", [])) > 0,
                 "sub_research": len(state.get("sub_reports", [])) > 0,
             },
             "provider_mix": provider_mix,
@@ -475,9 +489,11 @@ def build_graph(
         builder.add_conditional_edges("research_pool", _dispatch_subresearch)
         builder.add_edge("sub_research", "synthesizer")
     else:
-        builder.add_edge("planner", "research_tavily")
-        builder.add_edge("planner", "research_ddg")
-        builder.add_edge("planner", "research_firecrawl")
+        builder.add_conditional_edges(
+            "planner",
+            _dispatch_lanes(runtime),
+            ["research_tavily", "research_ddg", "research_firecrawl"],
+        )
         builder.add_edge("research_tavily", "synthesizer")
         builder.add_edge("research_ddg", "synthesizer")
         builder.add_edge("research_firecrawl", "synthesizer")
@@ -601,5 +617,7 @@ def run_graph(
     # Local synchronous execution
     graph = build_graph(runtime, hitl_input_provider=hitl_input_provider)
     initial_state = build_initial_state(query, runtime)
-    final_state = graph.invoke(initial_state)
-    return final_state
+    try:
+        return graph.invoke(initial_state)
+    finally:
+        runtime.artifacts.discard(initial_state["run_id"])
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from agents.model_router import ModelRouter
 from core.config import load_config
+from core.content_store import ContentStore
+from core.doc_features import DocFeatureIndex
+from core.doc_store import DocStore
+from core.domain_index import DomainClassifier, domain_classifier_for
 from core.metrics import ensure_metrics_server
 from core.models import RunConfig
 from core.observability import TraceManager, configure_logger
+from core.pruning import ContextPruner
+from core.run_artifacts import CONTENT_STORE, DOC_FEATURES, DOC_STORE, RunArtifacts
 from mcp_server.client import MultiServerClient
+from mcp_server.plugin_registry import ProviderScheduler
 from memory.chroma_store import ChromaMemoryStore
 
 
@@ -18,8 +25,20 @@ class GraphRuntime:
     memory_store: ChromaMemoryStore
     tracer: TraceManager
     model_router: ModelRouter
+    scheduler: ProviderScheduler | None = None
+    domain_classifier: DomainClassifier | None = None
+    context_pruner: ContextPruner | None = None
+    artifacts: RunArtifacts = field(default_factory=RunArtifacts)
     started: bool = False
 
+    def __post_init__(self) -> None:
+        if self.scheduler is None:
+            self.scheduler = ProviderScheduler.for_server(self.config, self.mcp_client.web_server)
+        if self.domain_classifier is None:
+            self.domain_classifier = domain_classifier_for(self.config)
+        if self.context_pruner is None:
+            self.context_pruner = ContextPruner.from_config(self.config)
+
     @classmethod
     def from_config(cls, config: RunConfig | None = None) -> GraphRuntime:
         cfg = config or load_config()
@@ -51,6 +70,9 @@ class GraphRuntime:
         if not self.started:
             return
         self.mcp_client.close()
+        self.artifacts.clear()
+        if self.context_pruner is not None:
+            self.context_pruner.close()
         self.started = False
 
     def __enter__(self) -> GraphRuntime:
@@ -60,6 +82,17 @@ class GraphRuntime:
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
 
+    def content_store(self, run_id: str) -> ContentStore:
+        return self.artifacts.setdefault(run_id, CONTENT_STORE, ContentStore)
+
+    def doc_store(self, run_id: str) -> DocStore:
+        return self.artifacts.setdefault(run_id, DOC_STORE, DocStore)
+
+    def doc_features(self, run_id: str) -> DocFeatureIndex:
+        return self.artifacts.setdefault(
+            run_id, DOC_FEATURES, lambda: DocFeatureIndex(classifier=self.domain_classifier)
+        )
+
     def get_llm_client(self, provider: str, *, request_timeout_seconds: int | None = None):
         timeout = request_timeout_seconds if request_timeout_seconds and request_timeout_seconds > 0 else None
         if provider == "openai":
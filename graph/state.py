@@ -28,7 +28,7 @@ class ResearchState(BaseState, total=False):
     query_profile: QueryProfile
     tasks: list[TaskSpec]
     subtopics: list[SubTopic]
-    shared_corpus_docs: Annotated[list[RetrievedDoc], add]
+    shared_corpus_ids: list[str]
     sub_reports: Annotated[list[SubReport], add]
     subtopic_failures: Annotated[list[str], add]
     subtopic_metrics: dict[str, object]
@@ -38,6 +38,7 @@ class ResearchState(BaseState, total=False):
     tavily_retrieval_stats: dict[str, int]
     ddg_retrieval_stats: dict[str, int]
     firecrawl_retrieval_stats: dict[str, int]
+    query_dedup: Annotated[list[dict[str, object]], add]
     context_docs: Annotated[list[RetrievedDoc], add]
     memory_docs: Annotated[list[RetrievedDoc], add]
     provider_alerts: Annotated[list[str], add]
@@ -50,6 +51,7 @@ class ResearchState(BaseState, total=False):
     needs_correction: bool
     low_confidence: bool
     firecrawl_requested: bool
+    provider_plan: dict[str, int]
     hitl_decision: str
     hitl_retry_used: bool
     metrics: dict[str, object]
@@ -223,6 +223,8 @@ def _report_meta(
             "filtered_count": int(retrieval_stats_metric.get("filtered_count", 0)),
             "kept_count": int(retrieval_stats_metric.get("kept_count", len(citations))),
             "stale_count": int(retrieval_stats_metric.get("stale_count", 0)),
+            "skipped_query_count": int(retrieval_stats_metric.get("skipped_query_count", 0)),
+            "deduped_query_count": int(retrieval_stats_metric.get("deduped_query_count", 0)),
         }
     else:
         retrieval_stats = {
@@ -230,6 +232,8 @@ def _report_meta(
             "filtered_count": 0,
             "kept_count": len(citations),
             "stale_count": 0,
+            "skipped_query_count": 0,
+            "deduped_query_count": 0,
         }
     verification_stats_metric = state_metrics.get("verification_stats")
     if isinstance(verification_stats_metric, dict):
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import threading
 from collections.abc import Callable
 from dataclasses import dataclass
 from time import perf_counter
@@ -8,7 +10,9 @@ from typing import Any
 from core.metrics import record_mcp_call, record_transport_fallback
 from core.models import RetrievedDoc, RunConfig
 from core.rate_limit import CircuitBreaker
+from core.singleflight import SingleFlight
 from mcp_server.local_server import LocalMCPServer
+from mcp_server.search_cache import normalize_query
 from mcp_server.transport_runtime import TransportRuntime
 from mcp_server.web_server import WebMCPServer
 
@@ -39,6 +43,13 @@ def _web_tool_arguments(tool_name: str, args: tuple[Any, ...], kwargs: dict[str,
     return {}
 
 
+def _singleflight_key(tool_name: str, arguments: dict[str, Any]) -> str:
+    normalized = dict(arguments)
+    if isinstance(normalized.get("query"), str):
+        normalized["query"] = normalize_query(normalized["query"])
+    return json.dumps([tool_name, normalized], sort_keys=True, default=str)
+
+
 def _local_tool_arguments(tool_name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
     if kwargs:
         return dict(kwargs)
@@ -71,8 +82,10 @@ class MultiServerClient:
         self.web_server = web_server
         self.local_server = local_server
         self.transport_runtime = transport_runtime
-        self.web_breaker = CircuitBreaker(threshold=3, recovery_seconds=45)
-        self.local_breaker = CircuitBreaker(threshold=3, recovery_seconds=45)
+        # One breaker per server+tool so a failing provider cannot trip its siblings.
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._breaker_lock = threading.Lock()
+        self.web_flight = SingleFlight("client")
         self.transport_active = False
         self.fallback_active = config.mcp_mode == "inprocess"
         self.fallback_reason = "forced inprocess mode" if self.fallback_active else ""
@@ -92,6 +105,7 @@ class MultiServerClient:
     def close(self) -> None:
         if self.transport_runtime is not None:
             self.transport_runtime.close()
+        self.web_server.close()
         self.transport_active = False
 
     def _enable_transport(self) -> None:
@@ -169,6 +183,19 @@ class MultiServerClient:
             local_endpoint=local_endpoint,
         )
 
+    def _breaker(self, server: str, tool_name: str) -> CircuitBreaker:
+        key = f"{server}:{tool_name}"
+        with self._breaker_lock:
+            breaker = self.breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(threshold=3, recovery_seconds=45, name=key)
+                self.breakers[key] = breaker
+            return breaker
+
+    def breaker_states(self) -> dict[str, str]:
+        with self._breaker_lock:
+            return {key: breaker.state for key, breaker in self.breakers.items()}
+
     def _invoke(
         self,
         breaker: CircuitBreaker,
@@ -241,14 +268,26 @@ class MultiServerClient:
     def _call_inprocess_web(self, tool_name: str, *args: Any, **kwargs: Any) -> list[RetrievedDoc]:
         primary = getattr(self.web_server, tool_name)
         fallback = self._fallback_web_tool(tool_name)
-        return self._invoke(self.web_breaker, primary, fallback, *args, **kwargs)
+        return self._invoke(self._breaker("web", tool_name), primary, fallback, *args, **kwargs)
 
     def _call_inprocess_local(self, tool_name: str, *args: Any, **kwargs: Any) -> Any:
         primary = getattr(self.local_server, tool_name)
         fallback = self._fallback_local_tool(tool_name)
-        return self._invoke(self.local_breaker, primary, fallback, *args, **kwargs)
+        return self._invoke(self._breaker("local", tool_name), primary, fallback, *args, **kwargs)
 
     def call_web_tool(self, tool_name: str, *args: Any, **kwargs: Any) -> list[RetrievedDoc]:
+        if not self.config.singleflight_enabled:
+            return self._call_web_tool(tool_name, *args, **kwargs)
+        key = _singleflight_key(tool_name, _web_tool_arguments(tool_name, args, kwargs))
+        value, shared = self.web_flight.do(
+            key,
+            lambda: self._call_web_tool(tool_name, *args, **kwargs),
+            label=tool_name,
+        )
+        # Coalesced callers get their own list so appends never leak across branches.
+        return list(value) if shared else value
+
+    def _call_web_tool(self, tool_name: str, *args: Any, **kwargs: Any) -> list[RetrievedDoc]:
         started = perf_counter()
         transport_name = (
             self.config.mcp_transport
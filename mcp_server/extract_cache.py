@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from core.models import RetrievedDoc, RunConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extract_cache (
+    cache_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    last_modified TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    byte_size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_extract_cache_accessed ON extract_cache (accessed_at);
+"""
+
+
+def extract_key(url: str, mode: str) -> str:
+    return sha1(f"{url}\x1f{mode}".encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class ExtractCacheEntry:
+    docs: list[RetrievedDoc]
+    etag: str
+    last_modified: str
+    fetched_at: float
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def is_fresh(self, ttl_seconds: int) -> bool:
+        return ttl_seconds > 0 and time.time() - self.fetched_at <= ttl_seconds
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ExtractCache:
+    """Per-URL extraction cache revalidated against origin ETag/Last-Modified."""
+
+    def __init__(self, path: str | Path, *, ttl_seconds: int, max_entries: int = 2000):
+        self.path = Path(path)
+        self.ttl_seconds = max(0, int(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_config(cls, config: RunConfig) -> ExtractCache:
+        return cls(
+            Path(config.data_dir) / "extract_cache.sqlite3",
+            ttl_seconds=config.firecrawl_cache_ttl_seconds,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url: str, mode: str) -> ExtractCacheEntry | None:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT payload, etag, last_modified, fetched_at FROM extract_cache "
+                "WHERE cache_key = ?",
+                (extract_key(url, mode),),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            docs = [RetrievedDoc.model_validate(item) for item in json.loads(row[0])]
+        except Exception:  # noqa: BLE001
+            return None
+        return ExtractCacheEntry(
+            docs=docs, etag=row[1], last_modified=row[2], fetched_at=float(row[3])
+        )
+
+    def put(
+        self,
+        url: str,
+        mode: str,
+        docs: list[RetrievedDoc],
+        *,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> None:
+        if not docs or any(doc.provider == "fallback" for doc in docs):
+            return
+        payload = json.dumps([doc.model_dump(mode="json") for doc in docs], ensure_ascii=True)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO extract_cache "
+                "(cache_key, url, mode, etag, last_modified, payload, byte_size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (extract_key(url, mode), url, mode, etag, last_modified, payload, len(payload), now, now),
+            )
+            overflow = conn.execute("SELECT COUNT(*) FROM extract_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM extract_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM extract_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+            conn.commit()
+
+    def touch(self, url: str, mode: str, *, etag: str = "", last_modified: str = "") -> None:
+        """Mark a revalidated entry fresh again, keeping any newer validators."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE extract_cache SET fetched_at = ?, accessed_at = ?, "
+                "etag = CASE WHEN ? != '' THEN ? ELSE etag END, "
+                "last_modified = CASE WHEN ? != '' THEN ? ELSE last_modified END "
+                "WHERE cache_key = ?",
+                (now, now, etag, etag, last_modified, last_modified, extract_key(url, mode)),
+            )
+            conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(byte_size), 0) FROM extract_cache"
+            ).fetchone()
+        return {"entries": int(row[0]), "bytes": int(row[1])}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,15 +1,66 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Protocol
 
-from core.models import RetrievedDoc
+from core.models import RetrievedDoc, RunConfig
+from core.rate_limit import RateLimiter
 from mcp_server.web_server import WebMCPServer
 
 
+class RollingCallStats:
+    """Latency and error rate over the last ``window`` calls to one provider."""
+
+    def __init__(self, window: int = 50):
+        self._calls: deque[tuple[float, bool]] = deque(maxlen=max(1, window))
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        with self._lock:
+            self._calls.append((max(0.0, float(latency_ms)), bool(ok)))
+
+    def snapshot(self) -> tuple[int, float, float]:
+        """Return ``(samples, mean_latency_ms, error_rate)``."""
+        with self._lock:
+            calls = list(self._calls)
+        if not calls:
+            return 0, 0.0, 0.0
+        latency = sum(item[0] for item in calls) / len(calls)
+        errors = sum(1 for item in calls if not item[1])
+        return len(calls), latency, errors / len(calls)
+
+
+@dataclass(slots=True)
+class ProviderHealth:
+    name: str
+    samples: int
+    latency_ms: float
+    error_rate: float
+    remaining_tokens: float | None
+    cost_per_call: float
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "samples": self.samples,
+            "latency_ms": round(self.latency_ms, 1),
+            "error_rate": round(self.error_rate, 3),
+            "remaining_tokens": (
+                None if self.remaining_tokens is None else round(self.remaining_tokens, 2)
+            ),
+            "cost_per_call": self.cost_per_call,
+        }
+
+
 class ResearchToolPlugin(Protocol):
     name: str
     description: str
+    tool_name: str
+    rpm: int
+    cost_per_call: float
+    default_latency_ms: float
+    stats: RollingCallStats
 
     def search(self, query: str, k: int) -> list[RetrievedDoc]:
         ...
@@ -17,35 +68,218 @@ class ResearchToolPlugin(Protocol):
     def estimate_cost(self, query: str, k: int) -> float:
         ...
 
+    def remaining_tokens(self) -> float | None:
+        ...
+
+    def health(self) -> ProviderHealth:
+        ...
+
+
+class _PluginBase:
+    __slots__ = ()
+
+    name: str
+    limiter: RateLimiter
+    cost_per_call: float
+    stats: RollingCallStats
+
+    def estimate_cost(self, query: str, k: int) -> float:
+        return self.cost_per_call
+
+    def remaining_tokens(self) -> float | None:
+        return self.limiter.available_tokens()
+
+    def health(self) -> ProviderHealth:
+        samples, latency_ms, error_rate = self.stats.snapshot()
+        return ProviderHealth(
+            name=self.name,
+            samples=samples,
+            latency_ms=latency_ms,
+            error_rate=error_rate,
+            remaining_tokens=self.remaining_tokens(),
+            cost_per_call=self.cost_per_call,
+        )
+
 
 @dataclass(slots=True)
-class TavilyPlugin:
+class TavilyPlugin(_PluginBase):
     server: WebMCPServer
     name: str = "tavily"
     description: str = "AI-focused web search"
+    tool_name: str = "tavily_search"
+    default_latency_ms: float = 2500.0
+    stats: RollingCallStats = field(default_factory=RollingCallStats)
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self.server.tavily_limiter
+
+    @property
+    def rpm(self) -> int:
+        return self.server.config.tavily_rpm
+
+    @property
+    def cost_per_call(self) -> float:
+        return self.server.config.tavily_cost_per_call
 
     def search(self, query: str, k: int) -> list[RetrievedDoc]:
         return self.server.tavily_search(query=query, k=k)
 
-    def estimate_cost(self, query: str, k: int) -> float:
-        return 0.0
-
 
 @dataclass(slots=True)
-class DDGPlugin:
+class DDGPlugin(_PluginBase):
     server: WebMCPServer
     name: str = "ddg"
     description: str = "General free web search"
+    tool_name: str = "ddg_search"
+    default_latency_ms: float = 1500.0
+    stats: RollingCallStats = field(default_factory=RollingCallStats)
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self.server.ddg_limiter
+
+    @property
+    def rpm(self) -> int:
+        return self.server.config.ddg_rpm
+
+    @property
+    def cost_per_call(self) -> float:
+        return 0.0
 
     def search(self, query: str, k: int) -> list[RetrievedDoc]:
         return self.server.ddg_search(query=query, k=k)
 
-    def estimate_cost(self, query: str, k: int) -> float:
-        return 0.0
+
+@dataclass(slots=True)
+class FirecrawlPlugin(_PluginBase):
+    server: WebMCPServer
+    name: str = "firecrawl"
+    description: str = "Full-page extraction"
+    tool_name: str = "firecrawl_extract"
+    default_latency_ms: float = 8000.0
+    stats: RollingCallStats = field(default_factory=RollingCallStats)
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self.server.firecrawl_limiter
+
+    @property
+    def rpm(self) -> int:
+        return self.server.config.firecrawl_rpm
+
+    @property
+    def cost_per_call(self) -> float:
+        return self.server.config.firecrawl_cost_per_call
+
+    def search(self, query: str, k: int) -> list[RetrievedDoc]:
+        return self.server.firecrawl_extract(query, "extract")[:k]
 
 
 def build_plugin_registry(server: WebMCPServer) -> dict[str, ResearchToolPlugin]:
     return {
         "tavily": TavilyPlugin(server),
         "ddg": DDGPlugin(server),
+        "firecrawl": FirecrawlPlugin(server),
     }
+
+
+_SCHEDULER_LOCK = threading.Lock()
+
+
+class ProviderScheduler:
+    """Decide which providers to query, and how often, from live plugin health.
+
+    Each provider's query count is the smallest of the requested count, what
+    its rolling latency fits into the latency budget at ``concurrency`` calls
+    in flight, and what its rate limiter can serve within that budget. A
+    provider whose error rate reaches ``max_error_rate`` gets no queries, and
+    a positive ``cost_budget`` is spent on the cheapest providers first.
+    Unmeasured providers use the plugin's default latency, and at least one
+    requested provider always keeps one query.
+    """
+
+    def __init__(
+        self,
+        plugins: dict[str, ResearchToolPlugin],
+        *,
+        concurrency: int = 4,
+        max_error_rate: float = 0.5,
+        min_samples: int = 3,
+        cost_budget: float = 0.0,
+    ):
+        self.plugins = plugins
+        self.concurrency = max(1, int(concurrency))
+        self.max_error_rate = max(0.0, float(max_error_rate))
+        self.min_samples = max(1, int(min_samples))
+        self.cost_budget = max(0.0, float(cost_budget))
+        self._by_tool = {plugin.tool_name: plugin for plugin in plugins.values()}
+
+    @classmethod
+    def from_config(cls, config: RunConfig, server: WebMCPServer) -> ProviderScheduler:
+        return cls(
+            build_plugin_registry(server),
+            concurrency=config.research_query_concurrency,
+            max_error_rate=config.provider_max_error_rate,
+            cost_budget=config.research_cost_budget,
+        )
+
+    @classmethod
+    def for_server(cls, config: RunConfig, server: WebMCPServer) -> ProviderScheduler:
+        """The scheduler kept on ``server``, built on first use.
+
+        Call stats belong to the long-lived web server rather than to a graph
+        runtime, so each run plans from what earlier runs measured.
+        """
+        with _SCHEDULER_LOCK:
+            if server.provider_scheduler is None:
+                server.provider_scheduler = cls.from_config(config, server)
+            return server.provider_scheduler
+
+    def record(self, tool_name: str, latency_ms: float, ok: bool) -> None:
+        plugin = self._by_tool.get(tool_name) or self.plugins.get(tool_name)
+        if plugin is not None:
+            plugin.stats.record(latency_ms, ok)
+
+    def health(self) -> dict[str, ProviderHealth]:
+        return {name: plugin.health() for name, plugin in self.plugins.items()}
+
+    def _unhealthy(self, health: ProviderHealth) -> bool:
+        return health.samples >= self.min_samples and health.error_rate >= self.max_error_rate
+
+    def plan(self, demand: dict[str, int], *, latency_budget_seconds: float) -> dict[str, int]:
+        health = {name: self.plugins[name].health() for name in demand if name in self.plugins}
+        budget_ms = max(0.0, float(latency_budget_seconds)) * 1000.0
+        plan: dict[str, int] = {}
+        for name, requested in demand.items():
+            info = health.get(name)
+            if info is None or requested <= 0 or self._unhealthy(info):
+                plan[name] = 0
+                continue
+            count = int(requested)
+            if budget_ms > 0:
+                plugin = self.plugins[name]
+                latency_ms = info.latency_ms if info.samples else plugin.default_latency_ms
+                rounds = int(budget_ms // max(1.0, latency_ms))
+                count = min(count, max(1, rounds * self.concurrency))
+                if info.remaining_tokens is not None:
+                    refill = plugin.rpm / 60.0 * (budget_ms / 1000.0)
+                    count = min(count, max(1, int(info.remaining_tokens + refill)))
+            plan[name] = count
+
+        if self.cost_budget > 0:
+            remaining = self.cost_budget
+            for name in sorted(plan, key=lambda item: health[item].cost_per_call if item in health else 0.0):
+                cost = health[name].cost_per_call if name in health else 0.0
+                if cost <= 0 or plan[name] == 0:
+                    continue
+                affordable = int(remaining // cost)
+                plan[name] = min(plan[name], affordable)
+                remaining -= plan[name] * cost
+
+        if demand and not any(plan.values()):
+            candidates = [name for name in demand if demand[name] > 0 and name in health]
+            if candidates:
+                best = min(candidates, key=lambda name: (health[name].error_rate, health[name].cost_per_call))
+                plan[best] = 1
+        return plan
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from core.metrics import record_search_cache
+from core.models import RetrievedDoc, RunConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    cache_key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    query TEXT NOT NULL,
+    k INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at);
+"""
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r"\s+", " ", (query or "").strip().lower())
+
+
+def cache_key(provider: str, query: str, k: int, variant: str = "") -> str:
+    # ``variant`` carries request options that change what the provider returns.
+    raw = f"{provider.strip().lower()}\x1f{normalize_query(query)}\x1f{int(k)}\x1f{variant}"
+    return sha1(raw.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """Disk-backed provider result cache with per-provider TTLs and LRU eviction."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: dict[str, int],
+        max_entries: int = 5000,
+        bypass: bool = False,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = {key.lower(): max(0, int(value)) for key, value in ttl_seconds.items()}
+        self.max_entries = max(1, int(max_entries))
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_config(cls, config: RunConfig) -> SearchResultCache:
+        return cls(
+            Path(config.data_dir) / "search_cache.sqlite3",
+            ttl_seconds={
+                "tavily": config.search_cache_ttl_seconds_tavily,
+                "ddg": config.search_cache_ttl_seconds_ddg,
+            },
+            max_entries=config.search_cache_max_entries,
+            bypass=config.search_cache_bypass,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # Callers hold self._lock; reopened lazily so close() is not terminal.
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _ttl(self, provider: str) -> int:
+        return self.ttl_seconds.get(provider.lower(), 0)
+
+    def get(
+        self,
+        provider: str,
+        query: str,
+        k: int,
+        variant: str = "",
+    ) -> list[RetrievedDoc] | None:
+        ttl = self._ttl(provider)
+        if ttl <= 0:
+            return None
+        if self.bypass:
+            record_search_cache(provider, "bypass")
+            return None
+        key = cache_key(provider, query, k, variant)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, created_at FROM search_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - float(row[1]) > ttl:
+                if row is not None:
+                    conn.execute("DELETE FROM search_cache WHERE cache_key = ?", (key,))
+                    conn.commit()
+                self.misses += 1
+                record_search_cache(provider, "miss")
+                return None
+            conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            conn.commit()
+            self.hits += 1
+        record_search_cache(provider, "hit")
+        try:
+            return [RetrievedDoc.model_validate(item) for item in json.loads(row[0])]
+        except Exception:  # noqa: BLE001
+            return None
+
+    def put(
+        self,
+        provider: str,
+        query: str,
+        k: int,
+        docs: list[RetrievedDoc],
+        variant: str = "",
+    ) -> None:
+        if self._ttl(provider) <= 0 or not docs:
+            return
+        # Degraded responses must be retried live next time, never replayed.
+        if any(doc.provider == "fallback" for doc in docs):
+            return
+        payload = json.dumps([doc.model_dump(mode="json") for doc in docs], ensure_ascii=True)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(cache_key, provider, query, k, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key(provider, query, k, variant),
+                    provider.lower(),
+                    normalize_query(query),
+                    int(k),
+                    payload,
+                    now,
+                    now,
+                ),
+            )
+            overflow = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM search_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM search_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+            conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = self._connection().execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entries": int(entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
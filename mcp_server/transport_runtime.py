@@ -136,7 +136,6 @@ class _ManagedSession:
         self._start_error: Exception | None = None
         self._session: ClientSession | None = None
         self._shutdown_event: asyncio.Event | None = None
-        self._call_lock: asyncio.Lock | None = None
 
     @property
     def is_running(self) -> bool:
@@ -183,7 +182,6 @@ class _ManagedSession:
                 ) as session:
                     await session.initialize()
                     self._session = session
-                    self._call_lock = asyncio.Lock()
                     self._shutdown_event = asyncio.Event()
                     self._ready_event.set()
                     await self._shutdown_event.wait()
@@ -192,27 +190,24 @@ class _ManagedSession:
             self._ready_event.set()
         finally:
             self._session = None
-            self._call_lock = None
             self._shutdown_event = None
             self._ready_event.set()
 
     async def _list_tools_async(self) -> list[str]:
         assert self._session is not None
-        assert self._call_lock is not None
-        async with self._call_lock:
-            result = await self._session.list_tools()
+        result = await self._session.list_tools()
         return [tool.name for tool in result.tools]
 
     async def _call_tool_async(self, name: str, arguments: dict[str, Any]) -> Any:
         assert self._session is not None
-        assert self._call_lock is not None
         timeout = timedelta(seconds=max(1, self.call_timeout_seconds))
-        async with self._call_lock:
-            result = await self._session.call_tool(
-                name=name,
-                arguments=arguments,
-                read_timeout_seconds=timeout,
-            )
+        # ClientSession matches responses by request id, so concurrent calls
+        # from fan-out workers multiplex over the one session.
+        result = await self._session.call_tool(
+            name=name,
+            arguments=arguments,
+            read_timeout_seconds=timeout,
+        )
         return _decode_call_result(result)
 
     def list_tools(self) -> list[str]:
@@ -239,7 +234,6 @@ class _ManagedSession:
         self._loop = None
         self._session = None
         self._shutdown_event = None
-        self._call_lock = None
         self._start_error = None
 
 
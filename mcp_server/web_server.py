@@ -1,22 +1,48 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import queue
+import threading
 import warnings
-from typing import Any
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TYPE_CHECKING, Any
 from urllib.parse import quote_plus, urlparse, urlunparse
 
 import httpx
 
+from core.metrics import record_search_cache
 from core.models import RetrievedDoc, RunConfig
-from core.rate_limit import RetryPolicy, TokenBucketLimiter, call_with_retries
+from core.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    AsyncTokenBucketLimiter,
+    RetryBudget,
+    RetryPolicy,
+    acall_with_retries,
+    call_with_retries,
+    default_retryable,
+    is_overload_error,
+)
+from core.rate_limit_backends import build_rate_limiter
+from core.singleflight import AsyncSingleFlight
 from core.source_quality import annotate_doc
+from mcp_server.extract_cache import ExtractCache, ExtractCacheEntry
+from mcp_server.search_cache import SearchResultCache, cache_key
+
+if TYPE_CHECKING:
+    from mcp_server.plugin_registry import ProviderScheduler
 
 try:
     from tavily import TavilyClient  # type: ignore[import-untyped]
 except Exception:  # noqa: BLE001
     TavilyClient = None
 
+try:
+    from tavily import AsyncTavilyClient  # type: ignore[import-untyped]
+except Exception:  # noqa: BLE001
+    AsyncTavilyClient = None
+
 try:
     # Prefer duckduckgo_search first to avoid ddgs curl_cffi impersonation warnings
     # (e.g. firefox_117 deprecation fallback noise) in local runtime logs.
@@ -27,6 +53,13 @@ except Exception:  # noqa: BLE001
     except Exception:  # noqa: BLE001
         DDGS = None
 
+try:
+    import h2  # type: ignore[import-untyped]  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except Exception:  # noqa: BLE001
+    _HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 _IMPERSONATION_WARN_PATTERN = r"Impersonate .* does not exist"
 
@@ -61,13 +94,164 @@ def _dedupe_docs_by_url(docs: list[RetrievedDoc], k: int) -> list[RetrievedDoc]:
     return result
 
 
+def _tavily_failure_reason(message: str) -> str:
+    lowered = message.lower()
+    if (
+        "forbidden" in lowered
+        or "usage limit" in lowered
+        or "exceeds your plan" in lowered
+        or "credits" in lowered
+    ):
+        return "provider_quota_exhausted"
+    return "provider_request_failed"
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    """Failures the retry wrapper must see: overload signals and retryable errors."""
+    return is_overload_error(exc) or default_retryable(exc)
+
+
+def _tavily_response_docs(response: dict[str, Any]) -> list[RetrievedDoc]:
+    docs: list[RetrievedDoc] = []
+    for idx, item in enumerate(response.get("results", []), start=1):
+        docs.append(
+            annotate_doc(RetrievedDoc(
+                provider="tavily",
+                title=item.get("title", f"Tavily Result {idx}"),
+                url=_canonical_url(item.get("url", "")),
+                snippet=item.get("content", "")[:280],
+                content=item.get("content", ""),
+                score=float(item.get("score", 0.0)),
+            ))
+        )
+    return docs
+
+
+def _instant_answer_url(query: str) -> str:
+    return f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
+
+
+def _instant_answer_docs(payload: dict[str, Any], k: int) -> list[RetrievedDoc]:
+    docs: list[RetrievedDoc] = []
+    abstract = payload.get("AbstractText") or ""
+    if abstract:
+        docs.append(
+            annotate_doc(RetrievedDoc(
+                provider="ddg",
+                title=payload.get("Heading") or "DuckDuckGo Instant Answer",
+                url=_canonical_url(payload.get("AbstractURL") or ""),
+                snippet=abstract[:280],
+                content=abstract,
+                score=0.6,
+            ))
+        )
+    for item in payload.get("RelatedTopics", [])[: max(0, k - len(docs))]:
+        if isinstance(item, dict) and item.get("Text"):
+            docs.append(
+                annotate_doc(RetrievedDoc(
+                    provider="ddg",
+                    title=item.get("Text", "")[:80] or "DuckDuckGo Related Topic",
+                    url=_canonical_url(item.get("FirstURL", "")),
+                    snippet=item.get("Text", "")[:280],
+                    content=item.get("Text", ""),
+                    score=0.4,
+                ))
+            )
+    return docs
+
+
+_FIRECRAWL_ENDPOINT = "https://api.firecrawl.dev/v1/scrape"
+
+
+def _firecrawl_docs(payload: dict[str, Any], url_or_query: str, mode: str) -> list[RetrievedDoc]:
+    data = payload.get("data", {})
+    markdown = data.get("markdown", "")
+    title = (data.get("metadata") or {}).get("title", "Firecrawl Extract")
+    return [annotate_doc(RetrievedDoc(
+            provider="firecrawl",
+            title=title,
+            url=_canonical_url(url_or_query),
+            snippet=markdown[:280],
+            content=markdown,
+            score=0.7 if mode == "extract" else 0.5,
+        ))]
+
+
+def _firecrawl_validators(payload: dict[str, Any]) -> tuple[str, str]:
+    """Origin ``(etag, last_modified)`` when Firecrawl reports the page's response headers."""
+    metadata = (payload.get("data") or {}).get("metadata") or {}
+    lowered = {str(key).lower().replace("_", "-"): value for key, value in metadata.items()}
+    etag = lowered.get("etag") or ""
+    last_modified = lowered.get("last-modified") or lowered.get("lastmodified") or ""
+    return str(etag), str(last_modified)
+
+
+def _revalidation_outcome(
+    response: httpx.Response,
+    entry: ExtractCacheEntry | None,
+) -> tuple[bool, str, str]:
+    """Return ``(not_modified, etag, last_modified)`` for an origin HEAD probe."""
+    etag = response.headers.get("etag", "")
+    last_modified = response.headers.get("last-modified", "")
+    if entry is None:
+        return False, etag, last_modified
+    if response.status_code == 304:
+        return True, entry.etag, entry.last_modified
+    if response.status_code >= 400:
+        return False, "", ""
+    # Many origins ignore conditional HEADs; unchanged validators mean the same.
+    if entry.etag and etag == entry.etag:
+        return True, etag, last_modified
+    if not entry.etag and entry.last_modified and last_modified == entry.last_modified:
+        return True, etag, last_modified
+    return False, etag, last_modified
+
+
+def _mark_extract_cache(docs: list[RetrievedDoc], status: str) -> list[RetrievedDoc]:
+    return [
+        doc.model_copy(update={"meta": {**(doc.meta or {}), "extract_cache": status}})
+        for doc in docs
+    ]
+
+
 class WebMCPServer:
     def __init__(self, config: RunConfig):
         self.config = config
-        self.tavily_limiter = TokenBucketLimiter(config.tavily_rpm)
-        self.ddg_limiter = TokenBucketLimiter(config.ddg_rpm)
-        self.firecrawl_limiter = TokenBucketLimiter(config.firecrawl_rpm)
-        self.retry_policy = RetryPolicy(max_retries=config.max_retries)
+        self.tavily_limiter = build_rate_limiter(config, "tavily", config.tavily_rpm)
+        self.ddg_limiter = build_rate_limiter(config, "ddg", config.ddg_rpm)
+        self.firecrawl_limiter = build_rate_limiter(config, "firecrawl", config.firecrawl_rpm)
+        # Async views share the sync buckets so both entry points draw on one budget.
+        self.tavily_async_limiter = AsyncTokenBucketLimiter(self.tavily_limiter)
+        self.ddg_async_limiter = AsyncTokenBucketLimiter(self.ddg_limiter)
+        self.firecrawl_async_limiter = AsyncTokenBucketLimiter(self.firecrawl_limiter)
+        self.tavily_concurrency = self._build_concurrency("tavily")
+        self.ddg_concurrency = self._build_concurrency("ddg")
+        self.firecrawl_concurrency = self._build_concurrency("firecrawl")
+        # Owned here so provider call stats outlive each graph runtime; see
+        # ProviderScheduler.for_server.
+        self.provider_scheduler: ProviderScheduler | None = None
+        # One budget for all of this server's providers, so a brownout cannot
+        # multiply load through retries.
+        self.retry_budget = RetryBudget(
+            config.retry_budget_ratio,
+            min_retries=config.retry_budget_min_retries,
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=config.max_retries,
+            max_retry_after=config.retry_after_max_seconds,
+            budget=self.retry_budget,
+        )
+        self.search_cache = SearchResultCache.from_config(config)
+        self.async_flight = AsyncSingleFlight("web_server")
+        self.extract_cache = ExtractCache.from_config(config)
+        self._client_lock = threading.Lock()
+        self._http: httpx.Client | None = None
+        self._async_http: httpx.AsyncClient | None = None
+        self._tavily_client: Any = None
+        self._async_tavily_client: Any = None
+        self._ddgs_pool: queue.LifoQueue[Any] = queue.LifoQueue(
+            maxsize=max(1, config.http_pool_max_keepalive)
+        )
         self._ddg_text_degraded = False
         self._ddg_degradation_reason = ""
         if config.ddg_suppress_impersonate_warnings:
@@ -79,6 +263,106 @@ class WebMCPServer:
             logging.getLogger("duckduckgo_search").setLevel(logging.ERROR)
             logging.getLogger("curl_cffi").setLevel(logging.ERROR)
 
+    def _http_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max(1, self.config.http_pool_max_connections),
+            max_keepalive_connections=max(1, self.config.http_pool_max_keepalive),
+            keepalive_expiry=max(1.0, self.config.http_keepalive_expiry_seconds),
+        )
+
+    def _http_client(self) -> httpx.Client:
+        with self._client_lock:
+            if self._http is None or self._http.is_closed:
+                self._http = httpx.Client(
+                    limits=self._http_limits(),
+                    http2=self.config.http2_enabled and _HTTP2_AVAILABLE,
+                    timeout=15.0,
+                )
+            return self._http
+
+    def _async_http_client(self) -> httpx.AsyncClient:
+        # Only touched from the serving event loop, so no lock is needed.
+        if self._async_http is None or self._async_http.is_closed:
+            self._async_http = httpx.AsyncClient(
+                limits=self._http_limits(),
+                http2=self.config.http2_enabled and _HTTP2_AVAILABLE,
+                timeout=15.0,
+            )
+        return self._async_http
+
+    def _async_tavily(self) -> Any:
+        if self._async_tavily_client is None:
+            self._async_tavily_client = AsyncTavilyClient(api_key=self.config.tavily_api_key)
+        return self._async_tavily_client
+
+    def _tavily(self) -> Any:
+        with self._client_lock:
+            if self._tavily_client is None:
+                client = TavilyClient(api_key=self.config.tavily_api_key)
+                session = getattr(client, "session", None)
+                if session is not None:
+                    from requests.adapters import HTTPAdapter
+
+                    adapter = HTTPAdapter(
+                        pool_connections=max(1, self.config.http_pool_max_keepalive),
+                        pool_maxsize=max(1, self.config.http_pool_max_connections),
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                self._tavily_client = client
+            return self._tavily_client
+
+    def _checkout_ddgs(self) -> Any:
+        try:
+            return self._ddgs_pool.get_nowait()
+        except queue.Empty:
+            return DDGS(timeout=8)
+
+    def _return_ddgs(self, ddgs: Any) -> None:
+        try:
+            self._ddgs_pool.put_nowait(ddgs)
+        except queue.Full:
+            ddgs.__exit__(None, None, None)
+
+    def _build_concurrency(self, name: str) -> AdaptiveConcurrencyLimiter | None:
+        if not self.config.adaptive_concurrency_enabled:
+            return None
+        return AdaptiveConcurrencyLimiter(
+            name,
+            initial=self.config.adaptive_concurrency_initial,
+            max_limit=self.config.adaptive_concurrency_max,
+        )
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+            session = getattr(self._tavily_client, "session", None)
+            if session is not None:
+                session.close()
+            self._tavily_client = None
+        while True:
+            try:
+                self._ddgs_pool.get_nowait().__exit__(None, None, None)
+            except queue.Empty:
+                break
+        self.search_cache.close()
+        self.extract_cache.close()
+        for limiter in (self.tavily_limiter, self.ddg_limiter, self.firecrawl_limiter):
+            close = getattr(limiter, "close", None)
+            if close is not None:
+                close()
+
+    async def aclose(self) -> None:
+        if self._async_http is not None:
+            await self._async_http.aclose()
+            self._async_http = None
+        if self._async_tavily_client is not None:
+            await self._async_tavily_client.close()
+            self._async_tavily_client = None
+        self.close()
+
     def health(self) -> dict[str, Any]:
         return {
             "status": "ok",
@@ -86,13 +370,51 @@ class WebMCPServer:
                 "tavily_key": bool(self.config.tavily_api_key),
                 "firecrawl_key": bool(self.config.firecrawl_api_key),
             },
+            "search_cache": self.search_cache.stats(),
+            "extract_cache": self.extract_cache.stats(),
+            "rate_limit_wait": {
+                limiter.name: limiter.wait_stats()
+                for limiter in (self.tavily_limiter, self.ddg_limiter, self.firecrawl_limiter)
+            },
+            "singleflight": {"coalesced": self.async_flight.coalesced},
+            "adaptive_concurrency": {
+                limiter.name: limiter.stats()
+                for limiter in (self.tavily_concurrency, self.ddg_concurrency, self.firecrawl_concurrency)
+                if limiter is not None
+            },
+            "retry_budget": self.retry_budget.stats(),
         }
 
+    def _search_variant(self, provider: str) -> str:
+        """Options besides query and k that change a provider's results."""
+        if provider != "ddg":
+            return f"depth={self.config.research_depth}"
+        text_enabled = self.config.ddg_text_enabled and not self._ddg_text_degraded
+        return (
+            f"depth={self.config.research_depth};text={int(text_enabled)};"
+            f"fallback={self.config.ddg_fallback_mode}"
+        )
+
     def tavily_search(self, query: str, k: int = 5) -> list[RetrievedDoc]:
+        cached = self.search_cache.get("tavily", query, k, self._search_variant("tavily"))
+        if cached is not None:
+            return cached
         self.tavily_limiter.acquire()
-        return call_with_retries(
-            self._tavily_search_impl, query, k, policy=self.retry_policy
-        )
+        try:
+            docs = call_with_retries(
+                self._tavily_search_impl,
+                query,
+                k,
+                policy=self.retry_policy,
+                concurrency=self.tavily_concurrency,
+            )
+        except Exception as exc:  # noqa: BLE001
+            # Retries are spent; anything non-transient surfaces to the caller's breaker.
+            if not _is_transient_error(exc):
+                raise
+            return self._failed_search_docs("tavily", query, exc)
+        self.search_cache.put("tavily", query, k, docs, self._search_variant("tavily"))
+        return docs
 
     def _tavily_search_impl(self, query: str, k: int) -> list[RetrievedDoc]:
         if not self.config.tavily_api_key or TavilyClient is None:
@@ -103,34 +425,16 @@ class WebMCPServer:
                 details="Tavily key or client is unavailable.",
             )
 
-        client = TavilyClient(api_key=self.config.tavily_api_key)
+        client = self._tavily()
         try:
             response = client.search(query=query, max_results=k, search_depth="advanced")
         except Exception as exc:  # noqa: BLE001
-            message = str(exc)
-            lowered = message.lower()
-            reason = "provider_request_failed"
-            if (
-                "forbidden" in lowered
-                or "usage limit" in lowered
-                or "exceeds your plan" in lowered
-                or "credits" in lowered
-            ):
-                reason = "provider_quota_exhausted"
-            return self._fallback_docs("tavily", query, reason=reason, details=message[:320])
+            if _is_transient_error(exc):
+                raise
+            return self._failed_search_docs("tavily", query, exc)
+        return self._finish_tavily(query, k, _tavily_response_docs(response))
 
-        docs: list[RetrievedDoc] = []
-        for idx, item in enumerate(response.get("results", []), start=1):
-            docs.append(
-                annotate_doc(RetrievedDoc(
-                    provider="tavily",
-                    title=item.get("title", f"Tavily Result {idx}"),
-                    url=_canonical_url(item.get("url", "")),
-                    snippet=item.get("content", "")[:280],
-                    content=item.get("content", ""),
-                    score=float(item.get("score", 0.0)),
-                ))
-            )
+    def _finish_tavily(self, query: str, k: int, docs: list[RetrievedDoc]) -> list[RetrievedDoc]:
         cleaned = _dedupe_docs_by_url(docs, k)
         return cleaned or self._fallback_docs(
             "tavily",
@@ -139,20 +443,135 @@ class WebMCPServer:
             details="Tavily returned no usable results after normalization.",
         )
 
+    async def _coalesced(
+        self,
+        tool_name: str,
+        key: Hashable,
+        fn: Callable[[], Awaitable[list[RetrievedDoc]]],
+    ) -> list[RetrievedDoc]:
+        if not self.config.singleflight_enabled:
+            return await fn()
+        docs, shared = await self.async_flight.do(key, fn, label=tool_name)
+        return list(docs) if shared else docs
+
+    async def atavily_search(self, query: str, k: int = 5) -> list[RetrievedDoc]:
+        cached = self.search_cache.get("tavily", query, k, self._search_variant("tavily"))
+        if cached is not None:
+            return cached
+        return await self._coalesced(
+            "tavily_search",
+            cache_key("tavily", query, k, self._search_variant("tavily")),
+            lambda: self._afetch_tavily(query, k),
+        )
+
+    async def _afetch_tavily(self, query: str, k: int) -> list[RetrievedDoc]:
+        await self.tavily_async_limiter.acquire()
+        try:
+            docs = await acall_with_retries(
+                self._atavily_search_impl,
+                query,
+                k,
+                policy=self.retry_policy,
+                concurrency=self.tavily_concurrency,
+            )
+        except Exception as exc:  # noqa: BLE001
+            # Retries are spent; anything non-transient surfaces to the caller's breaker.
+            if not _is_transient_error(exc):
+                raise
+            return self._failed_search_docs("tavily", query, exc)
+        self.search_cache.put("tavily", query, k, docs, self._search_variant("tavily"))
+        return docs
+
+    async def _atavily_search_impl(self, query: str, k: int) -> list[RetrievedDoc]:
+        if not self.config.tavily_api_key or AsyncTavilyClient is None:
+            return self._fallback_docs(
+                "tavily",
+                query,
+                reason="provider_unavailable",
+                details="Tavily key or client is unavailable.",
+            )
+
+        client = self._async_tavily()
+        try:
+            response = await client.search(query=query, max_results=k, search_depth="advanced")
+        except Exception as exc:  # noqa: BLE001
+            if _is_transient_error(exc):
+                raise
+            return self._failed_search_docs("tavily", query, exc)
+        return self._finish_tavily(query, k, _tavily_response_docs(response))
+
     def ddg_search(self, query: str, k: int = 5) -> list[RetrievedDoc]:
+        cached = self.search_cache.get("ddg", query, k, self._search_variant("ddg"))
+        if cached is not None:
+            return cached
         self.ddg_limiter.acquire()
-        return call_with_retries(self._ddg_search_impl, query, k, policy=self.retry_policy)
+        try:
+            docs = call_with_retries(
+                self._ddg_search_impl,
+                query,
+                k,
+                policy=self.retry_policy,
+                concurrency=self.ddg_concurrency,
+            )
+        except Exception as exc:  # noqa: BLE001
+            # Retries are spent; anything non-transient surfaces to the caller's breaker.
+            if not _is_transient_error(exc):
+                raise
+            return self._failed_search_docs("ddg", query, exc)
+        self.search_cache.put("ddg", query, k, docs, self._search_variant("ddg"))
+        return docs
 
     def _ddg_search_impl(self, query: str, k: int) -> list[RetrievedDoc]:
-        docs: list[RetrievedDoc] = []
-        if self.config.ddg_text_enabled and not self._ddg_text_degraded:
-            docs = self._ddg_text_search(
+        docs = self._ddg_text_docs(query, k)
+        if not docs and self.config.ddg_fallback_mode in {"instant_only", "mixed"}:
+            docs = self._ddg_instant_answer_search(query, k)
+        return self._finish_ddg(query, k, docs)
+
+    async def addg_search(self, query: str, k: int = 5) -> list[RetrievedDoc]:
+        cached = self.search_cache.get("ddg", query, k, self._search_variant("ddg"))
+        if cached is not None:
+            return cached
+        return await self._coalesced(
+            "ddg_search",
+            cache_key("ddg", query, k, self._search_variant("ddg")),
+            lambda: self._afetch_ddg(query, k),
+        )
+
+    async def _afetch_ddg(self, query: str, k: int) -> list[RetrievedDoc]:
+        await self.ddg_async_limiter.acquire()
+        try:
+            docs = await acall_with_retries(
+                self._addg_search_impl,
                 query,
-                k=max(k, 8 if self.config.research_depth == "deep" else k),
+                k,
+                policy=self.retry_policy,
+                concurrency=self.ddg_concurrency,
             )
+        except Exception as exc:  # noqa: BLE001
+            # Retries are spent; anything non-transient surfaces to the caller's breaker.
+            if not _is_transient_error(exc):
+                raise
+            return self._failed_search_docs("ddg", query, exc)
+        self.search_cache.put("ddg", query, k, docs, self._search_variant("ddg"))
+        return docs
+
+    async def _addg_search_impl(self, query: str, k: int) -> list[RetrievedDoc]:
+        # ddgs only ships a blocking client, so text search runs on a worker thread.
+        docs = await asyncio.to_thread(self._ddg_text_docs, query, k)
+        if not docs and self.config.ddg_fallback_mode in {"instant_only", "mixed"}:
+            docs = await self._addg_instant_answer_search(query, k)
+        return self._finish_ddg(query, k, docs)
+
+    def _ddg_text_docs(self, query: str, k: int) -> list[RetrievedDoc]:
+        if not self.config.ddg_text_enabled or self._ddg_text_degraded:
+            return []
+        return self._ddg_text_search(
+            query,
+            k=max(k, 8 if self.config.research_depth == "deep" else k),
+        )
+
+    def _finish_ddg(self, query: str, k: int, docs: list[RetrievedDoc]) -> list[RetrievedDoc]:
         fallback_mode = self.config.ddg_fallback_mode
-        if not docs and fallback_mode in {"instant_only", "mixed"}:
-            docs = self._ddg_instant_answer_search(query, k)
         cleaned = _dedupe_docs_by_url(docs, k)
         if self._ddg_text_degraded and fallback_mode == "provider_shift" and not cleaned:
             return self._fallback_docs(
@@ -181,8 +600,14 @@ class WebMCPServer:
 
         for ddg_query in search_queries[:2]:
             try:
-                with DDGS(timeout=8) as ddgs:
+                ddgs = self._checkout_ddgs()
+                try:
                     results = list(ddgs.text(ddg_query, max_results=max(4, min(12, k))))
+                except Exception:
+                    # Drop instances that failed mid-request instead of recycling them.
+                    ddgs.__exit__(None, None, None)
+                    raise
+                self._return_ddgs(ddgs)
                 for item in results:
                     title = str(item.get("title", "")).strip() or "DuckDuckGo result"
                     url = _canonical_url(str(item.get("href", "")).strip())
@@ -206,6 +631,8 @@ class WebMCPServer:
                     self._ddg_degradation_reason = "provider_degraded_ddg_impersonation"
                     logger.warning("DDG text degraded due to impersonation compatibility issue.")
                     break
+                if _is_transient_error(exc):
+                    raise
                 continue
             if len(docs) >= k * 2:
                 break
@@ -213,45 +640,26 @@ class WebMCPServer:
 
     def _ddg_instant_answer_search(self, query: str, k: int) -> list[RetrievedDoc]:
         # Fallback no-key DDG path via Instant Answer + related topics.
-        url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
-        with httpx.Client(timeout=8.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            payload = response.json()
-        docs: list[RetrievedDoc] = []
-        abstract = payload.get("AbstractText") or ""
-        if abstract:
-            docs.append(
-                annotate_doc(RetrievedDoc(
-                    provider="ddg",
-                    title=payload.get("Heading") or "DuckDuckGo Instant Answer",
-                    url=_canonical_url(payload.get("AbstractURL") or ""),
-                    snippet=abstract[:280],
-                    content=abstract,
-                    score=0.6,
-                ))
-            )
-        for item in payload.get("RelatedTopics", [])[: max(0, k - len(docs))]:
-            if isinstance(item, dict) and item.get("Text"):
-                docs.append(
-                    annotate_doc(RetrievedDoc(
-                        provider="ddg",
-                        title=item.get("Text", "")[:80] or "DuckDuckGo Related Topic",
-                        url=_canonical_url(item.get("FirstURL", "")),
-                        snippet=item.get("Text", "")[:280],
-                        content=item.get("Text", ""),
-                        score=0.4,
-                    ))
-                )
-        return docs
+        response = self._http_client().get(_instant_answer_url(query), timeout=8.0)
+        response.raise_for_status()
+        return _instant_answer_docs(response.json(), k)
+
+    async def _addg_instant_answer_search(self, query: str, k: int) -> list[RetrievedDoc]:
+        response = await self._async_http_client().get(_instant_answer_url(query), timeout=8.0)
+        response.raise_for_status()
+        return _instant_answer_docs(response.json(), k)
 
     def firecrawl_extract(self, url_or_query: str, mode: str = "extract") -> list[RetrievedDoc]:
+        cached = self._fresh_extract(url_or_query, mode)
+        if cached is not None:
+            return cached
         self.firecrawl_limiter.acquire()
         return call_with_retries(
             self._firecrawl_extract_impl,
             url_or_query,
             mode,
             policy=self.retry_policy,
+            concurrency=self.firecrawl_concurrency,
         )
 
     def _firecrawl_extract_impl(self, url_or_query: str, mode: str) -> list[RetrievedDoc]:
@@ -263,27 +671,164 @@ class WebMCPServer:
                 details="Firecrawl API key is unavailable.",
             )
 
-        endpoint = "https://api.firecrawl.dev/v1/scrape"
-        body = {"url": url_or_query, "formats": ["markdown"]}
-        headers = {
+        url, entry = self._extract_cache_entry(url_or_query, mode)
+        if entry is not None and entry.is_fresh(self.extract_cache.ttl_seconds):
+            record_search_cache("firecrawl", "hit")
+            return _mark_extract_cache(entry.docs, "hit")
+        etag = last_modified = ""
+        if entry is not None:
+            # Only a stale entry is worth a round trip to the origin.
+            try:
+                head = self._http_client().head(
+                    url,
+                    headers=entry.conditional_headers(),
+                    timeout=5.0,
+                    follow_redirects=True,
+                )
+            except httpx.HTTPError:
+                head = None
+            if head is not None:
+                not_modified, etag, last_modified = _revalidation_outcome(head, entry)
+                if not_modified:
+                    return self._reuse_extract(url, mode, entry, etag, last_modified)
+
+        resp = self._http_client().post(
+            _FIRECRAWL_ENDPOINT,
+            headers=self._firecrawl_headers(),
+            content=json.dumps({"url": url_or_query, "formats": ["markdown"]}),
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+        docs = _firecrawl_docs(payload, url_or_query, mode)
+        origin_etag, origin_last_modified = _firecrawl_validators(payload)
+        return self._store_extract(
+            url, mode, docs, origin_etag or etag, origin_last_modified or last_modified
+        )
+
+    async def afirecrawl_extract(self, url_or_query: str, mode: str = "extract") -> list[RetrievedDoc]:
+        cached = self._fresh_extract(url_or_query, mode)
+        if cached is not None:
+            return cached
+        return await self._coalesced(
+            "firecrawl_extract",
+            ("firecrawl", _canonical_url(url_or_query) or url_or_query, mode),
+            lambda: self._afetch_firecrawl(url_or_query, mode),
+        )
+
+    async def _afetch_firecrawl(self, url_or_query: str, mode: str) -> list[RetrievedDoc]:
+        await self.firecrawl_async_limiter.acquire()
+        return await acall_with_retries(
+            self._afirecrawl_extract_impl,
+            url_or_query,
+            mode,
+            policy=self.retry_policy,
+            concurrency=self.firecrawl_concurrency,
+        )
+
+    async def _afirecrawl_extract_impl(self, url_or_query: str, mode: str) -> list[RetrievedDoc]:
+        if not self.config.firecrawl_api_key:
+            return self._fallback_docs(
+                "firecrawl",
+                url_or_query,
+                reason="provider_unavailable",
+                details="Firecrawl API key is unavailable.",
+            )
+        url, entry = self._extract_cache_entry(url_or_query, mode)
+        if entry is not None and entry.is_fresh(self.extract_cache.ttl_seconds):
+            record_search_cache("firecrawl", "hit")
+            return _mark_extract_cache(entry.docs, "hit")
+        etag = last_modified = ""
+        if entry is not None:
+            # Only a stale entry is worth a round trip to the origin.
+            try:
+                head = await self._async_http_client().head(
+                    url,
+                    headers=entry.conditional_headers(),
+                    timeout=5.0,
+                    follow_redirects=True,
+                )
+            except httpx.HTTPError:
+                head = None
+            if head is not None:
+                not_modified, etag, last_modified = _revalidation_outcome(head, entry)
+                if not_modified:
+                    return self._reuse_extract(url, mode, entry, etag, last_modified)
+
+        resp = await self._async_http_client().post(
+            _FIRECRAWL_ENDPOINT,
+            headers=self._firecrawl_headers(),
+            content=json.dumps({"url": url_or_query, "formats": ["markdown"]}),
+            timeout=15.0,
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+        docs = _firecrawl_docs(payload, url_or_query, mode)
+        origin_etag, origin_last_modified = _firecrawl_validators(payload)
+        return self._store_extract(
+            url, mode, docs, origin_etag or etag, origin_last_modified or last_modified
+        )
+
+    def _extract_cache_entry(
+        self,
+        url_or_query: str,
+        mode: str,
+    ) -> tuple[str, ExtractCacheEntry | None]:
+        # Only real URLs are cacheable; a TTL of 0 disables the extract cache.
+        url = _canonical_url(url_or_query)
+        if not url or self.extract_cache.ttl_seconds <= 0:
+            return "", None
+        return url, self.extract_cache.get(url, mode)
+
+    def _fresh_extract(self, url_or_query: str, mode: str) -> list[RetrievedDoc] | None:
+        # Checked before the rate limiter so cache hits never spend Firecrawl RPM.
+        if not self.config.firecrawl_api_key:
+            return None
+        _, entry = self._extract_cache_entry(url_or_query, mode)
+        if entry is None or not entry.is_fresh(self.extract_cache.ttl_seconds):
+            return None
+        record_search_cache("firecrawl", "hit")
+        return _mark_extract_cache(entry.docs, "hit")
+
+    def _reuse_extract(
+        self,
+        url: str,
+        mode: str,
+        entry: ExtractCacheEntry,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> list[RetrievedDoc]:
+        self.extract_cache.touch(url, mode, etag=etag, last_modified=last_modified)
+        record_search_cache("firecrawl", "revalidated")
+        return _mark_extract_cache(entry.docs, "revalidated")
+
+    def _store_extract(
+        self,
+        url: str,
+        mode: str,
+        docs: list[RetrievedDoc],
+        etag: str,
+        last_modified: str,
+    ) -> list[RetrievedDoc]:
+        if not url:
+            return docs
+        record_search_cache("firecrawl", "miss")
+        self.extract_cache.put(url, mode, docs, etag=etag, last_modified=last_modified)
+        return _mark_extract_cache(docs, "miss")
+
+    def _firecrawl_headers(self) -> dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.config.firecrawl_api_key}",
             "Content-Type": "application/json",
         }
-        with httpx.Client(timeout=15.0) as client:
-            resp = client.post(endpoint, headers=headers, content=json.dumps(body))
-            resp.raise_for_status()
-            payload = resp.json()
-        data = payload.get("data", {})
-        markdown = data.get("markdown", "")
-        title = (data.get("metadata") or {}).get("title", "Firecrawl Extract")
-        return [annotate_doc(RetrievedDoc(
-                provider="firecrawl",
-                title=title,
-                url=_canonical_url(url_or_query),
-                snippet=markdown[:280],
-                content=markdown,
-                score=0.7 if mode == "extract" else 0.5,
-            ))]
+
+    def _failed_search_docs(self, provider: str, query: str, exc: Exception) -> list[RetrievedDoc]:
+        """Fallback for a search whose transient failures outlasted the retry policy."""
+        message = str(exc)
+        reason = (
+            _tavily_failure_reason(message) if provider == "tavily" else "provider_request_failed"
+        )
+        return self._fallback_docs(provider, query, reason=reason, details=message[:320])
 
     @staticmethod
     def _fallback_docs(
@@ -11,20 +11,20 @@ _server = WebMCPServer(_config)
 
 
 @app.tool()
-def tavily_search(query: str, k: int = 5) -> list[dict]:
-    docs = _server.tavily_search(query=query, k=k)
+async def tavily_search(query: str, k: int = 5) -> list[dict]:
+    docs = await _server.atavily_search(query=query, k=k)
     return [doc.model_dump(mode="json") for doc in docs]
 
 
 @app.tool()
-def ddg_search(query: str, k: int = 5) -> list[dict]:
-    docs = _server.ddg_search(query=query, k=k)
+async def ddg_search(query: str, k: int = 5) -> list[dict]:
+    docs = await _server.addg_search(query=query, k=k)
     return [doc.model_dump(mode="json") for doc in docs]
 
 
 @app.tool()
-def firecrawl_extract(url_or_query: str, mode: str = "extract") -> list[dict]:
-    docs = _server.firecrawl_extract(url_or_query=url_or_query, mode=mode)
+async def firecrawl_extract(url_or_query: str, mode: str = "extract") -> list[dict]:
+    docs = await _server.afirecrawl_extract(url_or_query=url_or_query, mode=mode)
     return [doc.model_dump(mode="json") for doc in docs]
 
 
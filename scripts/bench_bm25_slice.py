@@ -0,0 +1,110 @@
+"""Compare per-branch token-overlap slicing with one shared BM25 index.
+
+Each subtopic has planted on-topic docs; the rest of the corpus is roundups
+that name several subtopics once near the top of the page. Reports precision@10 of the slice and total CPU time
+for slicing every subtopic.
+
+Run: python -m scripts.bench_bm25_slice [--docs 600] [--subtopics 6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from core.bm25 import BM25Index
+from core.doc_features import DocFeatureIndex
+from core.models import QueryProfile, RetrievedDoc, SubTopic
+from graph.nodes.sub_research import _slice_docs
+from scripts.bench_common import measure
+
+_TOPICS = (
+    ("battery recycling", "lithium cathode recovery hydrometallurgy smelting"),
+    ("grid storage", "pumped hydro flywheel dispatch frequency regulation"),
+    ("carbon capture", "sorbent amine sequestration injection monitoring"),
+    ("wind turbines", "blade fatigue offshore foundations nacelle gearbox"),
+    ("solar modules", "perovskite tandem efficiency degradation inverter"),
+    ("hydrogen electrolysis", "electrolyzer membrane catalyst iridium stack"),
+    ("nuclear fission", "reactor fuel enrichment coolant licensing waste"),
+    ("heat pumps", "refrigerant compressor coefficient defrost retrofit"),
+)
+_FILLER = (
+    "market policy outlook investment regional analysis industry overview report "
+    "trend forecast update commentary survey press release newsletter summary"
+).split()
+
+
+def _corpus(size: int, topics: int, rng: random.Random) -> tuple[list[RetrievedDoc], list[set[str]]]:
+    docs: list[RetrievedDoc] = []
+    relevant: list[set[str]] = [set() for _ in range(topics)]
+    for idx in range(size):
+        topic = idx % topics
+        name, terms = _TOPICS[topic]
+        vocab = terms.split()
+        on_topic = rng.random() < 0.25
+        words = [rng.choice(_FILLER) for _ in range(120)]
+        if on_topic:
+            words += [rng.choice(vocab) for _ in range(25)] + name.split() * 3
+            rng.shuffle(words)
+            title = f"{name.title()} {rng.choice(vocab)} study"
+            relevant[topic].add(f"https://site{idx % 37}.example.org/{idx}")
+        else:
+            # Roundups that name several topics once, near the top of the page.
+            for other in rng.sample(range(topics), k=min(3, topics)):
+                words[rng.randrange(20)] += f" {_TOPICS[other][0]}"
+            title = f"{rng.choice(_FILLER).title()} {rng.choice(_FILLER)} digest"
+        docs.append(
+            RetrievedDoc(
+                provider="ddg",
+                title=title,
+                url=f"https://site{idx % 37}.example.org/{idx}",
+                snippet=" ".join(words[:40]),
+                content=" ".join(words),
+                score=rng.random(),
+            )
+        )
+    return docs, relevant
+
+
+def run(size: int, topic_count: int) -> None:
+    rng = random.Random(5)
+    topic_count = max(1, min(topic_count, len(_TOPICS)))
+    docs, relevant = _corpus(size, topic_count, rng)
+    profile = QueryProfile(original_query="energy technology", normalized_query="energy technology")
+    subtopics = [
+        SubTopic(id=f"S{idx + 1}", facet=_TOPICS[idx][0], sub_query=f"{_TOPICS[idx][0]} evidence")
+        for idx in range(topic_count)
+    ]
+
+    def overlap() -> list[list[RetrievedDoc]]:
+        return [
+            _slice_docs(docs, subtopic=sub, query_profile=profile, max_docs=10) for sub in subtopics
+        ]
+
+    def bm25() -> list[list[RetrievedDoc]]:
+        index = BM25Index(docs, features=DocFeatureIndex())
+        return [
+            _slice_docs(docs, subtopic=sub, query_profile=profile, max_docs=10, bm25=index)
+            for sub in subtopics
+        ]
+
+    for name, fn in (("token overlap per branch", overlap), ("bm25 index, built once", bm25)):
+        slices = fn()
+        precision = sum(
+            len({doc.url for doc in slice_} & relevant[idx]) / max(1, len(slice_))
+            for idx, slice_ in enumerate(slices)
+        ) / len(slices)
+        print(f"{measure(name, fn, repeats=3).line()}  precision@10={precision:.2f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=600)
+    parser.add_argument("--subtopics", type=int, default=6)
+    args = parser.parse_args()
+    run(args.docs, args.subtopics)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from core.models import RetrievedDoc
+
+_HOSTS = (
+    "arxiv.org",
+    "www.nist.gov",
+    "cs.stanford.edu",
+    "news.reuters.com",
+    "openai.com",
+    "medium.com",
+    "reddit.com",
+    "example.com",
+    "blog.example.org",
+    "research.example.net",
+)
+_WORDS = (
+    "retrieval latency provider fanout deadline evidence corroboration benchmark "
+    "dataset evaluation citation tier domain crawler cache throughput budget "
+    "transformer governance safety policy audit standard measurement report"
+).split()
+
+
+@dataclass(slots=True)
+class BenchResult:
+    name: str
+    cpu_ms: float
+    peak_kib: float
+
+    def line(self) -> str:
+        return f"{self.name:<28} cpu={self.cpu_ms:9.2f} ms  peak={self.peak_kib:9.1f} KiB"
+
+
+def synthetic_corpus(size: int, *, seed: int = 7, body_words: int = 220) -> list[RetrievedDoc]:
+    rng = random.Random(seed)
+    docs: list[RetrievedDoc] = []
+    for idx in range(size):
+        host = _HOSTS[idx % len(_HOSTS)]
+        words = [rng.choice(_WORDS) for _ in range(body_words)]
+        body = " ".join(words)
+        docs.append(
+            RetrievedDoc(
+                provider=rng.choice(("tavily", "ddg", "firecrawl")),  # type: ignore[arg-type]
+                title=f"{words[0].title()} {words[1]} report {idx}",
+                url=f"https://{host}/papers/{idx}?utm_source=bench#section",
+                snippet=f"Menu | Home\n{body[:400]}\nCopyright 2025 All rights reserved",
+                content=f"Published 2025-0{1 + idx % 9}-1{idx % 9}. {body}",
+                score=rng.random(),
+            )
+        )
+    return docs
+
+
+def measure(name: str, fn: Callable[[], Any], *, repeats: int = 5) -> BenchResult:
+    """Best-of-``repeats`` CPU time and the peak traced allocation of one run."""
+    fn()  # warm imports and lazily compiled regexes
+    cpu_times: list[float] = []
+    for _ in range(repeats):
+        started = time.process_time()
+        fn()
+        cpu_times.append(time.process_time() - started)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchResult(name=name, cpu_ms=min(cpu_times) * 1000.0, peak_kib=peak / 1024.0)
@@ -0,0 +1,77 @@
+"""Compare uncached context pruning with the cached ContextPruner.
+
+Simulates a run whose synthesizer prunes the same citable pages on every
+correction loop, followed by a second run that sees the same pages again.
+
+Run: python -m scripts.bench_context_prune [--docs 8] [--loops 3] [--workers 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from core.models import RetrievedDoc
+from core.pruning import ContextPruner, ExtractionCache, clean_html_or_text, dedupe_docs
+from scripts.bench_common import measure
+
+_WORDS = (
+    "grid operators reported record battery storage output during the evening peak "
+    "regulators reviewed interconnection queues utilities proposed tariffs"
+).split()
+
+
+def _page(idx: int, rng: random.Random) -> str:
+    paragraphs = "".join(
+        "<p>" + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(30, 70))) + "</p>"
+        for _ in range(60)
+    )
+    return (
+        "<html><body><nav>Menu | Home | About</nav>"
+        f"<article><h1>Report {idx}</h1>{paragraphs}</article>"
+        "<footer>Copyright 2025 All rights reserved</footer></body></html>"
+    )
+
+
+def run(doc_count: int, loops: int, workers: int) -> None:
+    rng = random.Random(23)
+    docs = [
+        RetrievedDoc(provider="firecrawl", title=f"Report {idx}", url=f"https://e{idx}.org/r", content=_page(idx, rng))
+        for idx in range(doc_count)
+    ]
+
+    def uncached() -> None:
+        # What prune_context_docs did before: extract every doc on every call.
+        for _ in range(loops * 2):
+            for doc in dedupe_docs(docs):
+                clean_html_or_text(doc.content)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "extraction_cache.sqlite3"
+
+        def cached() -> None:
+            path.unlink(missing_ok=True)
+            for _ in range(2):  # two runs, each with its own runtime
+                pruner = ContextPruner(cache=ExtractionCache(path), workers=workers)
+                for _ in range(loops):
+                    pruner.prune(docs, per_doc_tokens=500, total_tokens=1_000_000)
+                pruner.close()
+
+        for name, fn in (("uncached extraction", uncached), ("memory + disk cache", cached)):
+            print(measure(name, fn, repeats=2).line())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=8)
+    parser.add_argument("--loops", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    run(args.docs, args.loops, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,49 @@
+"""Compare per-claim peer scans with the inverted-index corroboration batch.
+
+Run: python -m scripts.bench_corroboration [--sizes 50,500,5000] [--claims 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from core.verification import corroboration_count, corroboration_counts
+from scripts.bench_common import measure, synthetic_corpus
+
+
+def run(size: int, claim_count: int) -> None:
+    docs = synthetic_corpus(size, body_words=80)
+    claims = docs[: min(claim_count, size)]
+    expected = [corroboration_count(doc, docs) for doc in claims[:20]]
+    assert corroboration_counts(claims[:20], docs) == expected
+
+    def scan() -> None:
+        for doc in claims:
+            corroboration_count(doc, docs)
+
+    def indexed() -> None:
+        corroboration_counts(claims, docs)
+
+    repeats = 1 if size >= 5000 else 3
+    results = [
+        measure("peer scan per claim", scan, repeats=repeats),
+        measure("inverted index", indexed, repeats=repeats),
+    ]
+    print(f"{size} docs, {len(claims)} claims")
+    for result in results:
+        print(f"  {result.line()}")
+    print(f"  speedup {results[0].cpu_ms / max(results[1].cpu_ms, 1e-6):6.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="50,500,5000")
+    parser.add_argument("--claims", type=int, default=100)
+    args = parser.parse_args()
+    for size in (int(item) for item in args.sizes.split(",") if item.strip()):
+        run(size, args.claims)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
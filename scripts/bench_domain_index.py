@@ -0,0 +1,99 @@
+"""Compare the old linear domain-set scan with the compiled suffix trie.
+
+Run: python -m scripts.bench_domain_index [--hosts 20000] [--listed 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from core.domain_index import DEFAULT_LISTS_DIR, DomainClassifier, load_domain_list
+from scripts.bench_common import measure
+
+
+def _linear_tier(host: str, lists: dict[str, set[str]]) -> str | None:
+    # What source_tier did before: one endswith() per listed domain, per list.
+    for category, tier in (("tier_a", "A"), ("tier_b", "B"), ("low_trust", "C")):
+        candidates = lists[category]
+        if host in candidates or any(host.endswith(f".{domain}") for domain in candidates):
+            return tier
+    return None
+
+
+def _lists(extra: int, rng: random.Random) -> dict[str, set[str]]:
+    lists = {
+        category: {domain for domain, _ in load_domain_list(DEFAULT_LISTS_DIR / f"{category}.txt")}
+        for category in ("tier_a", "tier_b", "low_trust")
+    }
+    # Tenant-sized lists: pad each category with synthetic publishers.
+    for idx in range(extra):
+        category = rng.choice(tuple(lists))
+        lists[category].add(f"publisher{idx}.example{idx % 7}.com")
+    return lists
+
+
+def _hosts(lists: dict[str, set[str]], size: int, rng: random.Random) -> list[str]:
+    listed = sorted(domain for domains in lists.values() for domain in domains)
+    hosts: list[str] = []
+    for idx in range(size):
+        roll = rng.random()
+        if roll < 0.4:
+            hosts.append(rng.choice(listed))
+        elif roll < 0.7:
+            hosts.append(f"news.{rng.choice(listed)}")
+        else:
+            hosts.append(f"site{idx % 400}.unlisted{idx % 13}.net")
+    return hosts
+
+
+def run(host_count: int, listed: int) -> None:
+    rng = random.Random(11)
+    lists = _lists(listed, rng)
+    hosts = _hosts(lists, host_count, rng)
+    classifier = DomainClassifier()
+    for category, domains in lists.items():
+        for domain in domains:
+            classifier.add(domain, category)
+    expected = [_linear_tier(host, lists) for host in hosts]
+    assert [classifier.classify(host).tier for host in hosts] == expected
+
+    def linear() -> None:
+        for host in hosts:
+            _linear_tier(host, lists)
+
+    def trie_cold() -> None:
+        classifier._cache.clear()
+        for host in hosts:
+            classifier.classify(host)
+
+    def trie_warm() -> None:
+        for host in hosts:
+            classifier.classify(host)
+
+    results = [
+        measure("linear endswith scan", linear),
+        measure("suffix trie (cold memo)", trie_cold),
+        measure("suffix trie (warm memo)", trie_warm),
+    ]
+    print(f"{len(hosts)} lookups against {sum(len(v) for v in lists.values())} listed domains")
+    for result in results:
+        print(result.line())
+    base, cold, warm = results
+    print(
+        f"speedup cold {base.cpu_ms / max(cold.cpu_ms, 1e-6):6.1f}x  "
+        f"warm {base.cpu_ms / max(warm.cpu_ms, 1e-6):6.1f}x"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hosts", type=int, default=20000)
+    parser.add_argument("--listed", type=int, default=500)
+    args = parser.parse_args()
+    run(args.hosts, args.listed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+"""Compare the old multi-pass evidence cleaner with the single-pass memoized one.
+
+Pages are synthetic Firecrawl markdown: nav crumbs, tags and boilerplate
+around long article bodies. Each page is cleaned ``--repeats`` times, as the
+scorers do when several branches see the same document.
+
+Run: python -m scripts.bench_evidence_cleaner [--pages 40] [--kib 140] [--repeats 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+
+from core import source_quality
+from core.source_quality import clean_evidence_text, is_boilerplate_line
+from scripts.bench_common import measure
+
+_WORDS = (
+    "grid operators reported record battery storage output during the evening peak "
+    "regulators reviewed interconnection queues utilities proposed tariffs"
+).split()
+
+
+def _multi_pass_clean(text: str, *, max_chars: int = 180) -> str:
+    # What clean_evidence_text did before: four full passes, then truncation.
+    source = (text or "").replace("\\n", "\n")
+    source = re.sub(r"<[^>]+>", " ", source)
+    source = re.sub(
+        r"(^|\s)(menu|home|about|contact|privacy|terms)\s*(\||/|$)", " ", source, flags=re.IGNORECASE
+    )
+    lines = [ln.strip() for ln in source.splitlines()]
+    cleaned = [ln for ln in lines if ln and not is_boilerplate_line(ln)]
+    if not cleaned:
+        cleaned = [re.sub(r"\s+", " ", source).strip()]
+    normalized = re.sub(r"\s+", " ", " ".join(cleaned)).strip()
+    return normalized[: max(40, max_chars)].strip()
+
+
+def _page(kib: int, rng: random.Random) -> str:
+    parts = ["Menu | Home | About | Contact\n", "[Sign in](/login) | Subscribe\n"]
+    size = 0
+    while size < kib * 1024:
+        paragraph = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(20, 80)))
+        chunk = f"<p>{paragraph}</p>\n\n## {rng.choice(_WORDS).title()}\n"
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append("Copyright 2025 All rights reserved | Privacy | Terms\n")
+    return "".join(parts)
+
+
+def run(pages: int, kib: int, repeats: int) -> None:
+    rng = random.Random(22)
+    texts = [_page(kib, rng) for _ in range(pages)]
+    assert all(_multi_pass_clean(text) == clean_evidence_text(text) for text in texts)
+
+    def multi_pass() -> None:
+        for text in texts:
+            for _ in range(repeats):
+                _multi_pass_clean(text)
+
+    def single_pass() -> None:
+        source_quality._clean_cache.clear()
+        for text in texts:
+            for _ in range(repeats):
+                clean_evidence_text(text)
+
+    def single_pass_no_memo() -> None:
+        for text in texts:
+            for _ in range(repeats):
+                source_quality._clean_evidence(text, 180)
+
+    for name, fn in (
+        ("multi-pass", multi_pass),
+        ("single pass", single_pass_no_memo),
+        ("single pass + memo", single_pass),
+    ):
+        print(measure(name, fn, repeats=3).line())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--kib", type=int, default=140)
+    parser.add_argument("--repeats", type=int, default=4)
+    args = parser.parse_args()
+    run(args.pages, args.kib, args.repeats)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,169 @@
+"""Peak RSS of the sub_research fan-out: corpus by value vs doc IDs by reference.
+
+Compiles a research_pool -> sub_research* -> merge graph with an in-memory
+checkpointer, as a durable deployment would run it. The by-value variant
+reproduces the old dispatch (the corpus list in every ``Send`` payload and an
+``add`` reducer on the state key); the by-reference variant uses the real
+``_dispatch_subresearch`` and the run's doc store. Each variant runs in its
+own interpreter so peaks do not mix.
+
+Run: python -m scripts.bench_send_fanout [--docs 120] [--subtopics 6] [--chars 8000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import random
+import resource
+import subprocess
+import sys
+from operator import add
+from typing import Annotated, TypedDict
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Send
+
+from core.doc_store import DocStore
+from core.models import QueryProfile, RetrievedDoc, SubTopic
+from graph.nodes.sub_research import _slice_docs
+from graph.pipeline import _dispatch_subresearch
+
+_WORDS = (
+    "grid operators reported record battery storage output during the evening peak "
+    "regulators reviewed interconnection queues utilities proposed tariffs recycling"
+).split()
+
+
+class _ByValueState(TypedDict, total=False):
+    run_id: str
+    subtopics: list[SubTopic]
+    shared_corpus_docs: Annotated[list[RetrievedDoc], add]
+    slices: Annotated[list[int], add]
+
+
+class _ByReferenceState(TypedDict, total=False):
+    run_id: str
+    subtopics: list[SubTopic]
+    shared_corpus_ids: list[str]
+    slices: Annotated[list[int], add]
+
+
+def _corpus(size: int, chars: int) -> list[RetrievedDoc]:
+    rng = random.Random(25)
+    docs = []
+    for idx in range(size):
+        body = " ".join(rng.choice(_WORDS) for _ in range(chars // 7))[:chars]
+        docs.append(
+            RetrievedDoc(
+                provider="tavily",
+                title=f"{rng.choice(_WORDS).title()} report {idx}",
+                url=f"https://site{idx}.example.org/report",
+                snippet=body[:300],
+                content=body,
+                score=rng.random(),
+            )
+        )
+    return docs
+
+
+def _subtopics(count: int) -> list[SubTopic]:
+    return [
+        SubTopic(id=f"S{idx + 1}", facet=_WORDS[idx * 3], sub_query=f"{_WORDS[idx * 3]} {_WORDS[idx * 3 + 1]}")
+        for idx in range(count)
+    ]
+
+
+def _dispatch_by_value(state: _ByValueState) -> list[Send]:
+    # What _dispatch_subresearch sent before: the whole corpus per branch.
+    return [
+        Send(
+            "sub_research",
+            {
+                "run_id": state["run_id"],
+                "shared_corpus_docs": state.get("shared_corpus_docs", []),
+                "subtopics": state.get("subtopics", []),
+                "subtopic_id": item.id,
+                "subtopic_query": item.sub_query,
+                "subtopic_facet": item.facet,
+            },
+        )
+        for item in state.get("subtopics", [])
+    ]
+
+
+def _graph(variant: str, docs: list[RetrievedDoc], subtopics: list[SubTopic], store: DocStore):
+    profile = QueryProfile(original_query="energy", normalized_query="energy")
+
+    def pool(state: dict) -> dict:
+        if variant == "value":
+            return {"subtopics": subtopics, "shared_corpus_docs": docs}
+        return {"subtopics": subtopics, "shared_corpus_ids": store.put_many(docs)}
+
+    def branch(state: dict) -> dict:
+        corpus = (
+            list(state.get("shared_corpus_docs", []))
+            if variant == "value"
+            else store.get_many(state.get("shared_corpus_ids", []))
+        )
+        subtopic = SubTopic(
+            id=state["subtopic_id"], facet=state["subtopic_facet"], sub_query=state["subtopic_query"]
+        )
+        return {"slices": [len(_slice_docs(corpus, subtopic=subtopic, query_profile=profile, max_docs=10))]}
+
+    builder = StateGraph(_ByValueState if variant == "value" else _ByReferenceState)
+    builder.add_node("research_pool", pool)
+    builder.add_node("sub_research", branch)
+    builder.add_node("merge", lambda state: {})
+    builder.add_edge(START, "research_pool")
+    builder.add_conditional_edges(
+        "research_pool", _dispatch_by_value if variant == "value" else _dispatch_subresearch
+    )
+    builder.add_edge("sub_research", "merge")
+    builder.add_edge("merge", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def _measure(variant: str, doc_count: int, subtopic_count: int, chars: int) -> None:
+    docs = _corpus(doc_count, chars)
+    subtopics = _subtopics(subtopic_count)
+    store = DocStore()
+    graph = _graph(variant, docs, subtopics, store)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    config = {"configurable": {"thread_id": "bench"}}
+    final = graph.invoke({"run_id": "bench"}, config)
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    checkpoint_bytes = sum(
+        len(pickle.dumps(snapshot.values)) for snapshot in graph.get_state_history(config)
+    )
+    print(
+        f"{variant:<10} branches={len(final['slices'])}  peak_rss={after / 1024:7.1f} MiB  "
+        f"fan-out growth={(after - before) / 1024:6.1f} MiB  "
+        f"checkpointed state={checkpoint_bytes / 1024:8.1f} KiB"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=120)
+    parser.add_argument("--subtopics", type=int, default=6)
+    parser.add_argument("--chars", type=int, default=8000)
+    parser.add_argument("--variant", choices=("value", "reference"))
+    args = parser.parse_args()
+    if args.variant:
+        _measure(args.variant, args.docs, min(args.subtopics, len(_WORDS) // 3), args.chars)
+        return 0
+    for variant in ("value", "reference"):
+        subprocess.run(
+            [
+                sys.executable, "-m", "scripts.bench_send_fanout", "--variant", variant,
+                "--docs", str(args.docs), "--subtopics", str(args.subtopics), "--chars", str(args.chars),
+            ],
+            check=True,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
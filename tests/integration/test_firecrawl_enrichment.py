@@ -0,0 +1,136 @@
+import threading
+import time
+
+from core.config import load_config
+from core.models import RetrievedDoc
+from core.source_quality import annotate_doc
+from graph.nodes.firecrawl_enrich import enrich_with_firecrawl
+from graph.nodes.research_pool import create_research_pool_node
+from graph.pipeline import build_initial_state
+from graph.runtime import GraphRuntime
+
+
+def _search_doc(provider: str, url: str) -> RetrievedDoc:
+    snippet = (
+        "Federal guidance on research pipeline latency budgets, provider fan-out "
+        "and full-text evidence extraction."
+    )
+    return RetrievedDoc(
+        provider=provider,  # type: ignore[arg-type]
+        title=f"Guidance {url}",
+        url=url,
+        snippet=snippet,
+        content=snippet,
+        score=0.8,
+    )
+
+
+def test_research_pool_enriches_top_tier_ab_urls_within_budget(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+            "firecrawl_api_key": "test-key",
+            "firecrawl_enrich_top_n": 3,
+            "firecrawl_per_domain_concurrency": 1,
+            "firecrawl_total_byte_budget": 5000,
+            # The fixture docs share one body; keep them all as enrichment targets.
+            "near_dup_enabled": False,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    extracted: list[str] = []
+    lock = threading.Lock()
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del kwargs
+        if tool_name == "firecrawl_extract":
+            target = args[0]
+            if not target.startswith("https://"):
+                return []
+            host = target.split("/")[2]
+            with lock:
+                in_flight[host] = in_flight.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), in_flight[host])
+                extracted.append(target)
+            time.sleep(0.05)
+            with lock:
+                in_flight[host] -= 1
+            return [
+                RetrievedDoc(
+                    provider="firecrawl",
+                    title="Full text",
+                    url=target,
+                    snippet="full",
+                    content="Full text evidence. " * 200,
+                )
+            ]
+        provider = "tavily" if tool_name == "tavily_search" else "ddg"
+        return [
+            _search_doc(provider, "https://agency.gov/latency-report"),
+            _search_doc(provider, "https://agency.gov/fan-out-guide"),
+            _search_doc(provider, "https://standards.gov/evidence"),
+            _search_doc(provider, "https://random-blog.example.com/post"),
+        ]
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    state = build_initial_state("research pipeline latency budgets", runtime)
+    updates = create_research_pool_node(runtime)(state)
+
+    stats = updates["metrics"]["firecrawl_enrichment"]
+    assert stats["target_count"] == 3
+    assert stats["enriched_count"] >= 1
+    assert stats["bytes"] <= 5000
+    assert peak.get("agency.gov", 0) == 1
+    assert "https://random-blog.example.com/post" not in extracted
+    corpus = runtime.doc_store(state["run_id"]).get_many(updates["shared_corpus_ids"])
+    enriched = [doc for doc in corpus if (doc.meta or {}).get("full_text")]
+    assert enriched
+    assert all(doc.provider in {"tavily", "ddg"} for doc in enriched)
+    assert sum(len(doc.content.encode("utf-8")) for doc in enriched) <= 5000
+
+
+def test_enrichment_reserves_budget_before_each_call(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "firecrawl_api_key": "test-key",
+            "firecrawl_enrich_top_n": 6,
+            "firecrawl_total_byte_budget": 3000,
+            "research_query_concurrency": 6,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del tool_name, kwargs
+        with lock:
+            calls.append(args[0])
+        time.sleep(0.05)
+        return [
+            RetrievedDoc(
+                provider="firecrawl",
+                title="Full text",
+                url=args[0],
+                snippet="full",
+                content="Full text evidence. " * 250,
+            )
+        ]
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    docs = [annotate_doc(_search_doc("tavily", f"https://agency{idx}.gov/report")) for idx in range(6)]
+    enriched, stats = enrich_with_firecrawl(runtime, docs)
+
+    # Every paid call contributes text; none is dropped after the budget runs out.
+    assert len(calls) == stats["enriched_count"] == 6
+    assert stats["bytes"] <= 3000
+    assert sum(len(doc.content.encode("utf-8")) for doc in enriched) <= 3000
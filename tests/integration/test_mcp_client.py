@@ -67,3 +67,40 @@ def test_mcp_client_transport_mode_fails_if_transport_unavailable():
             client.call_web_tool("ddg_search", "test query", 1)
     finally:
         client.close()
+
+
+def test_inprocess_breakers_are_scoped_per_tool(tmp_path):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "data_dir": str(tmp_path),
+            "singleflight_enabled": False,
+        }
+    )
+    client = MultiServerClient.from_config(cfg)
+    calls = {"firecrawl": 0, "tavily": 0}
+
+    def broken_firecrawl(target: str = "", mode: str = "extract"):
+        calls["firecrawl"] += 1
+        raise RuntimeError("firecrawl down")
+
+    def healthy_tavily(query: str = "", k: int = 5):
+        calls["tavily"] += 1
+        return []
+
+    client.web_server.firecrawl_extract = broken_firecrawl  # type: ignore[method-assign]
+    client.web_server.tavily_search = healthy_tavily  # type: ignore[method-assign]
+    try:
+        for _ in range(4):
+            docs = client.call_web_tool("firecrawl_extract", "https://example.org", "extract")
+            assert docs[0].provider == "fallback"
+        client.call_web_tool("tavily_search", "query", 3)
+        assert calls == {"firecrawl": 3, "tavily": 1}
+        assert client.breaker_states() == {
+            "web:firecrawl_extract": "open",
+            "web:tavily_search": "closed",
+        }
+    finally:
+        client.close()
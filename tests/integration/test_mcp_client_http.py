@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import socket
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
 
@@ -85,3 +87,21 @@ def test_mcp_client_transport_mode_auth_failure_does_not_fallback():
             client.call_web_tool("tavily_search", "auth mismatch", 1)
     finally:
         client.close()
+
+
+def test_mcp_client_streamable_http_multiplexes_concurrent_calls():
+    cfg = _base_http_config()
+    client = MultiServerClient.from_config(cfg)
+    probe = client.startup_probe()
+    paths = ["pyproject.toml", "core/rate_limit.py", "core/pruning.py", "mcp_server/client.py"] * 8
+    try:
+        assert probe.transport_active is True
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            results = list(
+                pool.map(lambda path: client.call_local_tool("read_local_file", path), paths)
+            )
+        assert results == [Path(path).read_text(encoding="utf-8") for path in paths]
+        assert client.transport_active is True
+        assert client.fallback_active is False
+    finally:
+        client.close()
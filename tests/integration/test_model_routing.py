@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from core.models import RetrievedDoc, RunConfig, TenantContext
+from core.pruning import ContextPruner
 from graph.nodes.self_correction import create_self_correction_node
 from graph.nodes.synthesizer import create_synthesizer_node
 from graph.runtime import GraphRuntime
@@ -16,6 +17,7 @@ def mock_runtime():
     runtime.model_router = MagicMock()
     runtime.get_llm_client = MagicMock()
     runtime.tracer = MagicMock()
+    runtime.context_pruner = ContextPruner()
     return runtime
 
 
@@ -77,7 +79,10 @@ Synthesis summary [C1].
     assert call_kwargs["task_type"] == "synthesis"
     assert call_kwargs["tenant_tier"] == "free"
     assert call_kwargs["plan_complexity"] == "high"
-    mock_runtime.get_llm_client.assert_called_with("openai")
+    mock_runtime.get_llm_client.assert_called_with(
+        "openai",
+        request_timeout_seconds=mock_runtime.config.llm_request_timeout_seconds_synthesis,
+    )
     assert "## Executive Summary" in result["report_draft"]
     assert "[C1]" in result["report_draft"]
 
@@ -140,6 +145,9 @@ Corrected summary [C1].
     call_kwargs = mock_runtime.model_router.select_model.call_args.kwargs
     assert call_kwargs["task_type"] == "correction"
     assert call_kwargs["tenant_tier"] == "free"
-    mock_runtime.get_llm_client.assert_called_with("anthropic")
+    mock_runtime.get_llm_client.assert_called_with(
+        "anthropic",
+        request_timeout_seconds=mock_runtime.config.llm_request_timeout_seconds_correction,
+    )
     assert "## Executive Summary" in result["report_draft"]
     assert "[C1]" in result["report_draft"]
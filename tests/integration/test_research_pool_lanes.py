@@ -0,0 +1,205 @@
+import time
+
+import pytest
+
+from core.config import load_config
+from core.content_store import full_content
+from core.models import RetrievedDoc
+from core.run_artifacts import DOC_FEATURES
+from graph.nodes.planner import create_planner_node
+from graph.nodes.research_pool import create_research_pool_node
+from graph.pipeline import _dispatch_lanes, build_initial_state
+from graph.runtime import GraphRuntime
+
+
+def _doc(provider: str, idx: int) -> RetrievedDoc:
+    snippet = (
+        f"{provider} evidence {idx}: retrieval latency budgets, provider fan-out, "
+        "deadline handling and partial result merging in research pipelines."
+    )
+    return RetrievedDoc(
+        provider=provider,  # type: ignore[arg-type]
+        title=f"{provider} source {idx}",
+        url=f"https://{provider}{idx}.example.org/report",
+        snippet=snippet,
+        content=f"{snippet} Extended discussion of concurrency and tail latency.",
+        score=0.8,
+    )
+
+
+def test_research_pool_merges_partial_results_when_lane_misses_deadline(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+            "research_lane_deadline_seconds": 0.5,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del args, kwargs
+        if tool_name == "firecrawl_extract":
+            time.sleep(2.0)
+            return [_doc("firecrawl", 1)]
+        provider = "tavily" if tool_name == "tavily_search" else "ddg"
+        return [_doc(provider, 1), _doc(provider, 2)]
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    state = build_initial_state("research pipeline tail latency", runtime)
+    state["firecrawl_requested"] = True
+
+    started = time.perf_counter()
+    updates = create_research_pool_node(runtime)(state)
+    assert time.perf_counter() - started < 1.5
+    assert "lane_deadline_exceeded:firecrawl" in updates["provider_alerts"]
+    assert updates["tavily_docs"] and updates["ddg_docs"]
+    assert not updates.get("firecrawl_docs")
+    assert runtime.doc_store(state["run_id"]).get_many(updates["shared_corpus_ids"])
+
+
+def test_research_pool_skips_lanes_the_scheduler_drops(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+    assert runtime.scheduler is not None
+    for _ in range(3):
+        runtime.scheduler.record("ddg_search", 40.0, False)
+    calls: list[str] = []
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del args, kwargs
+        calls.append(tool_name)
+        return [_doc("tavily", len(calls))]
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    state = build_initial_state("research pipeline tail latency", runtime)
+    updates = create_research_pool_node(runtime)(state)
+
+    assert updates["provider_plan"] == {"tavily": 2, "ddg": 0, "firecrawl": 0}
+    assert set(calls) == {"tavily_search"}
+    assert updates["tavily_docs"]
+    assert not updates.get("ddg_docs")
+
+
+def test_research_pool_caps_doc_content_entering_state(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+            "doc_content_max_chars": 600,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+    padding = " Extended discussion of concurrency and tail latency." * 200
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del args, kwargs
+        provider = "tavily" if tool_name == "tavily_search" else "ddg"
+        docs = [_doc(provider, 1), _doc(provider, 2)]
+        return [doc.model_copy(update={"content": doc.content + padding}) for doc in docs]
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    state = build_initial_state("research pipeline tail latency", runtime)
+    updates = create_research_pool_node(runtime)(state)
+    corpus = runtime.doc_store(state["run_id"]).get_many(updates["shared_corpus_ids"])
+    docs = [*updates["tavily_docs"], *updates["ddg_docs"], *corpus]
+    assert docs and all(len(doc.content) <= 600 for doc in docs)
+    store = runtime.content_store(state["run_id"])
+    assert all(full_content(doc, store).endswith(padding) for doc in docs)
+
+
+def test_provider_stats_outlive_the_runtime_and_planner_stores_the_plan():
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+        }
+    )
+    first = GraphRuntime.from_config(cfg)
+    assert first.scheduler is not None
+    for _ in range(3):
+        first.scheduler.record("ddg_search", 40.0, False)
+
+    # A later run on the same MCP client plans from what the first one measured.
+    second = GraphRuntime(
+        config=cfg,
+        mcp_client=first.mcp_client,
+        memory_store=first.memory_store,
+        tracer=first.tracer,
+        model_router=first.model_router,
+    )
+    assert second.scheduler is first.scheduler
+    state = build_initial_state("research pipeline tail latency", second)
+    updates = create_planner_node(second)(state)
+    assert updates["provider_plan"] == {"tavily": 2, "ddg": 0, "firecrawl": 0}
+    assert _dispatch_lanes(second)({**state, **updates}) == ["research_tavily"]
+
+
+def test_doc_features_are_scoped_to_the_run(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del args, kwargs
+        provider = "tavily" if tool_name == "tavily_search" else "ddg"
+        return [_doc(provider, 1), _doc(provider, 2)]
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    state = build_initial_state("research pipeline tail latency", runtime)
+    create_research_pool_node(runtime)(state)
+
+    features = runtime.artifacts.get(state["run_id"], DOC_FEATURES)
+    assert features is runtime.doc_features(state["run_id"])
+    assert len(features) > 0
+    assert runtime.doc_features("another-run") is not features
+    runtime.artifacts.discard(state["run_id"])
+    assert runtime.artifacts.get(state["run_id"], DOC_FEATURES) is None
+
+
+def test_research_pool_raises_when_every_lane_times_out(monkeypatch):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "balanced",
+            "research_mode": "balanced",
+            "research_lane_deadline_seconds": 0.3,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+
+    def call_web_tool(tool_name: str, *args, **kwargs):
+        del tool_name, args, kwargs
+        time.sleep(1.0)
+        return []
+
+    monkeypatch.setattr(runtime.mcp_client, "call_web_tool", call_web_tool)
+    state = build_initial_state("research pipeline tail latency", runtime)
+    with pytest.raises(TimeoutError, match="research_pool_all_lanes_timed_out"):
+        create_research_pool_node(runtime)(state)
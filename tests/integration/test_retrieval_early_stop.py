@@ -0,0 +1,73 @@
+from core.config import load_config
+from core.models import RetrievedDoc
+from graph.nodes.research_tavily import create_research_tavily_node
+from graph.pipeline import build_initial_state
+from graph.runtime import GraphRuntime
+
+
+def _doc(host: str, idx: int) -> RetrievedDoc:
+    snippet = (
+        "Official guidance on retrieval early stopping, evidence floors and "
+        "domain diversity for research pipelines."
+    )
+    return RetrievedDoc(
+        provider="tavily",
+        title=f"Guidance {idx}",
+        url=f"https://{host}/doc-{idx}",
+        snippet=snippet,
+        content=snippet,
+        score=0.8,
+        meta={"source_tier": "A"},
+    )
+
+
+def _runtime(**overrides) -> GraphRuntime:
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "deep",
+            "research_mode": "balanced",
+            "min_tier_ab_sources": 2,
+            "retrieval_early_stop_min_domains": 3,
+            **overrides,
+        }
+    )
+    return GraphRuntime.from_config(cfg)
+
+
+def _run(runtime: GraphRuntime, per_query_hosts: list[list[str]]):
+    issued: list[str] = []
+
+    def call_web_tool(tool_name: str, query: str, k: int):
+        del tool_name, k
+        issued.append(query)
+        hosts = per_query_hosts[min(len(issued) - 1, len(per_query_hosts) - 1)]
+        return [_doc(host, len(issued) * 10 + idx) for idx, host in enumerate(hosts)]
+
+    runtime.mcp_client.call_web_tool = call_web_tool  # type: ignore[method-assign]
+    state = build_initial_state("retrieval early stopping evidence floors", runtime)
+    updates = create_research_tavily_node(runtime)(state)
+    return issued, updates["tavily_retrieval_stats"]
+
+
+def test_tavily_lane_stops_after_first_query_when_floor_met():
+    runtime = _runtime()
+    issued, stats = _run(runtime, [["agency.gov", "nist.gov", "who.int"]])
+    assert len(issued) == 1
+    assert stats["skipped_query_count"] == 2
+
+
+def test_tavily_lane_keeps_querying_until_domains_are_diverse():
+    runtime = _runtime()
+    issued, stats = _run(runtime, [["agency.gov", "agency.gov"], ["nist.gov", "who.int"]])
+    assert len(issued) == 3
+    assert stats["skipped_query_count"] == 0
+
+
+def test_early_stop_can_be_disabled():
+    runtime = _runtime(retrieval_early_stop_enabled=False)
+    issued, stats = _run(runtime, [["agency.gov", "nist.gov", "who.int"]])
+    assert len(issued) == 3
+    assert stats["skipped_query_count"] == 0
@@ -0,0 +1,71 @@
+from core.bm25 import BM25Index
+from core.doc_features import DocFeatureIndex
+from core.models import QueryProfile, RetrievedDoc, SubTopic
+from core.run_artifacts import CORPUS_BM25, RunArtifacts
+from graph.nodes.sub_research import _slice_docs
+
+
+def _doc(idx: int, title: str, body: str, score: float = 0.5) -> RetrievedDoc:
+    return RetrievedDoc(
+        provider="ddg",
+        title=title,
+        url=f"https://site{idx}.example.org/page",
+        snippet=body[:80],
+        content=body,
+        score=score,
+    )
+
+
+def _corpus() -> list[RetrievedDoc]:
+    return [
+        _doc(0, "Weekly digest", "market update battery news and policy outlook", 0.9),
+        _doc(1, "Battery recycling plants", "battery recycling recovers lithium from cathodes", 0.1),
+        _doc(2, "Recycling overview", "paper glass recycling programs", 0.8),
+        _doc(3, "Wind farms", "offshore wind turbines and foundations", 0.7),
+    ]
+
+
+def test_bm25_ranks_term_dense_title_matches_first():
+    docs = _corpus()
+    index = BM25Index(docs)
+    top = index.top_k("battery recycling", [], k=3)
+    assert [pos for pos, _ in top][:1] == [1]
+    assert {pos for pos, _ in top} == {0, 1, 2}
+    assert all(score > 0 for _, score in top)
+    # Unmatched docs still follow, by provider score, once the matches run out.
+    assert [doc.url for doc in index.ranked("battery recycling", [], k=1)] == [
+        docs[1].url,
+        *[docs[pos].url for pos, _ in top[1:]],
+        docs[3].url,
+    ]
+    assert BM25Index(docs, features=DocFeatureIndex()).top_k("battery recycling", [], 3) == top
+
+
+def test_title_weight_breaks_body_only_ties():
+    docs = [
+        _doc(0, "Notes", "grid storage grid storage"),
+        _doc(1, "Grid storage", "grid storage notes"),
+    ]
+    assert BM25Index(docs, title_weight=3.0).top_k("grid storage", [], 1)[0][0] == 1
+
+
+def test_slice_uses_shared_index_and_covers_check():
+    docs = _corpus()
+    index = BM25Index(docs)
+    profile = QueryProfile(original_query="energy", normalized_query="energy")
+    subtopic = SubTopic(id="S1", facet="Battery recycling", sub_query="battery recycling evidence")
+    sliced = _slice_docs(docs, subtopic=subtopic, query_profile=profile, max_docs=2, bm25=index)
+    assert sliced[0].url == docs[1].url
+    assert len(sliced) == 2
+    assert index.covers(docs)
+    assert not index.covers(docs[:2])
+
+
+def test_run_artifacts_are_scoped_per_run():
+    artifacts = RunArtifacts()
+    index = artifacts.put("run-1", CORPUS_BM25, BM25Index(_corpus()))
+    assert artifacts.get("run-1", CORPUS_BM25) is index
+    assert artifacts.get("run-2", CORPUS_BM25) is None
+    artifacts.discard("run-1")
+    assert artifacts.get("run-1", CORPUS_BM25) is None
+    assert len(artifacts) == 0
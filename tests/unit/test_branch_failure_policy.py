@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
-from core.models import SubTopic
+from core.doc_store import DocStore
+from core.models import RetrievedDoc, SubTopic
 from graph.nodes.sub_research import create_sub_research_node
 from graph.pipeline import _dispatch_subresearch
 
@@ -18,19 +19,38 @@ def test_dispatch_subresearch_emits_send_for_each_subtopic():
     assert all(getattr(item, "node", "") == "sub_research" for item in sends)
 
 
+def test_dispatch_subresearch_sends_corpus_by_reference():
+    docs = [
+        RetrievedDoc(provider="ddg", title=f"Doc {idx}", url=f"https://e{idx}.org", content="x" * 5000)
+        for idx in range(3)
+    ]
+    store = DocStore()
+    ids = store.put_many(docs)
+    state = {
+        "subtopics": [SubTopic(id="S1", facet="Evidence", sub_query="q1")],
+        "shared_corpus_ids": ids,
+    }
+    (send,) = _dispatch_subresearch(state)
+    assert send.arg["shared_corpus_ids"] == ids
+    assert "shared_corpus_docs" not in send.arg
+    assert store.get_many(send.arg["shared_corpus_ids"]) == docs
+    assert store.put_many(docs) == ids
+
+
 def test_sub_research_fail_closed_when_no_docs():
     runtime = SimpleNamespace(
         config=SimpleNamespace(
             subreport_failure_policy="fail_closed",
             subreport_gapfill_enabled=False,
             subreport_min_claims=3,
-        )
+        ),
+        doc_features=lambda run_id: None,
     )
     node = create_sub_research_node(runtime)
     updates = node(
         {
             "query": "Test query",
-            "shared_corpus_docs": [],
+            "shared_corpus_ids": [],
             "subtopic_id": "S1",
             "subtopic_facet": "Evidence",
             "subtopic_query": "focused sub query",
@@ -47,13 +67,14 @@ def test_sub_research_continue_constrained_when_no_docs():
             subreport_failure_policy="continue_constrained",
             subreport_gapfill_enabled=False,
             subreport_min_claims=3,
-        )
+        ),
+        doc_features=lambda run_id: None,
     )
     node = create_sub_research_node(runtime)
     updates = node(
         {
             "query": "Test query",
-            "shared_corpus_docs": [],
+            "shared_corpus_ids": [],
             "subtopic_id": "S1",
             "subtopic_facet": "Evidence",
             "subtopic_query": "focused sub query",
@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from core.concurrency import bounded_fan_out, raise_first_error, run_with_deadline
+
+
+def test_bounded_fan_out_preserves_input_order_and_limits_width():
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.02 * (5 - item))
+        with lock:
+            in_flight["now"] -= 1
+        return item * 10
+
+    results = bounded_fan_out(work, [0, 1, 2, 3, 4], max_workers=3)
+    assert [r.value for r in results] == [0, 10, 20, 30, 40]
+    assert in_flight["peak"] <= 3
+    assert all(r.latency_ms > 0 for r in results)
+
+
+def test_bounded_fan_out_wall_clock_tracks_slowest_call():
+    started = time.perf_counter()
+    bounded_fan_out(lambda _: time.sleep(0.1), range(4), max_workers=4)
+    assert time.perf_counter() - started < 0.3
+
+
+def test_raise_first_error_reraises_in_input_order():
+    def work(item: int) -> int:
+        if item in {1, 2}:
+            raise ValueError(f"boom-{item}")
+        return item
+
+    results = bounded_fan_out(work, [0, 1, 2], max_workers=3)
+    assert results[0].ok and not results[1].ok
+    with pytest.raises(ValueError, match="boom-1"):
+        raise_first_error(results)
+
+
+def test_run_with_deadline_returns_partial_results():
+    started = time.perf_counter()
+    results = run_with_deadline(
+        {
+            "fast": lambda: "ok",
+            "slow": lambda: time.sleep(1.0),
+        },
+        deadline_seconds=0.1,
+    )
+    assert time.perf_counter() - started < 0.5
+    assert results["fast"].value == "ok"
+    assert isinstance(results["slow"].error, TimeoutError)
@@ -0,0 +1,44 @@
+from core.content_store import ContentStore, cap_doc_content, content_length, full_content
+from core.models import RetrievedDoc
+from core.pruning import ContextPruner
+from core.run_artifacts import CONTENT_STORE, RunArtifacts
+
+
+def _page(idx: int) -> str:
+    paragraphs = "".join(
+        f"<p>Section {n} of filing {idx}: the operator reported storage output and tariffs.</p>"
+        for n in range(60)
+    )
+    return f"<html><body><article>{paragraphs}</article></body></html>"
+
+
+def test_cap_keeps_window_in_doc_and_full_text_in_store():
+    store = ContentStore()
+    long_doc = RetrievedDoc(provider="firecrawl", title="Filing", url="https://a.gov/f", content=_page(1))
+    short_doc = RetrievedDoc(provider="ddg", title="Note", url="https://b.org/n", content="short note")
+    capped = cap_doc_content([long_doc, short_doc, long_doc], store, 500)
+    assert len(capped[0].content) == 500
+    assert capped[1] is short_doc
+    assert capped[0].meta["content_chars"] == len(long_doc.content) == content_length(capped[0])
+    assert full_content(capped[0], store) == long_doc.content
+    assert full_content(capped[0], None) == capped[0].content
+    assert len(store) == 1  # identical pages stored once
+    assert cap_doc_content([long_doc], store, 0)[0] is long_doc
+
+
+def test_pruner_extracts_capped_docs_from_the_full_page():
+    store = ContentStore()
+    docs = [RetrievedDoc(provider="firecrawl", title="Filing", url="https://a.gov/f", content=_page(2))]
+    capped = cap_doc_content(docs, store, 400)
+    full, _ = ContextPruner(min_chars=200).prune(docs, per_doc_tokens=300)
+    lazy, _ = ContextPruner(min_chars=200).prune(capped, per_doc_tokens=300, content_store=store)
+    assert [doc.content for doc in lazy] == [doc.content for doc in full]
+
+
+def test_content_store_is_created_once_per_run():
+    artifacts = RunArtifacts()
+    first = artifacts.setdefault("run-1", CONTENT_STORE, ContentStore)
+    assert artifacts.setdefault("run-1", CONTENT_STORE, ContentStore) is first
+    assert artifacts.setdefault("run-2", CONTENT_STORE, ContentStore) is not first
+    artifacts.discard("run-1")
+    assert artifacts.get("run-1", CONTENT_STORE) is None
@@ -0,0 +1,108 @@
+from core.doc_features import DocFeatureIndex
+from core.models import QueryProfile, RetrievedDoc
+from core.source_quality import filter_docs_for_query
+from core.verification import (
+    CorroborationIndex,
+    corroboration_count,
+    corroboration_counts,
+    relevance_score,
+    verify_claim,
+    verify_claims,
+    wide_then_hard_filter,
+)
+from scripts.bench_common import synthetic_corpus
+
+
+def _profile() -> QueryProfile:
+    return QueryProfile(
+        original_query="retrieval latency benchmark",
+        normalized_query="retrieval latency benchmark",
+        domain_facets=["evaluation", "citation"],
+        typed_constraints={"location_constraint": "provider dataset"},
+    )
+
+
+def test_indexed_scorers_match_unindexed_results():
+    docs = synthetic_corpus(40, body_words=60)
+    profile = _profile()
+    index = DocFeatureIndex()
+    query = "retrieval latency benchmark"
+    for doc in docs:
+        assert relevance_score(doc, query=query, facets=profile.domain_facets) == relevance_score(
+            doc, query=query, facets=profile.domain_facets, features=index
+        )
+        assert corroboration_count(doc, docs) == corroboration_count(doc, docs, index)
+        kwargs = dict(
+            claim_id="C1",
+            doc=doc,
+            peers=docs,
+            query_profile=profile,
+            query=query,
+            availability_policy="unknown_allowed",
+            freshness_max_months=600,
+            verification_min_sources_per_claim=2,
+            require_primary_or_official_proof=False,
+        )
+        assert verify_claim(**kwargs) == verify_claim(**kwargs, features=index)
+
+    plain = wide_then_hard_filter(docs, query=query, profile=profile, freshness_max_months=600)
+    indexed = wide_then_hard_filter(
+        docs, query=query, profile=profile, freshness_max_months=600, features=index
+    )
+    assert plain[0] == indexed[0]
+    assert plain[1] == indexed[1]
+    assert filter_docs_for_query(docs, profile) == filter_docs_for_query(
+        docs, profile, features=index
+    )
+
+
+def test_index_reuses_features_across_doc_copies():
+    doc = synthetic_corpus(1)[0]
+    index = DocFeatureIndex()
+    features = index.get(doc)
+    copy = doc.model_copy(update={"url": "https://example.com/canonical", "meta": {"x": 1}})
+    assert index.get(copy) is features
+    assert index.stats() == {"docs": 1, "hits": 1, "misses": 1}
+    assert index.get(doc.model_copy(update={"snippet": "changed"})) is not features
+    dated = doc.model_copy(update={"meta": {"published_at": "2020-01-01"}})
+    assert index.get(dated).published.year == 2020
+    assert index.query_tokens("latency budget", ["crawler"]) is index.query_tokens(
+        "latency budget", ["crawler"]
+    )
+
+
+def test_corroboration_index_matches_peer_scan():
+    topics = ["solar grid storage", "grid storage pricing", "vaccine trial results", "storage"]
+    docs = [
+        RetrievedDoc(
+            provider="ddg",
+            title=f"{topic} report",
+            url=f"https://site{idx % 5}.example.com/{idx}",
+            snippet=f"{topic} analysis",
+        )
+        for idx, topic in enumerate(topics * 4)
+    ]
+    docs.append(docs[3])  # a repeated peer counts once per occurrence
+    docs.append(docs[0].model_copy(update={"url": ""}))
+    expected = [corroboration_count(doc, docs) for doc in docs]
+    assert len(set(expected)) > 1
+    assert corroboration_counts(docs, docs) == expected
+    assert corroboration_counts(docs, docs, DocFeatureIndex()) == expected
+    assert CorroborationIndex(docs).count(docs[-1]) == corroboration_count(docs[-1], docs)
+
+
+def test_verify_claims_batch_matches_single_calls():
+    docs = synthetic_corpus(12, body_words=40)
+    options = dict(
+        query_profile=_profile(),
+        query="retrieval latency benchmark",
+        availability_policy="unknown_allowed",
+        freshness_max_months=600,
+        verification_min_sources_per_claim=3,
+        require_primary_or_official_proof=False,
+    )
+    claims = [(f"C{idx}", doc) for idx, doc in enumerate(docs[:5])]
+    expected = [
+        verify_claim(claim_id=claim_id, doc=doc, peers=docs, **options) for claim_id, doc in claims
+    ]
+    assert verify_claims(claims, peers=docs, **options) == expected
@@ -0,0 +1,49 @@
+from core.citations import normalize_url, normalized_domain
+from core.doc_record import DocRecord
+from core.models import RetrievedDoc
+from core.source_quality import annotate_doc, prioritize_docs
+from core.verification import _tokenize, extract_document_date
+
+
+def _doc(url: str = "https://WWW.Arxiv.org/abs/1234/?utm=x#top", **extra) -> RetrievedDoc:
+    return RetrievedDoc(
+        provider="tavily",
+        title="Benchmark report 2024-03-05",
+        url=url,
+        snippet="Menu | Home\nRetrieval latency benchmark across providers\nCopyright 2024",
+        content="Full body text.",
+        **extra,
+    )
+
+
+def test_record_fields_match_primitive_helpers():
+    doc = _doc()
+    record = DocRecord.from_doc(doc)
+    assert record.url == normalize_url(doc.url)
+    assert record.domain == normalized_domain(doc.url) == "arxiv.org"
+    assert record.tier == "A"
+    assert record.tokens == frozenset(_tokenize(f"{doc.title} {doc.snippet}"))
+    assert record.published == extract_document_date(doc)
+    assert DocRecord.from_doc(RetrievedDoc(provider="fallback", title="x")).domain == ""
+
+
+def test_to_doc_matches_annotate_and_skips_redundant_copies():
+    doc = _doc()
+    annotated = DocRecord.from_doc(doc).to_doc()
+    assert annotated.model_dump() == annotate_doc(doc).model_dump()
+    assert DocRecord.from_doc(annotated).to_doc() is annotated
+    assert annotate_doc(annotated) is annotated
+    assert DocRecord.from_doc(doc).to_doc(canonical_url=True).url == "https://www.arxiv.org/abs/1234"
+
+
+def test_prioritize_docs_reuses_annotated_docs():
+    docs = [
+        _doc("https://reddit.com/r/x", score=0.9),
+        _doc("https://nist.gov/report", score=0.1),
+        _doc("https://example.com/post", score=0.5),
+    ]
+    first = prioritize_docs(docs, source_quality_bar="high_confidence", min_tier_ab_sources=1)
+    assert [d.meta["source_tier"] for d in first] == ["A", "C", "C"]
+    assert first[-1].url == "https://reddit.com/r/x"
+    second = prioritize_docs(first, source_quality_bar="high_confidence", min_tier_ab_sources=1)
+    assert all(a is b for a, b in zip(first, second, strict=True))
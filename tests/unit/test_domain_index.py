@@ -0,0 +1,61 @@
+from core.domain_index import (
+    DEFAULT_LISTS_DIR,
+    DomainClassifier,
+    DomainSuffixTrie,
+    domain_classifier_for,
+    load_domain_list,
+)
+from core.models import RunConfig
+from core.source_quality import is_low_trust_source, source_tier
+
+
+def test_suffix_trie_matches_listed_suffixes_only():
+    trie = DomainSuffixTrie()
+    trie.add("example.org", (2, "tier_a", "A"))
+    trie.add("news.example.org", (4, "low_trust", "C"))
+    assert trie.matches("example.org") == [(2, "tier_a", "A")]
+    assert trie.matches("a.news.example.org") == [(2, "tier_a", "A"), (4, "low_trust", "C")]
+    assert trie.matches("badexample.org") == []
+    assert trie.matches("org") == []
+
+
+def test_default_lists_keep_existing_tiers():
+    assert source_tier("https://www.arxiv.org/abs/1") == "A"
+    assert source_tier("https://cs.nist.gov/x") == "A"
+    assert source_tier("https://news.reuters.com/x") == "B"
+    assert source_tier("https://stanford.edu/about") == "B"
+    assert source_tier("https://reddit.com/r/x", "ddg", "thread") == "C"
+    assert source_tier("https://example.com/x", "tavily", "title") == "C"
+    assert source_tier("https://example.com/x") == "unknown"
+    assert is_low_trust_source("https://m.medium.com/post")
+    assert not is_low_trust_source("https://arxiv.org/abs/1")
+    assert ("arxiv.org", "") in load_domain_list(DEFAULT_LISTS_DIR / "tier_a.txt")
+
+
+def test_tenant_allow_and_deny_lists_override_defaults(tmp_path):
+    tenant_dir = tmp_path / "domain_lists" / "acme"
+    tenant_dir.mkdir(parents=True)
+    (tenant_dir / "allow.txt").write_text("# trusted\nmedium.com\ninternal.example.com A\n")
+    (tenant_dir / "deny.txt").write_text("arxiv.org\nagency.gov\n")
+    config = RunConfig(data_dir=str(tmp_path), tenant_id="acme")
+    classifier = domain_classifier_for(config)
+
+    assert source_tier("https://medium.com/p", classifier=classifier) == "B"
+    assert not is_low_trust_source("https://medium.com/p", classifier=classifier)
+    assert source_tier("https://wiki.internal.example.com/p", classifier=classifier) == "A"
+    assert source_tier("https://arxiv.org/abs/1", classifier=classifier) == "C"
+    assert source_tier("https://agency.gov/p", classifier=classifier) == "C"
+    assert is_low_trust_source("https://arxiv.org/abs/1", classifier=classifier)
+    # Other tenants keep the shared defaults.
+    default = domain_classifier_for(RunConfig(data_dir=str(tmp_path), tenant_id="other"))
+    assert source_tier("https://arxiv.org/abs/1", classifier=default) == "A"
+    assert domain_classifier_for(config) is classifier
+
+
+def test_classification_is_memoized_per_host():
+    classifier = DomainClassifier()
+    classifier.add("arxiv.org", "tier_a")
+    first = classifier.classify("arxiv.org")
+    assert classifier.classify("arxiv.org") is first
+    classifier.add("arxiv.org", "deny")
+    assert classifier.classify("arxiv.org").low_trust
@@ -0,0 +1,95 @@
+import random
+import re
+
+from core import source_quality
+from core.source_quality import clean_evidence_text, is_boilerplate_line
+
+
+def _reference_clean(text: str, *, max_chars: int = 180) -> str:
+    # The original multi-pass cleaner; the compiled one must match it exactly.
+    source = (text or "").replace("\\n", "\n")
+    source = re.sub(r"<[^>]+>", " ", source)
+    source = re.sub(
+        r"(^|\s)(menu|home|about|contact|privacy|terms)\s*(\||/|$)", " ", source, flags=re.IGNORECASE
+    )
+    lines = [ln.strip() for ln in source.splitlines()]
+    cleaned = [ln for ln in lines if ln and not is_boilerplate_line(ln)]
+    if not cleaned:
+        cleaned = [re.sub(r"\s+", " ", source).strip()]
+    normalized = re.sub(r"\s+", " ", " ".join(cleaned)).strip()
+    return normalized[: max(40, max_chars)].strip()
+
+
+_PIECES = (
+    "Grid storage output rose",
+    "battery",
+    "Menu |",
+    "HOME/",
+    "about",
+    "Contact  /",
+    "prıvacy |",
+    "terms",
+    "<div class='x'>",
+    "</p>",
+    "<unclosed",
+    "\\n",
+    "\n",
+    "\r\n",
+    "\r",
+    "\x1c",
+    " ",
+    "\x85",
+    "\x0b",
+    "\t",
+    " ",
+    "   ",
+    "Subscribe to our newsletter",
+    "cookie",
+    "|",
+    "/",
+    "42%",
+)
+
+
+def _random_text(rng: random.Random) -> str:
+    count = rng.choice((0, 1, 5, 40, 400, 3000))
+    return " ".join(rng.choice(_PIECES) for _ in range(count)) if count else rng.choice(("", " ", "\n"))
+
+
+def test_matches_reference_cleaner_on_random_pages():
+    rng = random.Random(22)
+    for _ in range(1500):
+        text = _random_text(rng)
+        max_chars = rng.choice((0, 25, 40, 180, 600, 5000))
+        source_quality._clean_cache.clear()
+        assert clean_evidence_text(text, max_chars=max_chars) == _reference_clean(
+            text, max_chars=max_chars
+        ), repr(text[:200])
+
+
+def test_matches_reference_on_edge_pages():
+    pages = [
+        None,
+        "Subscribe to our newsletter\ncookie policy\n",
+        ("menu | " * 3000) + "\n" + ("<b>x</b>" * 2000),
+        "word " * 5000,
+        "x" * 9000 + "\r" + "\n" + "y" * 9000,
+        " Terms /" + "a" * 4090 + " Menu" + " " * 10 + "|" + " body text" * 30,
+        "b" * 4094 + "\r\n" + " privacy\n" + "c" * 100,
+    ]
+    for page in pages:
+        for max_chars in (10, 180, 20_000):
+            source_quality._clean_cache.clear()
+            assert clean_evidence_text(page, max_chars=max_chars) == _reference_clean(
+                page, max_chars=max_chars
+            )
+
+
+def test_repeated_pages_are_served_from_memo():
+    page = "Battery storage output rose 12% in 2025.\n" * 50
+    source_quality._clean_cache.clear()
+    first = clean_evidence_text(page)
+    assert len(source_quality._clean_cache) == 1
+    assert clean_evidence_text(page) is first
+    clean_evidence_text(page, max_chars=300)
+    assert len(source_quality._clean_cache) == 2
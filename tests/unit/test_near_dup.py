@@ -0,0 +1,46 @@
+import random
+
+from core.models import RetrievedDoc
+from core.near_dup import minhash_signature, near_duplicate_groups, signature_similarity
+from graph.nodes.research_pool import _dedupe_docs
+
+_WORDS = (
+    "grid operators reported record battery storage output during the evening peak while "
+    "regulators reviewed interconnection queues and utilities proposed new tariffs for "
+    "distributed solar customers across several western states this quarter"
+).split()
+
+
+def _article(seed: int, words: int = 160) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def test_signature_similarity_tracks_shared_shingles():
+    base = _article(1)
+    syndicated = f"Reprinted from Wire Service. {base} Share this story on social media."
+    assert signature_similarity(minhash_signature(base), minhash_signature(base)) == 1.0
+    assert signature_similarity(minhash_signature(base), minhash_signature(syndicated)) >= 0.8
+    assert signature_similarity(minhash_signature(base), minhash_signature(_article(2))) < 0.5
+    assert minhash_signature("too short") is None
+
+
+def test_groups_merge_near_duplicates_transitively():
+    base = _article(3)
+    texts = [base, _article(4), f"{base} Updated.", "", f"Mirror: {base}"]
+    assert near_duplicate_groups(texts) == [0, 1, 0, 3, 0]
+
+
+def test_corpus_dedupe_keeps_highest_tier_copy_in_place():
+    body = _article(5)
+    docs = [
+        RetrievedDoc(provider="ddg", title="Blog copy", url="https://medium.com/p/1", content=body),
+        RetrievedDoc(provider="ddg", title="Other", url="https://example.com/x", content=_article(6)),
+        RetrievedDoc(provider="tavily", title="Agency", url="https://www.energy.gov/r", content=body),
+        RetrievedDoc(provider="ddg", title="Repeat", url="https://example.com/x?utm=1", content="x"),
+    ]
+    kept, collapsed = _dedupe_docs(docs, near_dup_threshold=0.8)
+    assert [doc.url for doc in kept] == ["https://www.energy.gov/r", "https://example.com/x"]
+    assert collapsed == 1
+    kept, collapsed = _dedupe_docs(docs)
+    assert len(kept) == 3 and collapsed == 0
@@ -1,8 +1,13 @@
 from core.config import load_config
-from mcp_server.plugin_registry import build_plugin_registry
+from mcp_server.plugin_registry import ProviderScheduler, build_plugin_registry
 from mcp_server.web_server import WebMCPServer
 
 
+def _scheduler(tmp_path, **overrides) -> ProviderScheduler:
+    cfg = load_config({"interactive_hitl": False, "data_dir": str(tmp_path), **overrides})
+    return ProviderScheduler.from_config(cfg, WebMCPServer(cfg))
+
+
 def test_plugin_registry_contains_default_plugins():
     cfg = load_config({"interactive_hitl": False})
     server = WebMCPServer(cfg)
@@ -10,3 +15,57 @@ def test_plugin_registry_contains_default_plugins():
     assert "tavily" in registry
     assert "ddg" in registry
     assert registry["tavily"].name == "tavily"
+    assert registry["firecrawl"].tool_name == "firecrawl_extract"
+    assert registry["tavily"].estimate_cost("q", 5) == cfg.tavily_cost_per_call
+    assert registry["ddg"].estimate_cost("q", 5) == 0.0
+
+
+def test_plugins_report_rolling_health(tmp_path):
+    scheduler = _scheduler(tmp_path, tavily_rpm=30)
+    scheduler.record("tavily_search", 100.0, True)
+    scheduler.record("tavily_search", 300.0, False)
+    health = scheduler.health()["tavily"]
+    assert health.samples == 2
+    assert health.latency_ms == 200.0
+    assert health.error_rate == 0.5
+    assert health.remaining_tokens == 30.0
+    assert scheduler.health()["ddg"].samples == 0
+
+
+def test_scheduler_grants_full_demand_to_unmeasured_providers(tmp_path):
+    scheduler = _scheduler(tmp_path)
+    demand = {"tavily": 3, "ddg": 3, "firecrawl": 0}
+    assert scheduler.plan(demand, latency_budget_seconds=90) == demand
+
+
+def test_scheduler_drops_failing_and_slow_providers(tmp_path):
+    scheduler = _scheduler(tmp_path, research_query_concurrency=2)
+    for _ in range(3):
+        scheduler.record("ddg_search", 50.0, False)
+        scheduler.record("tavily_search", 4000.0, True)
+    plan = scheduler.plan({"tavily": 4, "ddg": 4}, latency_budget_seconds=5)
+    # ddg is failing; tavily fits one 4s round of two calls into 5s.
+    assert plan == {"tavily": 2, "ddg": 0}
+
+    for _ in range(3):
+        scheduler.record("tavily_search", 50.0, False)
+    assert scheduler.plan({"tavily": 4, "ddg": 4}, latency_budget_seconds=5) == {"tavily": 1, "ddg": 0}
+
+
+def test_scheduler_caps_by_rate_limit_tokens_and_cost(tmp_path):
+    scheduler = _scheduler(
+        tmp_path,
+        tavily_rpm=6,
+        firecrawl_rpm=60,
+        tavily_cost_per_call=0.01,
+        firecrawl_cost_per_call=0.004,
+        research_cost_budget=0.025,
+    )
+    scheduler.plugins["tavily"].limiter.tokens = 0.0  # type: ignore[attr-defined]
+    demand = {"tavily": 4, "ddg": 4, "firecrawl": 3}
+    # An empty tavily bucket refills one token within the 10s budget.
+    assert scheduler.plan(demand, latency_budget_seconds=10) == {"tavily": 1, "ddg": 4, "firecrawl": 3}
+
+    # Cheaper firecrawl spends the budget first, leaving nothing for tavily.
+    scheduler.cost_budget = 0.015
+    assert scheduler.plan(demand, latency_budget_seconds=10) == {"tavily": 0, "ddg": 4, "firecrawl": 3}
@@ -1,5 +1,12 @@
 from core.models import RetrievedDoc
-from core.pruning import dedupe_docs, prune_context_docs
+from core.pruning import (
+    ContextPruner,
+    ExtractionCache,
+    clean_html_or_text,
+    dedupe_docs,
+    prune_context_docs,
+    trafilatura,
+)
 
 
 def test_dedupe_and_prune_context_docs():
@@ -30,3 +37,54 @@ def test_dedupe_and_prune_context_docs():
     assert len(pruned) >= 1
     assert all(len(doc.content) <= 20 * 4 for doc in pruned)
 
+
+
+def _article(idx: int) -> str:
+    paragraphs = "".join(
+        f"<p>Paragraph {n} of report {idx}: grid operators recorded battery storage output.</p>"
+        for n in range(40)
+    )
+    return f"<html><body><nav>Menu | Home</nav><article>{paragraphs}</article></body></html>"
+
+
+def test_extraction_cache_reuses_pages_across_runs(tmp_path):
+    docs = [
+        RetrievedDoc(provider="firecrawl", title=f"Doc {idx}", url=f"https://e{idx}.org", content=_article(idx))
+        for idx in range(3)
+    ] + [RetrievedDoc(provider="ddg", title="Short", url="https://s.org", snippet="<b>Short</b> snippet")]
+    path = tmp_path / "extraction_cache.sqlite3"
+    expected = [
+        clean_html_or_text(doc.content or doc.snippet)[:2000]
+        for doc in docs
+    ]
+
+    first = ContextPruner(cache=ExtractionCache(path), min_chars=200)
+    pruned, stats = first.prune(docs, per_doc_tokens=500, total_tokens=5000)
+    assert [doc.content for doc in pruned] == expected
+    assert (stats.extracted, stats.skipped_small, stats.memory_hits) == (3, 1, 0)
+    _, stats = first.prune(docs, per_doc_tokens=500, total_tokens=5000)
+    assert (stats.extracted, stats.memory_hits) == (0, 3)
+    first.close()
+
+    second = ContextPruner(cache=ExtractionCache(path), min_chars=200)
+    pruned, stats = second.prune(docs, per_doc_tokens=500, total_tokens=5000)
+    assert [doc.content for doc in pruned] == expected
+    assert (stats.extracted, stats.disk_hits) == (0, 3)
+    assert stats.elapsed_ms > 0
+    second.close()
+
+
+def test_pool_extraction_matches_inline():
+    docs = [
+        RetrievedDoc(provider="firecrawl", title=f"Doc {idx}", url=f"https://e{idx}.org", content=_article(idx))
+        for idx in range(2)
+    ]
+    pooled = ContextPruner(workers=1, min_chars=200)
+    try:
+        pruned, stats = pooled.prune(docs)
+    finally:
+        pooled.close()
+    inline, _ = ContextPruner(min_chars=200).prune(docs)
+    assert [doc.content for doc in pruned] == [doc.content for doc in inline]
+    assert stats.extracted == 2
+    assert stats.pooled is (trafilatura is not None)
@@ -0,0 +1,88 @@
+from core.config import load_config
+from core.models import RetrievedDoc, TaskSpec
+from core.query_planning import collapse_near_duplicate_queries, query_tokens
+from graph.nodes.research_tavily import create_research_tavily_node
+from graph.pipeline import build_initial_state
+from graph.runtime import GraphRuntime
+
+BASE = "langgraph retry policy"
+
+
+def test_query_tokens_drop_stopwords_and_case():
+    assert query_tokens("LangGraph and the Retry policy") == {"langgraph", "retry", "policy"}
+
+
+def test_collapse_merges_filler_variants_and_keeps_distinct_facets():
+    kept, decisions = collapse_near_duplicate_queries(
+        [
+            f"{BASE} mechanism overview technical foundations",
+            f"{BASE} mechanism architecture technical foundations",
+            f"{BASE} limitations false positives counterevidence",
+            BASE,
+        ]
+    )
+    assert kept == [
+        f"{BASE} mechanism overview technical foundations",
+        f"{BASE} limitations false positives counterevidence",
+        BASE,
+    ]
+    assert decisions == [
+        {
+            "dropped": f"{BASE} mechanism architecture technical foundations",
+            "kept": f"{BASE} mechanism overview technical foundations",
+            "similarity": 0.6,
+        }
+    ]
+
+
+def test_collapse_checks_against_issued_queries_and_can_be_disabled():
+    issued = [f"{BASE} standards official documentation benchmark report"]
+    kept, decisions = collapse_near_duplicate_queries(
+        [f"{BASE} official standards documentation benchmark", f"{BASE} site:arxiv.org"],
+        issued=issued,
+    )
+    assert kept == [f"{BASE} site:arxiv.org"]
+    assert decisions[0]["kept"] == issued[0]
+
+    kept, decisions = collapse_near_duplicate_queries([BASE, BASE, f"{BASE} x"], threshold=0)
+    assert kept == [BASE, f"{BASE} x"]
+    assert decisions == []
+
+
+def test_tavily_lane_spends_freed_slot_on_next_distinct_query():
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "research_depth": "deep",
+            "research_mode": "balanced",
+            "retrieval_early_stop_enabled": False,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+    issued: list[str] = []
+
+    def call_web_tool(tool_name: str, query: str, k: int) -> list[RetrievedDoc]:
+        del tool_name, k
+        issued.append(query)
+        return []
+
+    runtime.mcp_client.call_web_tool = call_web_tool  # type: ignore[method-assign]
+    state = build_initial_state("retry policy design", runtime)
+    query = state["query_profile"].normalized_query or state["query"]
+    facets = " ".join(state["query_profile"].domain_facets[:4])
+    state["tasks"] = [
+        TaskSpec(
+            id=1,
+            title="Mechanism",
+            search_query=f"{query} mechanism overview technical foundations {facets}".strip(),
+            tool_hint="tavily",
+        )
+    ]
+    updates = create_research_tavily_node(runtime)(state)
+
+    assert len(issued) == 3
+    assert not any("technical mechanism overview" in item for item in issued)
+    assert updates["tavily_retrieval_stats"]["deduped_query_count"] == 1
+    assert updates["query_dedup"][0]["lane"] == "tavily"
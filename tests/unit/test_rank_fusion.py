@@ -0,0 +1,56 @@
+from core.config import load_config
+from core.models import RetrievedDoc
+from core.rank_fusion import reciprocal_rank_fusion
+from graph.nodes.retrieval import federated_search
+from graph.runtime import GraphRuntime
+
+
+def _doc(provider: str, slug: str) -> RetrievedDoc:
+    return RetrievedDoc(
+        provider=provider,  # type: ignore[arg-type]
+        title=slug,
+        url=f"https://{slug}.example.org/page",
+        snippet="snippet",
+    )
+
+
+def test_rrf_rewards_agreement_across_providers():
+    tavily = [_doc("tavily", "a"), _doc("tavily", "b"), _doc("tavily", "c")]
+    ddg = [_doc("ddg", "c"), _doc("ddg", "a"), _doc("ddg", "d")]
+    fused = reciprocal_rank_fusion([tavily, ddg], limit=3, rank_constant=60)
+    assert [doc.title for doc in fused] == ["a", "c", "b"]
+    assert fused[0].meta["rrf_providers"] == ["tavily", "ddg"]
+    assert fused[0].meta["rrf_score"] > fused[1].meta["rrf_score"]
+
+
+def test_rrf_returns_fallback_docs_only_when_nothing_ranked():
+    fallback = RetrievedDoc(provider="fallback", title="fallback", url="", snippet="none")
+    assert reciprocal_rank_fusion([[fallback], []], limit=2) == [fallback]
+    fused = reciprocal_rank_fusion([[fallback], [_doc("ddg", "x")]], limit=2)
+    assert [doc.title for doc in fused] == ["x"]
+
+
+def test_federated_search_asks_each_provider_for_fewer_results(tmp_path):
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_mode": "inprocess",
+            "data_dir": str(tmp_path),
+            "federated_provider_k_ratio": 0.6,
+        }
+    )
+    runtime = GraphRuntime.from_config(cfg)
+    requested: dict[str, int] = {}
+
+    def call_web_tool(tool_name: str, query: str, k: int):
+        requested[tool_name] = k
+        provider = "tavily" if tool_name == "tavily_search" else "ddg"
+        return [_doc(provider, f"{provider}{idx}") for idx in range(k)] + [_doc(provider, "shared")]
+
+    runtime.mcp_client.call_web_tool = call_web_tool  # type: ignore[method-assign]
+    docs = federated_search(runtime, "query", 5)
+    assert requested == {"tavily_search": 3, "ddg_search": 3}
+    assert len(docs) == 5
+    assert runtime.scheduler is not None
+    assert runtime.scheduler.health()["ddg"].samples == 1
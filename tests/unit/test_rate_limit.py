@@ -1,4 +1,29 @@
-from core.rate_limit import RetryPolicy, call_with_retries
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from core.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    AsyncTokenBucketLimiter,
+    CircuitBreaker,
+    RateLimiter,
+    RetryBudget,
+    RetryPolicy,
+    TokenBucketLimiter,
+    acall_with_retries,
+    call_with_retries,
+    retry_after_seconds,
+)
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.example.org/v1/scrape")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError(f"{status} error", request=request, response=response)
 
 
 def test_retry_policy_succeeds_after_transient_errors():
@@ -17,3 +42,234 @@ def test_retry_policy_succeeds_after_transient_errors():
     assert value == "ok"
     assert attempts["count"] == 3
 
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_shares_sync_bucket():
+    bucket = TokenBucketLimiter(60)
+    limiter = AsyncTokenBucketLimiter(bucket)
+    bucket.tokens = 1.0
+    await limiter.acquire()
+    assert bucket.try_acquire() > 0.0
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_polls_io_backends_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    polled_from: list[int] = []
+
+    class RemoteBucket(RateLimiter):
+        def try_acquire(self) -> float:
+            polled_from.append(threading.get_ident())
+            return 0.0
+
+    await AsyncTokenBucketLimiter(RemoteBucket()).acquire()
+    assert polled_from and polled_from[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_async_retry_policy_succeeds_after_transient_errors():
+    attempts = {"count": 0}
+
+    async def flaky():
+        attempts["count"] += 1
+        if attempts["count"] < 2:
+            raise RuntimeError("503 service unavailable")
+        return "ok"
+
+    value = await acall_with_retries(
+        flaky,
+        policy=RetryPolicy(max_retries=2, base_delay=0.01, max_delay=0.02, jitter=0.0),
+    )
+    assert value == "ok"
+    assert attempts["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_serves_waiters_in_arrival_order():
+    bucket = TokenBucketLimiter(600, burst=1, name="fifo")
+    limiter = AsyncTokenBucketLimiter(bucket)
+    order: list[int] = []
+
+    async def worker(idx: int) -> None:
+        await limiter.acquire()
+        order.append(idx)
+
+    tasks = []
+    for idx in range(4):
+        tasks.append(asyncio.create_task(worker(idx)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2, 3]
+    assert bucket.wait_stats()["acquire_count"] == 4
+    assert bucket.wait_stats()["wait_seconds_total"] > 0.0
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_cancelled_waiter_hands_turn_to_next():
+    bucket = TokenBucketLimiter(600, burst=1, name="cancel")
+    limiter = AsyncTokenBucketLimiter(bucket)
+    await limiter.acquire()
+
+    head = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    head.cancel()
+    await asyncio.wait_for(follower, timeout=1.0)
+    assert head.cancelled()
+    assert not limiter._waiters
+
+
+def test_sync_acquire_records_wait_histogram():
+    bucket = TokenBucketLimiter(6000, burst=1, name="hist-test")
+    bucket.acquire()
+    bucket.acquire()
+    sample = REGISTRY.get_sample_value(
+        "rate_limit_wait_seconds_count", {"limiter": "hist-test", "mode": "sync"}
+    )
+    assert sample == 2.0
+
+
+def test_rate_limiter_backends_must_implement_try_acquire():
+    class Incomplete(RateLimiter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_adaptive_concurrency_shrinks_on_overload_and_grows_on_success():
+    limiter = AdaptiveConcurrencyLimiter("aimd", initial=8, max_limit=10)
+    assert limiter.try_acquire()
+    limiter.release("overload")
+    assert limiter.limit == 4.0
+    for _ in range(4):
+        assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    for _ in range(4):
+        limiter.release("success")
+    assert 4.0 < limiter.limit <= 5.0
+    limiter.release("error")
+    assert limiter.in_flight == 0
+    assert limiter.stats()["decreases"] == 1
+
+
+def test_call_with_retries_feeds_status_codes_to_concurrency():
+    limiter = AdaptiveConcurrencyLimiter("firecrawl-test", initial=4)
+    attempts = {"count": 0}
+
+    def flaky():
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise _status_error(503)
+        return "ok"
+
+    value = call_with_retries(
+        flaky,
+        policy=RetryPolicy(max_retries=1, base_delay=0.01, max_delay=0.01, jitter=0.0),
+        concurrency=limiter,
+    )
+    assert value == "ok"
+    assert limiter.stats() == {"limit": 2.5, "in_flight": 0, "increases": 1, "decreases": 1}
+
+
+def test_retry_budget_refuses_retries_beyond_ratio():
+    budget = RetryBudget(0.5, min_retries=1)
+    calls = {"count": 0}
+
+    def always_busy():
+        calls["count"] += 1
+        raise _status_error(429)
+
+    policy = RetryPolicy(max_retries=5, base_delay=0.01, max_delay=0.01, jitter=0.0, budget=budget)
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retries(always_busy, policy=policy)
+    # One request allows retries while fewer than 1 + 0.5 are spent: two pass, the third is refused.
+    assert calls["count"] == 3
+    assert budget.stats()["exhausted"] == 1
+
+
+def test_retry_after_header_overrides_backoff_and_caps_waits():
+    assert retry_after_seconds(_status_error(429, {"Retry-After": "2"})) == 2.0
+    assert retry_after_seconds(_status_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after_seconds(RuntimeError("429")) is None
+
+    attempts = {"count": 0}
+
+    def throttled():
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise _status_error(429, {"Retry-After": "0.05"})
+        return "ok"
+
+    started = time.perf_counter()
+    value = call_with_retries(
+        throttled,
+        policy=RetryPolicy(max_retries=1, base_delay=5.0, max_delay=5.0, jitter=0.0),
+    )
+    assert value == "ok"
+    assert 0.04 <= time.perf_counter() - started < 1.0
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retries(
+            lambda: (_ for _ in ()).throw(_status_error(503, {"Retry-After": "120"})),
+            policy=RetryPolicy(max_retries=3, max_retry_after=30.0),
+        )
+
+
+def test_client_errors_are_not_retried():
+    calls = {"count": 0}
+
+    def forbidden():
+        calls["count"] += 1
+        raise _status_error(403)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retries(forbidden, policy=RetryPolicy(max_retries=3, base_delay=0.01))
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_retries_share_adaptive_concurrency():
+    limiter = AdaptiveConcurrencyLimiter("async-aimd", initial=1, max_limit=1)
+    peak = {"now": 0, "max": 0}
+
+    async def work():
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(0.01)
+        peak["now"] -= 1
+        return "ok"
+
+    results = await asyncio.gather(
+        *(acall_with_retries(work, concurrency=limiter) for _ in range(4))
+    )
+    assert results == ["ok"] * 4
+    assert peak["max"] == 1
+    assert limiter.in_flight == 0
+
+
+def test_circuit_breaker_half_open_admits_single_probe():
+    breaker = CircuitBreaker(threshold=2, recovery_seconds=0.05, name="web:probe_test")
+    breaker.failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.success()
+    assert breaker.state == "closed" and breaker.allow()
+    opened = REGISTRY.get_sample_value(
+        "circuit_breaker_transitions_total",
+        {"breaker": "web:probe_test", "from_state": "half_open", "to_state": "open"},
+    )
+    assert opened == 1.0
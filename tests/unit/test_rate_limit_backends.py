@@ -0,0 +1,99 @@
+import logging
+
+import fakeredis
+import pytest
+
+from core.config import load_config
+from core.rate_limit import TokenBucketLimiter, token_bucket_take
+from core.rate_limit_backends import (
+    RedisTokenBucketLimiter,
+    SQLiteTokenBucketLimiter,
+    build_rate_limiter,
+)
+
+
+def test_token_bucket_take_refills_and_reports_wait():
+    assert token_bucket_take(0.0, 30.0, capacity=2, refill_per_second=0.1) == (1.0, 0.0)
+    tokens, wait = token_bucket_take(0.5, 0.0, capacity=2, refill_per_second=0.5)
+    assert tokens == 0.5
+    assert wait == pytest.approx(1.0)
+
+
+def test_sqlite_bucket_is_shared_between_limiter_instances(tmp_path):
+    path = tmp_path / "limits.sqlite3"
+    first = SQLiteTokenBucketLimiter(path, "tavily", rpm=2)
+    second = SQLiteTokenBucketLimiter(path, "tavily", rpm=2)
+    other = SQLiteTokenBucketLimiter(path, "ddg", rpm=2)
+
+    assert first.try_acquire() == 0.0
+    assert second.try_acquire() == 0.0
+    # The bucket (capacity 2) is drained regardless of which instance asked.
+    assert first.try_acquire() > 0.0
+    assert second.try_acquire() > 0.0
+    assert other.try_acquire() == 0.0
+    for limiter in (first, second, other):
+        limiter.close()
+
+
+def test_redis_bucket_is_shared_across_clients():
+    server = fakeredis.FakeServer()
+    first = RedisTokenBucketLimiter(fakeredis.FakeRedis(server=server), "tavily", rpm=2)
+    second = RedisTokenBucketLimiter(fakeredis.FakeRedis(server=server), "tavily", rpm=2)
+
+    assert first.try_acquire() == 0.0
+    assert second.try_acquire() == 0.0
+    wait = first.try_acquire()
+    assert 0.0 < wait <= 30.0
+    assert fakeredis.FakeRedis(server=server).pttl("ratelimit:tavily") > 0
+
+
+def test_redis_bucket_degrades_to_local_bucket_when_unreachable():
+    server = fakeredis.FakeServer()
+    limiter = RedisTokenBucketLimiter(fakeredis.FakeRedis(server=server), "ddg", rpm=1)
+    server.connected = False
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() > 0.0
+
+
+def test_redis_outage_uses_local_bucket_for_cooldown_and_logs_once(caplog):
+    server = fakeredis.FakeServer()
+    limiter = RedisTokenBucketLimiter(
+        fakeredis.FakeRedis(server=server), "tavily", rpm=60, failure_cooldown_seconds=30.0
+    )
+    script = limiter._script
+    calls = {"count": 0}
+
+    def counting_script(*args, **kwargs):
+        calls["count"] += 1
+        return script(*args, **kwargs)
+
+    limiter._script = counting_script
+    server.connected = False
+    with caplog.at_level(logging.WARNING, logger="core.rate_limit_backends"):
+        for _ in range(5):
+            assert limiter.try_acquire() == 0.0
+    assert calls["count"] == 1
+    assert len(caplog.records) == 1
+
+    server.connected = True
+    limiter._retry_at = 0.0  # cool-down elapsed
+    assert limiter.try_acquire() == 0.0
+    assert calls["count"] == 2
+    assert not limiter._degraded
+
+
+def test_build_rate_limiter_selects_backend_from_config(tmp_path):
+    memory = build_rate_limiter(load_config({"data_dir": str(tmp_path)}), "tavily", 5)
+    assert isinstance(memory, TokenBucketLimiter)
+
+    sqlite = build_rate_limiter(
+        load_config({"data_dir": str(tmp_path), "rate_limit_backend": "sqlite"}), "tavily", 5
+    )
+    assert isinstance(sqlite, SQLiteTokenBucketLimiter)
+    assert sqlite.path == tmp_path / "rate_limits.sqlite3"
+
+    redis_limiter = build_rate_limiter(
+        load_config({"data_dir": str(tmp_path), "rate_limit_backend": "redis"}), "tavily", 5
+    )
+    assert isinstance(redis_limiter, RedisTokenBucketLimiter)
+    assert redis_limiter.key == "cloudhive:ratelimit:tavily"
@@ -0,0 +1,99 @@
+import time
+
+from core.config import load_config
+from core.models import RetrievedDoc
+from mcp_server.search_cache import SearchResultCache, cache_key
+from mcp_server.web_server import WebMCPServer
+
+
+def _doc(idx: int, provider: str = "tavily") -> RetrievedDoc:
+    return RetrievedDoc(
+        provider=provider,  # type: ignore[arg-type]
+        title=f"Doc {idx}",
+        url=f"https://example.org/{idx}",
+        snippet="snippet",
+        content="content",
+    )
+
+
+def test_cache_key_normalizes_query_whitespace_and_case():
+    assert cache_key("tavily", "  LangGraph   Retry ", 5) == cache_key("tavily", "langgraph retry", 5)
+    assert cache_key("tavily", "langgraph retry", 5) != cache_key("ddg", "langgraph retry", 5)
+    assert cache_key("tavily", "langgraph retry", 5) != cache_key("tavily", "langgraph retry", 8)
+    assert cache_key("ddg", "q", 5, "depth=deep") != cache_key("ddg", "q", 5, "depth=fast")
+
+
+def test_cache_round_trip_ttl_and_lru_eviction(tmp_path):
+    cache = SearchResultCache(
+        tmp_path / "cache.sqlite3",
+        ttl_seconds={"tavily": 60, "ddg": 0},
+        max_entries=2,
+    )
+    cache.put("tavily", "q1", 5, [_doc(1)])
+    assert [d.title for d in cache.get("tavily", "Q1", 5) or []] == ["Doc 1"]
+
+    cache.put("ddg", "q1", 5, [_doc(1, "ddg")])
+    assert cache.get("ddg", "q1", 5) is None
+
+    time.sleep(0.01)
+    cache.put("tavily", "q2", 5, [_doc(2)])
+    time.sleep(0.01)
+    cache.get("tavily", "q1", 5)
+    time.sleep(0.01)
+    cache.put("tavily", "q3", 5, [_doc(3)])
+    assert cache.get("tavily", "q2", 5) is None
+    assert cache.get("tavily", "q1", 5) is not None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] >= 2
+
+    cache.ttl_seconds["tavily"] = 1
+    cache.put("tavily", "q4", 5, [_doc(4)])
+    time.sleep(1.1)
+    assert cache.get("tavily", "q4", 5) is None
+
+
+def test_cache_never_stores_fallback_docs(tmp_path):
+    cache = SearchResultCache(tmp_path / "cache.sqlite3", ttl_seconds={"tavily": 60})
+    cache.put("tavily", "q", 5, WebMCPServer._fallback_docs("tavily", "q"))
+    assert cache.get("tavily", "q", 5) is None
+
+
+def test_cache_hit_skips_rate_limiter(tmp_path):
+    cfg = load_config({"interactive_hitl": False, "data_dir": str(tmp_path)})
+    server = WebMCPServer(cfg)
+    calls = {"impl": 0, "acquire": 0}
+
+    def impl(query: str, k: int):
+        calls["impl"] += 1
+        return [_doc(1)]
+
+    server._tavily_search_impl = impl  # type: ignore[method-assign]
+    server.tavily_limiter.acquire = lambda: calls.__setitem__("acquire", calls["acquire"] + 1)  # type: ignore[method-assign]
+
+    first = server.tavily_search("cache me", 5)
+    second = server.tavily_search("Cache   me", 5)
+    assert [d.url for d in first] == [d.url for d in second]
+    assert calls == {"impl": 1, "acquire": 1}
+
+    server.search_cache.bypass = True
+    server.tavily_search("cache me", 5)
+    assert calls == {"impl": 2, "acquire": 2}
+
+
+def test_cache_entries_are_scoped_to_depth_and_ddg_mode(tmp_path):
+    def server_for(**overrides) -> WebMCPServer:
+        cfg = load_config({"interactive_hitl": False, "data_dir": str(tmp_path), **overrides})
+        server = WebMCPServer(cfg)
+        server._ddg_search_impl = lambda query, k: [_doc(len(calls), "ddg")]  # type: ignore[method-assign]
+        server.ddg_limiter.acquire = lambda: calls.append(1)  # type: ignore[method-assign]
+        return server
+
+    calls: list[int] = []
+    server_for(research_depth="fast").ddg_search("scoped query", 5)
+    server_for(research_depth="fast").ddg_search("scoped query", 5)
+    assert len(calls) == 1
+    server_for(research_depth="deep").ddg_search("scoped query", 5)
+    server_for(research_depth="fast", ddg_text_enabled=False).ddg_search("scoped query", 5)
+    assert len(calls) == 3
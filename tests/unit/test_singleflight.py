@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.config import load_config
+from core.models import RetrievedDoc
+from core.singleflight import AsyncSingleFlight, SingleFlight
+from mcp_server.client import MultiServerClient
+from mcp_server.web_server import WebMCPServer
+
+
+def _doc(url: str) -> RetrievedDoc:
+    return RetrievedDoc(provider="tavily", title="Doc", url=url, snippet="s", content="c")
+
+
+def test_singleflight_shares_one_execution_across_threads():
+    flight = SingleFlight("test")
+    calls = {"count": 0}
+    release = threading.Event()
+    results: list[tuple[str, bool]] = []
+
+    def slow() -> str:
+        calls["count"] += 1
+        release.wait(timeout=2)
+        return "value"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow, label="t")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls["count"] == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert flight.coalesced == 3
+
+    # Completed calls are forgotten; the next caller runs again.
+    assert flight.do("k", lambda: "fresh") == ("fresh", False)
+
+
+def test_singleflight_propagates_leader_error_to_waiters():
+    flight = SingleFlight("test")
+    started = threading.Event()
+    errors: list[str] = []
+
+    def failing() -> None:
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("upstream down")
+
+    def call() -> None:
+        try:
+            flight.do("k", failing)
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(timeout=1)
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+    assert errors == ["upstream down", "upstream down"]
+
+
+@pytest.mark.asyncio
+async def test_async_singleflight_survives_leader_cancellation():
+    flight = AsyncSingleFlight("test")
+    calls = {"count": 0}
+
+    async def slow() -> str:
+        calls["count"] += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    leader = asyncio.create_task(flight.do("k", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == ("value", True)
+    assert calls["count"] == 1
+
+
+def test_client_coalesces_identical_concurrent_web_calls(tmp_path):
+    cfg = load_config(
+        {"interactive_hitl": False, "mcp_mode": "inprocess", "data_dir": str(tmp_path)}
+    )
+    client = MultiServerClient.from_config(cfg)
+    calls = {"count": 0}
+
+    def tavily_search(query: str, k: int = 5) -> list[RetrievedDoc]:
+        calls["count"] += 1
+        time.sleep(0.2)
+        return [_doc("https://example.org/a")]
+
+    client.web_server.tavily_search = tavily_search  # type: ignore[method-assign]
+    results: list[list[RetrievedDoc]] = []
+    queries = ["langgraph send", "LangGraph  Send", "langgraph send"]
+    threads = [
+        threading.Thread(target=lambda q=q: results.append(client.call_web_tool("tavily_search", q, 5)))
+        for q in queries
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls["count"] == 1
+    assert len(results) == 3
+    assert len({id(docs) for docs in results}) == 3
+    assert client.web_flight.coalesced == 2
+
+    client.call_web_tool("tavily_search", "langgraph send", 8)
+    assert calls["count"] == 2
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_web_server_async_search_coalesces_in_flight_queries(tmp_path):
+    cfg = load_config({"interactive_hitl": False, "data_dir": str(tmp_path)})
+    server = WebMCPServer(cfg)
+    calls = {"count": 0}
+
+    async def impl(query: str, k: int) -> list[RetrievedDoc]:
+        calls["count"] += 1
+        await asyncio.sleep(0.05)
+        return [_doc("https://example.org/a")]
+
+    server._atavily_search_impl = impl  # type: ignore[method-assign]
+    results = await asyncio.gather(*(server.atavily_search("same query", 5) for _ in range(3)))
+    assert calls["count"] == 1
+    assert all(docs[0].url == "https://example.org/a" for docs in results)
+    assert server.health()["singleflight"]["coalesced"] == 2
+    await server.aclose()
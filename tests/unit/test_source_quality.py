@@ -1,6 +1,9 @@
+from core.domain_index import DomainClassifier
 from core.models import RetrievedDoc
 from core.source_quality import (
+    _quality_cache,
     clean_evidence_text,
+    doc_quality,
     prioritize_docs,
     source_tier,
 )
@@ -59,3 +62,23 @@ def test_prioritize_docs_deprioritizes_social_sources():
         min_tier_ab_sources=1,
     )
     assert "arxiv.org" in prioritized[0].url
+
+
+def test_doc_quality_memo_is_keyed_per_rule_set_without_holding_text():
+    text = "Quarterly survey results with methodology and sample sizes. " * 40
+    tenant = DomainClassifier()
+    tenant.add("example.org", "tier_a")
+    default_quality = doc_quality("https://example.org/report", "tavily", "Report", text)
+    tenant_quality = doc_quality(
+        "https://example.org/report", "tavily", "Report", text, classifier=tenant
+    )
+    assert tenant_quality[0] == "A"
+    assert default_quality[0] != "A"
+
+    tenant.add("example.org", "deny")
+    assert doc_quality(
+        "https://example.org/report", "tavily", "Report", text, classifier=tenant
+    )[4] is True
+    for key in _quality_cache:
+        assert text not in key
+        assert not any(isinstance(part, DomainClassifier) for part in key)
@@ -1,4 +1,6 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from core.config import load_config
 from mcp_server.transport_runtime import TransportRuntime
@@ -24,3 +26,32 @@ def test_transport_runtime_start_and_probe():
         assert "read_local_file" in probe.local_tools
     finally:
         runtime.close()
+
+
+def test_transport_session_multiplexes_concurrent_calls():
+    python = sys.executable
+    cfg = load_config(
+        {
+            "interactive_hitl": False,
+            "judge_provider": "stub",
+            "mcp_web_server_cmd": f"{python} -m mcp_server.web_stdio_app",
+            "mcp_local_server_cmd": f"{python} -m mcp_server.local_stdio_app",
+        }
+    )
+    paths = ["pyproject.toml", "core/rate_limit.py", "core/pruning.py", "mcp_server/client.py"] * 8
+    expected = {path: Path(path).read_text(encoding="utf-8") for path in paths}
+    runtime = TransportRuntime(cfg)
+    try:
+        runtime.start()
+        # Calls from fan-out workers share one session without a client-side lock;
+        # every response must still reach the request that asked for it.
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            results = list(
+                pool.map(
+                    lambda path: runtime.call_local_tool("read_local_file", {"path": path}),
+                    paths,
+                )
+            )
+        assert results == [expected[path] for path in paths]
+    finally:
+        runtime.close()
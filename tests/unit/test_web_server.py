@@ -0,0 +1,221 @@
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from core.config import load_config
+from core.rate_limit import RetryBudget, RetryPolicy
+from mcp_server.client import MultiServerClient
+from mcp_server.web_server import WebMCPServer
+
+
+def _server(tmp_path, **overrides) -> WebMCPServer:
+    cfg = load_config({"interactive_hitl": False, "data_dir": str(tmp_path), **overrides})
+    return WebMCPServer(cfg)
+
+
+def test_http_client_is_pooled_and_reopened_after_close(tmp_path):
+    server = _server(tmp_path, http_pool_max_connections=7, http_pool_max_keepalive=3)
+    first = server._http_client()
+    assert server._http_client() is first
+    pool = first._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+
+    server.close()
+    assert first.is_closed
+    second = server._http_client()
+    assert second is not first and not second.is_closed
+    server.close()
+
+
+def test_firecrawl_extract_reuses_pooled_client(tmp_path):
+    server = _server(tmp_path, firecrawl_api_key="test-key")
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            requests.append(str(request.url))
+        return httpx.Response(
+            200,
+            json={"data": {"markdown": "# Title\nBody text", "metadata": {"title": "T"}}},
+        )
+
+    server._http = httpx.Client(transport=httpx.MockTransport(handler))
+    client = server._http
+    server.firecrawl_extract("https://example.org/a")
+    server.firecrawl_extract("https://example.org/b")
+    assert len(requests) == 2
+    assert server._http is client
+    server.close()
+
+
+def test_multi_server_client_close_shuts_down_web_server_pools(tmp_path):
+    cfg = load_config(
+        {"interactive_hitl": False, "mcp_mode": "inprocess", "data_dir": str(tmp_path)}
+    )
+    client = MultiServerClient.from_config(cfg)
+    http = client.web_server._http_client()
+    client.close()
+    assert http.is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_firecrawl_calls_overlap_on_shared_client(tmp_path):
+    server = _server(tmp_path, firecrawl_api_key="test-key")
+    in_flight = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.05)
+        in_flight["now"] -= 1
+        return httpx.Response(
+            200,
+            json={"data": {"markdown": "# Title\nBody text", "metadata": {"title": "T"}}},
+        )
+
+    server._async_http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    results = await asyncio.gather(
+        *(server.afirecrawl_extract(f"https://example.org/{idx}") for idx in range(4))
+    )
+    assert [docs[0].url for docs in results] == [f"https://example.org/{idx}" for idx in range(4)]
+    assert in_flight["peak"] > 1
+    await server.aclose()
+    assert server._async_http is None
+
+
+@pytest.mark.asyncio
+async def test_async_ddg_instant_answer_matches_sync_parsing(tmp_path):
+    server = _server(tmp_path, ddg_text_enabled=False, ddg_fallback_mode="instant_only")
+    payload = {
+        "Heading": "LangGraph",
+        "AbstractText": "LangGraph is a library for stateful agents.",
+        "AbstractURL": "https://example.org/langgraph/",
+        "RelatedTopics": [{"Text": "Send API fan-out", "FirstURL": "https://example.org/send"}],
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    server._http = httpx.Client(transport=transport)
+    server._async_http = httpx.AsyncClient(transport=transport)
+    server.search_cache.bypass = True
+
+    sync_docs = server.ddg_search("langgraph", 5)
+    async_docs = await server.addg_search("langgraph", 5)
+    def strip(docs):
+        return [d.model_dump(exclude={"retrieved_at"}) for d in docs]
+
+    assert strip(async_docs) == strip(sync_docs)
+    assert [d.url for d in async_docs] == [
+        "https://example.org/langgraph",
+        "https://example.org/send",
+    ]
+    await server.aclose()
+
+
+def test_firecrawl_extract_cache_revalidates_with_etag(tmp_path):
+    server = _server(tmp_path, firecrawl_api_key="test-key")
+    origin = {"etag": '"v1"'}
+    seen: list[str] = []
+    acquired: list[int] = []
+    server.firecrawl_limiter.acquire = lambda: acquired.append(1)  # type: ignore[method-assign]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            seen.append("HEAD")
+            if request.headers.get("if-none-match") == origin["etag"]:
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": origin["etag"]})
+        seen.append("POST")
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "markdown": f"body {origin['etag']}",
+                    "metadata": {"title": "T", "etag": origin["etag"]},
+                }
+            },
+        )
+
+    server._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def expire() -> None:
+        with server.extract_cache._lock:
+            conn = server.extract_cache._connection()
+            conn.execute("UPDATE extract_cache SET fetched_at = 0")
+            conn.commit()
+
+    # A cold miss goes straight to Firecrawl; its reported ETag is kept for later.
+    first = server.firecrawl_extract("https://example.org/page")
+    assert first[0].meta["extract_cache"] == "miss"
+    assert seen == ["POST"]
+    assert server.extract_cache.get("https://example.org/page", "extract").etag == '"v1"'
+
+    assert server.firecrawl_extract("https://example.org/page")[0].meta["extract_cache"] == "hit"
+    assert seen == ["POST"]
+    assert len(acquired) == 1
+
+    expire()
+    revalidated = server.firecrawl_extract("https://example.org/page")
+    assert revalidated[0].meta["extract_cache"] == "revalidated"
+    assert revalidated[0].content == first[0].content
+    assert seen == ["POST", "HEAD"]
+
+    expire()
+    origin["etag"] = '"v2"'
+    changed = server.firecrawl_extract("https://example.org/page")
+    assert changed[0].meta["extract_cache"] == "miss"
+    assert changed[0].content == 'body "v2"'
+    assert seen == ["POST", "HEAD", "HEAD", "POST"]
+    assert server.extract_cache.get("https://example.org/page", "extract").etag == '"v2"'
+    server.close()
+
+
+def test_tavily_overload_reaches_retry_and_concurrency_before_fallback(tmp_path):
+    server = _server(tmp_path, tavily_api_key="test-key", search_cache_bypass=True)
+    server.retry_policy = RetryPolicy(max_retries=1, base_delay=0.0, jitter=0.0, budget=RetryBudget())
+    concurrency = server.tavily_concurrency
+    assert concurrency is not None
+    starting_limit = concurrency.limit
+    calls = {"count": 0}
+
+    class OverloadedTavily:
+        def search(self, **_: object) -> dict:
+            calls["count"] += 1
+            request = httpx.Request("POST", "https://api.tavily.com/search")
+            response = httpx.Response(429, request=request)
+            raise httpx.HTTPStatusError("429 Too Many Requests", request=request, response=response)
+
+    server._tavily = lambda: OverloadedTavily()  # type: ignore[method-assign]
+    labels = {"name": concurrency.name, "outcome": "retried"}
+    retried_before = REGISTRY.get_sample_value("retry_total", labels) or 0.0
+
+    docs = server.tavily_search("rate limited query", k=3)
+
+    assert calls["count"] == 2
+    assert REGISTRY.get_sample_value("retry_total", labels) == retried_before + 1
+    assert concurrency.limit < starting_limit
+    assert docs[0].provider == "fallback"
+    assert docs[0].meta["fallback_provider"] == "tavily"
+    server.close()
+
+
+def test_non_transient_search_errors_reach_the_caller(tmp_path):
+    server = _server(tmp_path, ddg_text_enabled=False, ddg_fallback_mode="instant_only")
+    server._http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+    server.search_cache.bypass = True
+    with pytest.raises(httpx.HTTPStatusError):
+        server.ddg_search("missing", 5)
+    server.close()
+
+
+def test_retry_budget_belongs_to_each_server(tmp_path):
+    strict = _server(tmp_path, retry_budget_ratio=0.0, retry_budget_min_retries=0)
+    lenient = _server(tmp_path, retry_budget_ratio=0.5, retry_budget_min_retries=5)
+    assert strict.retry_policy.budget is strict.retry_budget
+    assert strict.retry_budget is not lenient.retry_budget
+    assert not strict.retry_budget.try_spend()
+    assert lenient.retry_budget.try_spend()
+    assert strict.health()["retry_budget"]["ratio"] == 0.0
+    strict.close()
+    lenient.close()